@@ -5,7 +5,7 @@ from lib.ssmodel_droopSimplified_infinite import ssmodel_droopSimplified_infinit
 from plott import plott
 from Testing.toCSV import flatten_column_major
 
-def main_droopSimplified_infinite(user_params=None):
+def main_droopSimplified_infinite(user_params=None, stabilityOnly=False, warmStart=None):
     # Parameters
     wbase = 2 * np.pi * 60
     parasIBR = {
@@ -23,12 +23,12 @@ def main_droopSimplified_infinite(user_params=None):
                 parasIBR[key] = user_params[key]
 
     # Column Names
-    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "modalAnalysis", "pfExitFlag"]]
+    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "eigenvalueAnalysisResults", "pfExitFlag"]]
 
     # Run the simulation for a single set of parameters
     dominantParticipationFactorBoundary = 0.01
     Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag = (
-        ssmodel_droopSimplified_infinite(wbase, parasIBR, dominantParticipationFactorBoundary)
+        ssmodel_droopSimplified_infinite(wbase, parasIBR, dominantParticipationFactorBoundary, warmStart=warmStart, stabilityOnly=stabilityOnly)
     )
 
     # Store the results: (to match MATLAB)
@@ -37,7 +37,7 @@ def main_droopSimplified_infinite(user_params=None):
         eigenvalueAnalysisResults['eigs'],
         eigenvalueAnalysisResults['maxRealValue'],
         eigenvalueAnalysisResults['minDampingRatio'],
-        eigenvalueAnalysisResults['modalAnalysis'],
+        eigenvalueAnalysisResults,
         pfExitFlag
     ])
 
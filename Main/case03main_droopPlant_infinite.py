@@ -5,7 +5,7 @@ from lib.ssmodel_droopPlant_infinite import ssmodel_droopPlant_infinite
 from plott import plott
 from Testing.toCSV import flatten_column_major
 
-def main_droopPlant_infinite(user_params=None):
+def main_droopPlant_infinite(user_params=None, stabilityOnly=False, warmStart=None):
     # Define parameters exactly as in the MATLAB script:
     wbase = 2 * np.pi * 60
     parasIBR = {
@@ -31,11 +31,11 @@ def main_droopPlant_infinite(user_params=None):
     if user_params:
         parasIBR.update(user_params)
 
-    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "modalAnalysis", "pfExitFlag"]]
+    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "eigenvalueAnalysisResults", "pfExitFlag"]]
 
     dominantParticipationFactorBoundary = 0.01
     Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag = ssmodel_droopPlant_infinite(
-        wbase, parasIBR, dominantParticipationFactorBoundary
+        wbase, parasIBR, dominantParticipationFactorBoundary, warmStart=warmStart, stabilityOnly=stabilityOnly
     )
 
     # Store results in a structure similar to MATLAB's output
@@ -44,7 +44,7 @@ def main_droopPlant_infinite(user_params=None):
         eigenvalueAnalysisResults['eigs'],
         eigenvalueAnalysisResults['maxRealValue'],
         eigenvalueAnalysisResults['minDampingRatio'],
-        eigenvalueAnalysisResults['modalAnalysis'],
+        eigenvalueAnalysisResults,
         pfExitFlag
     ])
 
@@ -6,7 +6,7 @@ from lib.ssmodel_gfl_infinite import ssmodel_gfl_infinite
 from plott import plott
 from Testing.toCSV import flatten_column_major
 
-def main_gfl_infinite(user_params=None):
+def main_gfl_infinite(user_params=None, stabilityOnly=False, warmStart=None):
     # Parameters
     wbase = 2 * np.pi * 60
     parasIBR = {
@@ -30,12 +30,12 @@ def main_gfl_infinite(user_params=None):
                 parasIBR[key] = user_params[key]
 
     # Column Names
-    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "modalAnalysis", "pfExitFlag"]]
+    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "eigenvalueAnalysisResults", "pfExitFlag"]]
 
     # Run the simulation for a single set of parameters
     dominantParticipationFactorBoundary = 0.01
     Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag = (
-        ssmodel_gfl_infinite(wbase, parasIBR, dominantParticipationFactorBoundary)
+        ssmodel_gfl_infinite(wbase, parasIBR, dominantParticipationFactorBoundary, warmStart=warmStart, stabilityOnly=stabilityOnly)
     )
 
     # Store the results
@@ -44,7 +44,7 @@ def main_gfl_infinite(user_params=None):
         eigenvalueAnalysisResults['eigs'],
         eigenvalueAnalysisResults['maxRealValue'],
         eigenvalueAnalysisResults['minDampingRatio'],
-        eigenvalueAnalysisResults['modalAnalysis'],
+        eigenvalueAnalysisResults,
         pfExitFlag
     ])
 
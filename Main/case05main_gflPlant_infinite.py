@@ -7,7 +7,7 @@ from plott import plott
 from Testing.toCSV import flatten_column_major
 
 
-def main_gflPlant_infinite(user_params=None):
+def main_gflPlant_infinite(user_params=None, stabilityOnly=False, warmStart=None):
     # Parameters
     wbase = 2 * np.pi * 60
     parasIBR = {
@@ -38,12 +38,12 @@ def main_gflPlant_infinite(user_params=None):
             if key in user_params:
                 parasIBR[key] = user_params[key]
 
-    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "modalAnalysis", "pfExitFlag"]]
+    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "eigenvalueAnalysisResults", "pfExitFlag"]]
 
     # Run the simulation for a single set of parameters
     dominantParticipationFactorBoundary = 0.01
     Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag = (
-        ssmodel_gflPlant_infinite(wbase, parasIBR, dominantParticipationFactorBoundary)
+        ssmodel_gflPlant_infinite(wbase, parasIBR, dominantParticipationFactorBoundary, warmStart=warmStart, stabilityOnly=stabilityOnly)
     )
 
     # Store the results
@@ -52,7 +52,7 @@ def main_gflPlant_infinite(user_params=None):
         eigenvalueAnalysisResults['eigs'],
         eigenvalueAnalysisResults['maxRealValue'],
         eigenvalueAnalysisResults['minDampingRatio'],
-        eigenvalueAnalysisResults['modalAnalysis'],
+        eigenvalueAnalysisResults,
         pfExitFlag
     ])
 
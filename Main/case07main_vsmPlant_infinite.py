@@ -6,7 +6,7 @@ from lib.ssmodel_vsmPlant_infinite import ssmodel_vsmPlant_infinite
 from plott import plott
 from Testing.toCSV import flatten_column_major
 
-def main_vsmPlant_infinite(user_params=None):
+def main_vsmPlant_infinite(user_params=None, stabilityOnly=False, warmStart=None):
     # Base angular frequency
     wbase = 2 * np.pi * 60
 
@@ -54,17 +54,17 @@ def main_vsmPlant_infinite(user_params=None):
     # Run the small-signal stability analysis
     dominantParticipationFactorBoundary = 0.01
     Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag = ssmodel_vsmPlant_infinite(
-        wbase, parasIBR, dominantParticipationFactorBoundary
+        wbase, parasIBR, dominantParticipationFactorBoundary, warmStart=warmStart, stabilityOnly=stabilityOnly
     )
 
     # Store results (header + one row of results)
-    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "modalAnalysis", "pfExitFlag"]]
+    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "eigenvalueAnalysisResults", "pfExitFlag"]]
     testResults.append([
         parasIBR,
         eigenvalueAnalysisResults['eigs'],
         eigenvalueAnalysisResults['maxRealValue'],
         eigenvalueAnalysisResults['minDampingRatio'],
-        eigenvalueAnalysisResults['modalAnalysis'],
+        eigenvalueAnalysisResults,
         pfExitFlag
     ])
 
@@ -5,7 +5,7 @@ from lib.ssmodel_vsm_vsm import ssmodel_vsm_vsm
 from plott import plott
 from Testing.toCSV import flatten_column_major
 
-def main_vsm_vsm(user_params=None):
+def main_vsm_vsm(user_params=None, stabilityOnly=False, warmStart=None):
     #parameters
     wbase = 2 * np.pi * 60
     parasIBR1 = {
@@ -57,12 +57,12 @@ def main_vsm_vsm(user_params=None):
                 parasLoad[key] = user_params[key]
 
     # Column Names
-    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "modalAnalysis", "pfExitFlag"]]
+    testResults = [["Parameter", "Eigenvalues", "maxRealValue", "minDampingRatio", "eigenvalueAnalysisResults", "pfExitFlag"]]
 
     # Run the simulation for a single set of parameters
     dominantParticipationFactorBoundary = 0.01
     Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag = (
-        ssmodel_vsm_vsm(wbase, parasIBR1, parasIBR2, parasLoad, dominantParticipationFactorBoundary)
+        ssmodel_vsm_vsm(wbase, parasIBR1, parasIBR2, parasLoad, dominantParticipationFactorBoundary, warmStart=warmStart, stabilityOnly=stabilityOnly)
     )
 
     # Store the results
@@ -71,7 +71,7 @@ def main_vsm_vsm(user_params=None):
         eigenvalueAnalysisResults['eigs'],
         eigenvalueAnalysisResults['maxRealValue'],
         eigenvalueAnalysisResults['minDampingRatio'],
-        eigenvalueAnalysisResults['modalAnalysis'],
+        eigenvalueAnalysisResults,
         pfExitFlag
     ])
 
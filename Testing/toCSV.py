@@ -23,6 +23,8 @@ def flatten_column_major(testResults):
         for row in range(num_rows):
             if col < len(testResults[row]):  # Add only if the current column exists in the row
                 current_item = testResults[row][col]
+                if hasattr(current_item, 'modalAnalysis'):
+                    current_item = current_item.modalAnalysis
 
                 # Special handling for 'modalAnalysis' or nested lists/arrays
                 if isinstance(current_item, (list, np.ndarray)):
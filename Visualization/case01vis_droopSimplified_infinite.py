@@ -56,7 +56,7 @@ def visualization(testResults):
     state_variables = [
         "Theta0", "Po0", "Qo0", "Iod0", "Ioq0"
     ]
-    mode_data_raw = testResults[1][4]
+    mode_data_raw = testResults[1][4].modalAnalysis
     modes = mode_data_raw[1:] if isinstance(mode_data_raw[0], list) and mode_data_raw[0][0] == 'Mode' else mode_data_raw
     mode_range = len(modes)
 
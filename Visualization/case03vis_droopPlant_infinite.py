@@ -80,7 +80,7 @@ def visualization(testResults):
         "thetaPlant", "epsilonPLLPlant", "wPlant", "epsilonP", "epsilonQ", "PoPlant", "QoPlant", "PsetDelay",
         "QsetDelay", "theta", "Po", "Qo", "phid", "phiq", "gammad", "gammaq", "iid", "iiq", "vcd", "vcq", "iod", "ioq"
     ]
-    mode_data_raw = testResults[1][4]
+    mode_data_raw = testResults[1][4].modalAnalysis
     modes = mode_data_raw[1:] if isinstance(mode_data_raw[0], list) and mode_data_raw[0][0] == 'Mode' else mode_data_raw
     mode_range = len(modes)
 
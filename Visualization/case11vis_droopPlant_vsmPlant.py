@@ -223,7 +223,7 @@ def visualization(testResults):
         'ilineD(Line2)', 'ilineQ(Line2)',
         'iloadD(Load)', 'iloadQ(Load)'
     ]
-    mode_data_raw = testResults[1][4]
+    mode_data_raw = testResults[1][4].modalAnalysis
     modes = mode_data_raw[1:] if isinstance(mode_data_raw[0], list) and mode_data_raw[0][0] == 'Mode' else mode_data_raw
     mode_range = len(modes)
 
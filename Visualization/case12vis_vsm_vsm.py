@@ -98,7 +98,7 @@ def visualization(testResults):
         "vcd(IBR2)", "vcq(IBR2)", "iod(IBR2)", "ioq(IBR2)",
         "IloadD(Load)", "IloadQ(Load)"
     ]
-    mode_data_raw = testResults[1][4]
+    mode_data_raw = testResults[1][4].modalAnalysis
     modes = mode_data_raw[1:] if isinstance(mode_data_raw[0], list) and mode_data_raw[0][0] == 'Mode' else mode_data_raw
     mode_range = len(modes)
     mode_index = get_mode_selection(mode_range)
@@ -249,7 +249,7 @@ def visualization(testResults):
         "iloadD(Load)", "iloadQ(Load)"
     ]
 
-    mode_data_raw = testResults[1][4]
+    mode_data_raw = testResults[1][4].modalAnalysis
     modes = mode_data_raw[1:] if isinstance(mode_data_raw[0], list) and mode_data_raw[0][0] == 'Mode' else mode_data_raw
     mode_range = len(modes)
 
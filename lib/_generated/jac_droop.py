@@ -0,0 +1,331 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_droop_symbolic() in lib/ssmodel_droop.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = '53e92562fac0bc818fd107bd26aa2dad7b4b147737e3af3ba961d9ca8c7f7227'
+PARAS = ('Pset', 'Qset', 'wset', 'Vset', 'Rt', 'Lt', 'Rd', 'Cf', 'Rc', 'Lc', 'mp', 'mq', 'KpV', 'KiV', 'KpC', 'KiC', 'wc')
+SHAPES = {'A': (13, 13), 'B': (13, 2), 'Bw': (13, 1), 'C': (2, 13), 'Cw': (13, 1)}
+
+def jac_droop(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpV = paras['KpV']
+    KiV = paras['KiV']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wc = paras['wc']
+    _t0 = mp*wbase
+    _t1 = -wc
+    _t2 = iod*wc
+    _t3 = Rd*_t2
+    _t4 = ioq*wc
+    _t5 = Rd*_t4
+    _t6 = Rd*iod
+    _t7 = Rd*(iid - iod) + vcd
+    _t8 = Rd*ioq
+    _t9 = Rd*(iiq - ioq) + vcq
+    _t10 = -Rd
+    _t11 = KpV*mq
+    _t12 = KpV*Rd
+    _t13 = -_t12 - 1
+    _t14 = -KpV
+    _t15 = wbase/Lt
+    _t16 = KpC*_t15
+    _t17 = KiV*_t16
+    _t18 = KiC*_t15
+    _t19 = _t15*(KpC*_t13 - Rd - Rt)
+    _t20 = -mp*(Po - Pset) + wset
+    _t21 = -Lt*_t20 + Lt*wset
+    _t22 = _t15*(-KpC*KpV - 1)
+    _t23 = _t15*(KpC*_t12 + Rd)
+    _t24 = wbase/Cf
+    _t25 = _t20*wbase
+    _t26 = -_t24
+    _t27 = -_t25
+    _t28 = numpy.sin(theta)
+    _t29 = numpy.cos(theta)
+    _t30 = wbase/Lc
+    _t31 = Rd*_t30
+    _t32 = _t30*(-Rc - Rd)
+    _t33 = -_t29*_t30
+    _t34 = _t28*_t30
+    A = numpy.zeros((13, 13))
+    B = numpy.zeros((13, 2))
+    Bw = numpy.zeros((13, 1))
+    C = numpy.zeros((2, 13))
+    Cw = numpy.zeros((13, 1))
+    A[0, 1] = -_t0
+    A[1, 1] = _t1
+    A[1, 7] = _t3
+    A[1, 8] = _t5
+    A[1, 9] = _t2
+    A[1, 10] = _t4
+    A[1, 11] = wc*(-_t6 + _t7)
+    A[1, 12] = wc*(-_t8 + _t9)
+    A[2, 2] = _t1
+    A[2, 7] = -_t5
+    A[2, 8] = _t3
+    A[2, 9] = -_t4
+    A[2, 10] = _t2
+    A[2, 11] = wc*(_t8 + _t9)
+    A[2, 12] = wc*(-_t6 - _t7)
+    A[3, 2] = -mq
+    A[3, 7] = _t10
+    A[3, 9] = -1
+    A[3, 11] = Rd
+    A[4, 8] = _t10
+    A[4, 10] = -1
+    A[4, 12] = Rd
+    A[5, 2] = -_t11
+    A[5, 3] = KiV
+    A[5, 7] = _t13
+    A[5, 9] = _t14
+    A[5, 11] = _t12
+    A[6, 4] = KiV
+    A[6, 8] = _t13
+    A[6, 10] = _t14
+    A[6, 12] = _t12
+    A[7, 1] = -_t0*iiq
+    A[7, 2] = -_t11*_t16
+    A[7, 3] = _t17
+    A[7, 5] = _t18
+    A[7, 7] = _t19
+    A[7, 8] = -_t15*_t21
+    A[7, 9] = _t22
+    A[7, 11] = _t23
+    A[8, 1] = _t0*iid
+    A[8, 4] = _t17
+    A[8, 6] = _t18
+    A[8, 7] = _t15*_t21
+    A[8, 8] = _t19
+    A[8, 10] = _t22
+    A[8, 12] = _t23
+    A[9, 1] = -_t0*vcq
+    A[9, 7] = _t24
+    A[9, 10] = _t25
+    A[9, 11] = _t26
+    A[10, 1] = _t0*vcd
+    A[10, 8] = _t24
+    A[10, 9] = _t27
+    A[10, 12] = _t26
+    A[11, 0] = _t30*(_t28*vbD - _t29*vbQ)
+    A[11, 1] = -_t0*ioq
+    A[11, 7] = _t31
+    A[11, 9] = _t30
+    A[11, 11] = _t32
+    A[11, 12] = _t25
+    A[12, 0] = _t30*(_t28*vbQ + _t29*vbD)
+    A[12, 1] = _t0*iod
+    A[12, 8] = _t31
+    A[12, 10] = _t30
+    A[12, 11] = _t27
+    A[12, 12] = _t32
+    B[11, 0] = _t33
+    B[11, 1] = -_t34
+    B[12, 0] = _t34
+    B[12, 1] = _t33
+    Bw[0, 0] = -wbase
+    C[0, 0] = -_t28*iod - _t29*ioq
+    C[0, 11] = _t29
+    C[0, 12] = -_t28
+    C[1, 0] = -_t28*ioq + _t29*iod
+    C[1, 11] = _t28
+    C[1, 12] = _t29
+    Cw[1, 0] = -mp
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_droop_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    Pset = numpy.asarray(paras['Pset'], dtype=float)
+    Qset = numpy.asarray(paras['Qset'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rt = numpy.asarray(paras['Rt'], dtype=float)
+    Lt = numpy.asarray(paras['Lt'], dtype=float)
+    Rd = numpy.asarray(paras['Rd'], dtype=float)
+    Cf = numpy.asarray(paras['Cf'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    KpV = numpy.asarray(paras['KpV'], dtype=float)
+    KiV = numpy.asarray(paras['KiV'], dtype=float)
+    KpC = numpy.asarray(paras['KpC'], dtype=float)
+    KiC = numpy.asarray(paras['KiC'], dtype=float)
+    wc = numpy.asarray(paras['wc'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(theta), numpy.shape(Po), numpy.shape(Qo), numpy.shape(phid), numpy.shape(phiq), numpy.shape(gammad), numpy.shape(gammaq), numpy.shape(iid), numpy.shape(iiq), numpy.shape(vcd), numpy.shape(vcq), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(Pset), numpy.shape(Qset), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rt), numpy.shape(Lt), numpy.shape(Rd), numpy.shape(Cf), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(KpV), numpy.shape(KiV), numpy.shape(KpC), numpy.shape(KiC), numpy.shape(wc))
+    _t0 = mp*wbase
+    _t1 = -wc
+    _t2 = iod*wc
+    _t3 = Rd*_t2
+    _t4 = ioq*wc
+    _t5 = Rd*_t4
+    _t6 = Rd*iod
+    _t7 = Rd*(iid - iod) + vcd
+    _t8 = Rd*ioq
+    _t9 = Rd*(iiq - ioq) + vcq
+    _t10 = -Rd
+    _t11 = KpV*mq
+    _t12 = KpV*Rd
+    _t13 = -_t12 - 1
+    _t14 = -KpV
+    _t15 = wbase/Lt
+    _t16 = KpC*_t15
+    _t17 = KiV*_t16
+    _t18 = KiC*_t15
+    _t19 = _t15*(KpC*_t13 - Rd - Rt)
+    _t20 = -mp*(Po - Pset) + wset
+    _t21 = -Lt*_t20 + Lt*wset
+    _t22 = _t15*(-KpC*KpV - 1)
+    _t23 = _t15*(KpC*_t12 + Rd)
+    _t24 = wbase/Cf
+    _t25 = _t20*wbase
+    _t26 = -_t24
+    _t27 = -_t25
+    _t28 = numpy.sin(theta)
+    _t29 = numpy.cos(theta)
+    _t30 = wbase/Lc
+    _t31 = Rd*_t30
+    _t32 = _t30*(-Rc - Rd)
+    _t33 = -_t29*_t30
+    _t34 = _t28*_t30
+    A = numpy.zeros(batch + (13, 13))
+    B = numpy.zeros(batch + (13, 2))
+    Bw = numpy.zeros(batch + (13, 1))
+    C = numpy.zeros(batch + (2, 13))
+    Cw = numpy.zeros(batch + (13, 1))
+    A[..., 0, 1] = -_t0
+    A[..., 1, 1] = _t1
+    A[..., 1, 7] = _t3
+    A[..., 1, 8] = _t5
+    A[..., 1, 9] = _t2
+    A[..., 1, 10] = _t4
+    A[..., 1, 11] = wc*(-_t6 + _t7)
+    A[..., 1, 12] = wc*(-_t8 + _t9)
+    A[..., 2, 2] = _t1
+    A[..., 2, 7] = -_t5
+    A[..., 2, 8] = _t3
+    A[..., 2, 9] = -_t4
+    A[..., 2, 10] = _t2
+    A[..., 2, 11] = wc*(_t8 + _t9)
+    A[..., 2, 12] = wc*(-_t6 - _t7)
+    A[..., 3, 2] = -mq
+    A[..., 3, 7] = _t10
+    A[..., 3, 9] = -1
+    A[..., 3, 11] = Rd
+    A[..., 4, 8] = _t10
+    A[..., 4, 10] = -1
+    A[..., 4, 12] = Rd
+    A[..., 5, 2] = -_t11
+    A[..., 5, 3] = KiV
+    A[..., 5, 7] = _t13
+    A[..., 5, 9] = _t14
+    A[..., 5, 11] = _t12
+    A[..., 6, 4] = KiV
+    A[..., 6, 8] = _t13
+    A[..., 6, 10] = _t14
+    A[..., 6, 12] = _t12
+    A[..., 7, 1] = -_t0*iiq
+    A[..., 7, 2] = -_t11*_t16
+    A[..., 7, 3] = _t17
+    A[..., 7, 5] = _t18
+    A[..., 7, 7] = _t19
+    A[..., 7, 8] = -_t15*_t21
+    A[..., 7, 9] = _t22
+    A[..., 7, 11] = _t23
+    A[..., 8, 1] = _t0*iid
+    A[..., 8, 4] = _t17
+    A[..., 8, 6] = _t18
+    A[..., 8, 7] = _t15*_t21
+    A[..., 8, 8] = _t19
+    A[..., 8, 10] = _t22
+    A[..., 8, 12] = _t23
+    A[..., 9, 1] = -_t0*vcq
+    A[..., 9, 7] = _t24
+    A[..., 9, 10] = _t25
+    A[..., 9, 11] = _t26
+    A[..., 10, 1] = _t0*vcd
+    A[..., 10, 8] = _t24
+    A[..., 10, 9] = _t27
+    A[..., 10, 12] = _t26
+    A[..., 11, 0] = _t30*(_t28*vbD - _t29*vbQ)
+    A[..., 11, 1] = -_t0*ioq
+    A[..., 11, 7] = _t31
+    A[..., 11, 9] = _t30
+    A[..., 11, 11] = _t32
+    A[..., 11, 12] = _t25
+    A[..., 12, 0] = _t30*(_t28*vbQ + _t29*vbD)
+    A[..., 12, 1] = _t0*iod
+    A[..., 12, 8] = _t31
+    A[..., 12, 10] = _t30
+    A[..., 12, 11] = _t27
+    A[..., 12, 12] = _t32
+    B[..., 11, 0] = _t33
+    B[..., 11, 1] = -_t34
+    B[..., 12, 0] = _t34
+    B[..., 12, 1] = _t33
+    Bw[..., 0, 0] = -wbase
+    C[..., 0, 0] = -_t28*iod - _t29*ioq
+    C[..., 0, 11] = _t29
+    C[..., 0, 12] = -_t28
+    C[..., 1, 0] = -_t28*ioq + _t29*iod
+    C[..., 1, 11] = _t28
+    C[..., 1, 12] = _t29
+    Cw[..., 1, 0] = -mp
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_droop(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpV = paras['KpV']
+    KiV = paras['KiV']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wc = paras['wc']
+    _t0 = mp*(Po - Pset) - wset
+    _t1 = iid - iod
+    _t2 = Rd*_t1 + vcd
+    _t3 = Rd*(iiq - ioq)
+    _t4 = _t3 + vcq
+    _t5 = Vset - _t2 - mq*(Qo - Qset)
+    _t6 = -_t4
+    _t7 = KiV*phid + KpV*_t5 - iid
+    _t8 = -iiq
+    _t9 = KiV*phiq + KpV*_t6 + _t8
+    _t10 = -_t0
+    _t11 = wbase/Lt
+    _t12 = Cf*_t10
+    _t13 = wbase/Cf
+    _t14 = numpy.cos(theta)
+    _t15 = numpy.sin(theta)
+    _t16 = Lc*_t10
+    _t17 = wbase/Lc
+    f = [wbase*(-_t0 - wcom), -Po*wc + wc*(_t2*iod + _t4*ioq), -Qo*wc + wc*(-_t2*ioq + _t4*iod), _t5, _t6, _t7, _t9, _t11*(KiC*gammad + KpC*_t7 + Lt*_t10*iiq - Lt*iiq*wset - Rt*iid - _t2), _t11*(KiC*gammaq + KpC*_t9 - Lt*_t10*iid + Lt*iid*wset - Rt*iiq - _t4), _t13*(_t1 + _t12*vcq), _t13*(-_t12*vcd - _t8 - ioq), _t17*(-Rc*iod - _t14*vbD - _t15*vbQ + _t16*ioq + _t2), _t17*(-Rc*ioq - _t14*vbQ + _t15*vbD - _t16*iod + _t3 + vcq)]
+    y = [_t14*iod - _t15*ioq, _t14*ioq + _t15*iod]
+    w = [_t10]
+    return {'f': f, 'y': y, 'w': w}
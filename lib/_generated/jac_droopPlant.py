@@ -0,0 +1,539 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_droopPlant_symbolic() in lib/ssmodel_droopPlant.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = 'ec7addb9d66f3ff070e2e420b70ae84dbf688f3e1f89bffdf8d6d2b7397bbdbf'
+PARAS = ('PsetPlant', 'QsetPlant', 'wsetPlant', 'VsetPlant', 'mpPlant', 'mqPlant', 'KpPLLplant', 'KiPLLplant', 'KpPlantP', 'KiPlantP', 'KpPlantQ', 'KiPlantQ', 'wcpllPlant', 'wcPlant', 'tDelay', 'wset', 'Vset', 'Rt', 'Lt', 'Rd', 'Cf', 'Rc', 'Lc', 'mp', 'mq', 'KpV', 'KiV', 'KpC', 'KiC', 'wc')
+SHAPES = {'A': (22, 22), 'B': (22, 2), 'Bw': (22, 1), 'C': (2, 22), 'Cw': (1, 22)}
+
+def jac_droopPlant(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    PsetPlant = paras['PsetPlant']
+    QsetPlant = paras['QsetPlant']
+    wsetPlant = paras['wsetPlant']
+    VsetPlant = paras['VsetPlant']
+    mpPlant = paras['mpPlant']
+    mqPlant = paras['mqPlant']
+    KpPLLplant = paras['KpPLLplant']
+    KiPLLplant = paras['KiPLLplant']
+    KpPlantP = paras['KpPlantP']
+    KiPlantP = paras['KiPlantP']
+    KpPlantQ = paras['KpPlantQ']
+    KiPlantQ = paras['KiPlantQ']
+    wcpllPlant = paras['wcpllPlant']
+    wcPlant = paras['wcPlant']
+    tDelay = paras['tDelay']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpV = paras['KpV']
+    KiV = paras['KiV']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wc = paras['wc']
+    _t0 = numpy.cos(thetaPlant)
+    _t1 = numpy.sin(thetaPlant)
+    _t2 = -_t0*vbD - _t1*vbQ
+    _t3 = KpPLLplant*_t2
+    _t4 = mpPlant**(-1.0)
+    _t5 = -wcPlant
+    _t6 = numpy.cos(theta)
+    _t7 = numpy.sin(theta)
+    _t8 = _t6*iod - _t7*ioq
+    _t9 = _t6*ioq + _t7*iod
+    _t10 = -_t9
+    _t11 = _t6*vbD + _t7*vbQ
+    _t12 = -_t6*vbQ + _t7*vbD
+    _t13 = -_t12*wcPlant
+    _t14 = tDelay**(-1.0)
+    _t15 = KpPlantP*_t14
+    _t16 = -_t14
+    _t17 = KpPlantQ*_t14
+    _t18 = mp*wbase
+    _t19 = -wc
+    _t20 = iod*wc
+    _t21 = Rd*_t20
+    _t22 = ioq*wc
+    _t23 = Rd*_t22
+    _t24 = Rd*iod
+    _t25 = Rd*(iid - iod) + vcd
+    _t26 = Rd*ioq
+    _t27 = Rd*(iiq - ioq) + vcq
+    _t28 = -Rd
+    _t29 = KpV*mq
+    _t30 = KpV*Rd
+    _t31 = -_t30 - 1
+    _t32 = -KpV
+    _t33 = _t18*iiq
+    _t34 = wbase/Lt
+    _t35 = KpC*_t34
+    _t36 = _t29*_t35
+    _t37 = KiV*_t35
+    _t38 = KiC*_t34
+    _t39 = _t34*(KpC*_t31 - Rd - Rt)
+    _t40 = -mp*(Po - PsetDelay) + wset
+    _t41 = -Lt*_t40 + Lt*wset
+    _t42 = _t34*(-KpC*KpV - 1)
+    _t43 = _t34*(KpC*_t30 + Rd)
+    _t44 = _t18*iid
+    _t45 = _t18*vcq
+    _t46 = wbase/Cf
+    _t47 = _t40*wbase
+    _t48 = -_t46
+    _t49 = _t18*vcd
+    _t50 = -_t47
+    _t51 = _t18*ioq
+    _t52 = wbase/Lc
+    _t53 = Rd*_t52
+    _t54 = _t52*(-Rc - Rd)
+    _t55 = _t18*iod
+    _t56 = KpPLLplant*wbase
+    _t57 = KpPLLplant*wcpllPlant
+    _t58 = 1/(mqPlant*numpy.sqrt(vbD**2 + vbQ**2))
+    _t59 = _t58*vbD
+    _t60 = _t58*vbQ
+    _t61 = _t8*wcPlant
+    _t62 = -_t52*_t6
+    _t63 = _t52*_t7
+    _t64 = -wbase
+    A = numpy.zeros((22, 22))
+    B = numpy.zeros((22, 2))
+    Bw = numpy.zeros((22, 1))
+    C = numpy.zeros((2, 22))
+    Cw = numpy.zeros((1, 22))
+    A[0, 0] = _t3*wbase
+    A[0, 1] = KiPLLplant*wbase
+    A[1, 0] = _t2
+    A[2, 0] = _t3*wcpllPlant
+    A[2, 1] = KiPLLplant*wcpllPlant
+    A[2, 2] = -wcpllPlant
+    A[3, 2] = -_t4
+    A[3, 5] = -1
+    A[4, 6] = -1
+    A[5, 5] = _t5
+    A[5, 9] = wcPlant*(_t10*vbD + _t8*vbQ)
+    A[5, 20] = _t11*wcPlant
+    A[5, 21] = _t13
+    A[6, 6] = _t5
+    A[6, 9] = wcPlant*(_t10*vbQ - _t8*vbD)
+    A[6, 20] = _t13
+    A[6, 21] = -_t11*wcPlant
+    A[7, 2] = -_t15*_t4
+    A[7, 3] = KiPlantP*_t14
+    A[7, 5] = -_t15
+    A[7, 7] = _t16
+    A[8, 4] = KiPlantQ*_t14
+    A[8, 6] = -_t17
+    A[8, 8] = _t16
+    A[9, 7] = _t18
+    A[9, 10] = -_t18
+    A[10, 10] = _t19
+    A[10, 16] = _t21
+    A[10, 17] = _t23
+    A[10, 18] = _t20
+    A[10, 19] = _t22
+    A[10, 20] = wc*(-_t24 + _t25)
+    A[10, 21] = wc*(-_t26 + _t27)
+    A[11, 11] = _t19
+    A[11, 16] = -_t23
+    A[11, 17] = _t21
+    A[11, 18] = -_t22
+    A[11, 19] = _t20
+    A[11, 20] = wc*(_t26 + _t27)
+    A[11, 21] = wc*(-_t24 - _t25)
+    A[12, 8] = mq
+    A[12, 11] = -mq
+    A[12, 16] = _t28
+    A[12, 18] = -1
+    A[12, 20] = Rd
+    A[13, 17] = _t28
+    A[13, 19] = -1
+    A[13, 21] = Rd
+    A[14, 8] = _t29
+    A[14, 11] = -_t29
+    A[14, 12] = KiV
+    A[14, 16] = _t31
+    A[14, 18] = _t32
+    A[14, 20] = _t30
+    A[15, 13] = KiV
+    A[15, 17] = _t31
+    A[15, 19] = _t32
+    A[15, 21] = _t30
+    A[16, 7] = _t33
+    A[16, 8] = _t36
+    A[16, 10] = -_t33
+    A[16, 11] = -_t36
+    A[16, 12] = _t37
+    A[16, 14] = _t38
+    A[16, 16] = _t39
+    A[16, 17] = -_t34*_t41
+    A[16, 18] = _t42
+    A[16, 20] = _t43
+    A[17, 7] = -_t44
+    A[17, 10] = _t44
+    A[17, 13] = _t37
+    A[17, 15] = _t38
+    A[17, 16] = _t34*_t41
+    A[17, 17] = _t39
+    A[17, 19] = _t42
+    A[17, 21] = _t43
+    A[18, 7] = _t45
+    A[18, 10] = -_t45
+    A[18, 16] = _t46
+    A[18, 19] = _t47
+    A[18, 20] = _t48
+    A[19, 7] = -_t49
+    A[19, 10] = _t49
+    A[19, 17] = _t46
+    A[19, 18] = _t50
+    A[19, 21] = _t48
+    A[20, 7] = _t51
+    A[20, 9] = _t12*_t52
+    A[20, 10] = -_t51
+    A[20, 16] = _t53
+    A[20, 18] = _t52
+    A[20, 20] = _t54
+    A[20, 21] = _t47
+    A[21, 7] = -_t55
+    A[21, 9] = _t11*_t52
+    A[21, 10] = _t55
+    A[21, 17] = _t53
+    A[21, 19] = _t52
+    A[21, 20] = _t50
+    A[21, 21] = _t54
+    B[0, 0] = -_t1*_t56
+    B[0, 1] = _t0*_t56
+    B[1, 0] = -_t1
+    B[1, 1] = _t0
+    B[2, 0] = -_t1*_t57
+    B[2, 1] = _t0*_t57
+    B[4, 0] = -_t59
+    B[4, 1] = -_t60
+    B[5, 0] = _t61
+    B[5, 1] = _t9*wcPlant
+    B[6, 0] = _t10*wcPlant
+    B[6, 1] = _t61
+    B[8, 0] = -_t17*_t59
+    B[8, 1] = -_t17*_t60
+    B[20, 0] = _t62
+    B[20, 1] = -_t63
+    B[21, 0] = _t63
+    B[21, 1] = _t62
+    Bw[0, 0] = _t64
+    Bw[9, 0] = _t64
+    C[0, 9] = _t10
+    C[0, 20] = _t6
+    C[0, 21] = -_t7
+    C[1, 9] = _t8
+    C[1, 20] = _t7
+    C[1, 21] = _t6
+    Cw[0, 7] = mp
+    Cw[0, 10] = -mp
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_droopPlant_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    PsetPlant = numpy.asarray(paras['PsetPlant'], dtype=float)
+    QsetPlant = numpy.asarray(paras['QsetPlant'], dtype=float)
+    wsetPlant = numpy.asarray(paras['wsetPlant'], dtype=float)
+    VsetPlant = numpy.asarray(paras['VsetPlant'], dtype=float)
+    mpPlant = numpy.asarray(paras['mpPlant'], dtype=float)
+    mqPlant = numpy.asarray(paras['mqPlant'], dtype=float)
+    KpPLLplant = numpy.asarray(paras['KpPLLplant'], dtype=float)
+    KiPLLplant = numpy.asarray(paras['KiPLLplant'], dtype=float)
+    KpPlantP = numpy.asarray(paras['KpPlantP'], dtype=float)
+    KiPlantP = numpy.asarray(paras['KiPlantP'], dtype=float)
+    KpPlantQ = numpy.asarray(paras['KpPlantQ'], dtype=float)
+    KiPlantQ = numpy.asarray(paras['KiPlantQ'], dtype=float)
+    wcpllPlant = numpy.asarray(paras['wcpllPlant'], dtype=float)
+    wcPlant = numpy.asarray(paras['wcPlant'], dtype=float)
+    tDelay = numpy.asarray(paras['tDelay'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rt = numpy.asarray(paras['Rt'], dtype=float)
+    Lt = numpy.asarray(paras['Lt'], dtype=float)
+    Rd = numpy.asarray(paras['Rd'], dtype=float)
+    Cf = numpy.asarray(paras['Cf'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    KpV = numpy.asarray(paras['KpV'], dtype=float)
+    KiV = numpy.asarray(paras['KiV'], dtype=float)
+    KpC = numpy.asarray(paras['KpC'], dtype=float)
+    KiC = numpy.asarray(paras['KiC'], dtype=float)
+    wc = numpy.asarray(paras['wc'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(thetaPlant), numpy.shape(epsilonPLLPlant), numpy.shape(wPlant), numpy.shape(epsilonP), numpy.shape(epsilonQ), numpy.shape(PoPlant), numpy.shape(QoPlant), numpy.shape(PsetDelay), numpy.shape(QsetDelay), numpy.shape(theta), numpy.shape(Po), numpy.shape(Qo), numpy.shape(phid), numpy.shape(phiq), numpy.shape(gammad), numpy.shape(gammaq), numpy.shape(iid), numpy.shape(iiq), numpy.shape(vcd), numpy.shape(vcq), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(PsetPlant), numpy.shape(QsetPlant), numpy.shape(wsetPlant), numpy.shape(VsetPlant), numpy.shape(mpPlant), numpy.shape(mqPlant), numpy.shape(KpPLLplant), numpy.shape(KiPLLplant), numpy.shape(KpPlantP), numpy.shape(KiPlantP), numpy.shape(KpPlantQ), numpy.shape(KiPlantQ), numpy.shape(wcpllPlant), numpy.shape(wcPlant), numpy.shape(tDelay), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rt), numpy.shape(Lt), numpy.shape(Rd), numpy.shape(Cf), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(KpV), numpy.shape(KiV), numpy.shape(KpC), numpy.shape(KiC), numpy.shape(wc))
+    _t0 = numpy.cos(thetaPlant)
+    _t1 = numpy.sin(thetaPlant)
+    _t2 = -_t0*vbD - _t1*vbQ
+    _t3 = KpPLLplant*_t2
+    _t4 = mpPlant**(-1.0)
+    _t5 = -wcPlant
+    _t6 = numpy.cos(theta)
+    _t7 = numpy.sin(theta)
+    _t8 = _t6*iod - _t7*ioq
+    _t9 = _t6*ioq + _t7*iod
+    _t10 = -_t9
+    _t11 = _t6*vbD + _t7*vbQ
+    _t12 = -_t6*vbQ + _t7*vbD
+    _t13 = -_t12*wcPlant
+    _t14 = tDelay**(-1.0)
+    _t15 = KpPlantP*_t14
+    _t16 = -_t14
+    _t17 = KpPlantQ*_t14
+    _t18 = mp*wbase
+    _t19 = -wc
+    _t20 = iod*wc
+    _t21 = Rd*_t20
+    _t22 = ioq*wc
+    _t23 = Rd*_t22
+    _t24 = Rd*iod
+    _t25 = Rd*(iid - iod) + vcd
+    _t26 = Rd*ioq
+    _t27 = Rd*(iiq - ioq) + vcq
+    _t28 = -Rd
+    _t29 = KpV*mq
+    _t30 = KpV*Rd
+    _t31 = -_t30 - 1
+    _t32 = -KpV
+    _t33 = _t18*iiq
+    _t34 = wbase/Lt
+    _t35 = KpC*_t34
+    _t36 = _t29*_t35
+    _t37 = KiV*_t35
+    _t38 = KiC*_t34
+    _t39 = _t34*(KpC*_t31 - Rd - Rt)
+    _t40 = -mp*(Po - PsetDelay) + wset
+    _t41 = -Lt*_t40 + Lt*wset
+    _t42 = _t34*(-KpC*KpV - 1)
+    _t43 = _t34*(KpC*_t30 + Rd)
+    _t44 = _t18*iid
+    _t45 = _t18*vcq
+    _t46 = wbase/Cf
+    _t47 = _t40*wbase
+    _t48 = -_t46
+    _t49 = _t18*vcd
+    _t50 = -_t47
+    _t51 = _t18*ioq
+    _t52 = wbase/Lc
+    _t53 = Rd*_t52
+    _t54 = _t52*(-Rc - Rd)
+    _t55 = _t18*iod
+    _t56 = KpPLLplant*wbase
+    _t57 = KpPLLplant*wcpllPlant
+    _t58 = 1/(mqPlant*numpy.sqrt(vbD**2 + vbQ**2))
+    _t59 = _t58*vbD
+    _t60 = _t58*vbQ
+    _t61 = _t8*wcPlant
+    _t62 = -_t52*_t6
+    _t63 = _t52*_t7
+    _t64 = -wbase
+    A = numpy.zeros(batch + (22, 22))
+    B = numpy.zeros(batch + (22, 2))
+    Bw = numpy.zeros(batch + (22, 1))
+    C = numpy.zeros(batch + (2, 22))
+    Cw = numpy.zeros(batch + (1, 22))
+    A[..., 0, 0] = _t3*wbase
+    A[..., 0, 1] = KiPLLplant*wbase
+    A[..., 1, 0] = _t2
+    A[..., 2, 0] = _t3*wcpllPlant
+    A[..., 2, 1] = KiPLLplant*wcpllPlant
+    A[..., 2, 2] = -wcpllPlant
+    A[..., 3, 2] = -_t4
+    A[..., 3, 5] = -1
+    A[..., 4, 6] = -1
+    A[..., 5, 5] = _t5
+    A[..., 5, 9] = wcPlant*(_t10*vbD + _t8*vbQ)
+    A[..., 5, 20] = _t11*wcPlant
+    A[..., 5, 21] = _t13
+    A[..., 6, 6] = _t5
+    A[..., 6, 9] = wcPlant*(_t10*vbQ - _t8*vbD)
+    A[..., 6, 20] = _t13
+    A[..., 6, 21] = -_t11*wcPlant
+    A[..., 7, 2] = -_t15*_t4
+    A[..., 7, 3] = KiPlantP*_t14
+    A[..., 7, 5] = -_t15
+    A[..., 7, 7] = _t16
+    A[..., 8, 4] = KiPlantQ*_t14
+    A[..., 8, 6] = -_t17
+    A[..., 8, 8] = _t16
+    A[..., 9, 7] = _t18
+    A[..., 9, 10] = -_t18
+    A[..., 10, 10] = _t19
+    A[..., 10, 16] = _t21
+    A[..., 10, 17] = _t23
+    A[..., 10, 18] = _t20
+    A[..., 10, 19] = _t22
+    A[..., 10, 20] = wc*(-_t24 + _t25)
+    A[..., 10, 21] = wc*(-_t26 + _t27)
+    A[..., 11, 11] = _t19
+    A[..., 11, 16] = -_t23
+    A[..., 11, 17] = _t21
+    A[..., 11, 18] = -_t22
+    A[..., 11, 19] = _t20
+    A[..., 11, 20] = wc*(_t26 + _t27)
+    A[..., 11, 21] = wc*(-_t24 - _t25)
+    A[..., 12, 8] = mq
+    A[..., 12, 11] = -mq
+    A[..., 12, 16] = _t28
+    A[..., 12, 18] = -1
+    A[..., 12, 20] = Rd
+    A[..., 13, 17] = _t28
+    A[..., 13, 19] = -1
+    A[..., 13, 21] = Rd
+    A[..., 14, 8] = _t29
+    A[..., 14, 11] = -_t29
+    A[..., 14, 12] = KiV
+    A[..., 14, 16] = _t31
+    A[..., 14, 18] = _t32
+    A[..., 14, 20] = _t30
+    A[..., 15, 13] = KiV
+    A[..., 15, 17] = _t31
+    A[..., 15, 19] = _t32
+    A[..., 15, 21] = _t30
+    A[..., 16, 7] = _t33
+    A[..., 16, 8] = _t36
+    A[..., 16, 10] = -_t33
+    A[..., 16, 11] = -_t36
+    A[..., 16, 12] = _t37
+    A[..., 16, 14] = _t38
+    A[..., 16, 16] = _t39
+    A[..., 16, 17] = -_t34*_t41
+    A[..., 16, 18] = _t42
+    A[..., 16, 20] = _t43
+    A[..., 17, 7] = -_t44
+    A[..., 17, 10] = _t44
+    A[..., 17, 13] = _t37
+    A[..., 17, 15] = _t38
+    A[..., 17, 16] = _t34*_t41
+    A[..., 17, 17] = _t39
+    A[..., 17, 19] = _t42
+    A[..., 17, 21] = _t43
+    A[..., 18, 7] = _t45
+    A[..., 18, 10] = -_t45
+    A[..., 18, 16] = _t46
+    A[..., 18, 19] = _t47
+    A[..., 18, 20] = _t48
+    A[..., 19, 7] = -_t49
+    A[..., 19, 10] = _t49
+    A[..., 19, 17] = _t46
+    A[..., 19, 18] = _t50
+    A[..., 19, 21] = _t48
+    A[..., 20, 7] = _t51
+    A[..., 20, 9] = _t12*_t52
+    A[..., 20, 10] = -_t51
+    A[..., 20, 16] = _t53
+    A[..., 20, 18] = _t52
+    A[..., 20, 20] = _t54
+    A[..., 20, 21] = _t47
+    A[..., 21, 7] = -_t55
+    A[..., 21, 9] = _t11*_t52
+    A[..., 21, 10] = _t55
+    A[..., 21, 17] = _t53
+    A[..., 21, 19] = _t52
+    A[..., 21, 20] = _t50
+    A[..., 21, 21] = _t54
+    B[..., 0, 0] = -_t1*_t56
+    B[..., 0, 1] = _t0*_t56
+    B[..., 1, 0] = -_t1
+    B[..., 1, 1] = _t0
+    B[..., 2, 0] = -_t1*_t57
+    B[..., 2, 1] = _t0*_t57
+    B[..., 4, 0] = -_t59
+    B[..., 4, 1] = -_t60
+    B[..., 5, 0] = _t61
+    B[..., 5, 1] = _t9*wcPlant
+    B[..., 6, 0] = _t10*wcPlant
+    B[..., 6, 1] = _t61
+    B[..., 8, 0] = -_t17*_t59
+    B[..., 8, 1] = -_t17*_t60
+    B[..., 20, 0] = _t62
+    B[..., 20, 1] = -_t63
+    B[..., 21, 0] = _t63
+    B[..., 21, 1] = _t62
+    Bw[..., 0, 0] = _t64
+    Bw[..., 9, 0] = _t64
+    C[..., 0, 9] = _t10
+    C[..., 0, 20] = _t6
+    C[..., 0, 21] = -_t7
+    C[..., 1, 9] = _t8
+    C[..., 1, 20] = _t7
+    C[..., 1, 21] = _t6
+    Cw[..., 0, 7] = mp
+    Cw[..., 0, 10] = -mp
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_droopPlant(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    PsetPlant = paras['PsetPlant']
+    QsetPlant = paras['QsetPlant']
+    wsetPlant = paras['wsetPlant']
+    VsetPlant = paras['VsetPlant']
+    mpPlant = paras['mpPlant']
+    mqPlant = paras['mqPlant']
+    KpPLLplant = paras['KpPLLplant']
+    KiPLLplant = paras['KiPLLplant']
+    KpPlantP = paras['KpPlantP']
+    KiPlantP = paras['KiPlantP']
+    KpPlantQ = paras['KpPlantQ']
+    KiPlantQ = paras['KiPlantQ']
+    wcpllPlant = paras['wcpllPlant']
+    wcPlant = paras['wcPlant']
+    tDelay = paras['tDelay']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpV = paras['KpV']
+    KiV = paras['KiV']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wc = paras['wc']
+    _t0 = -vbD*numpy.sin(thetaPlant) + vbQ*numpy.cos(thetaPlant)
+    _t1 = KiPLLplant*epsilonPLLPlant + KpPLLplant*_t0 + wsetPlant
+    _t2 = -PoPlant + PsetPlant + (-wPlant + wsetPlant)/mpPlant
+    _t3 = -QoPlant + QsetPlant + (VsetPlant - numpy.sqrt(vbD**2 + vbQ**2))/mqPlant
+    _t4 = numpy.sin(theta)
+    _t5 = numpy.cos(theta)
+    _t6 = _t4*iod + _t5*ioq
+    _t7 = -_t4*ioq + _t5*iod
+    _t8 = tDelay**(-1.0)
+    _t9 = -PsetDelay
+    _t10 = -QsetDelay
+    _t11 = mp*(Po + _t9) - wset
+    _t12 = iid - iod
+    _t13 = Rd*_t12 + vcd
+    _t14 = Rd*(iiq - ioq)
+    _t15 = _t14 + vcq
+    _t16 = Vset - _t13 - mq*(Qo + _t10)
+    _t17 = -_t15
+    _t18 = KiV*phid + KpV*_t16 - iid
+    _t19 = -iiq
+    _t20 = KiV*phiq + KpV*_t17 + _t19
+    _t21 = -_t11
+    _t22 = wbase/Lt
+    _t23 = Cf*_t21
+    _t24 = wbase/Cf
+    _t25 = Lc*_t21
+    _t26 = wbase/Lc
+    f = [wbase*(_t1 - wcom), _t0, wcpllPlant*(_t1 - wPlant), _t2, _t3, -PoPlant*wcPlant + wcPlant*(_t6*vbQ + _t7*vbD), -QoPlant*wcPlant + wcPlant*(-_t6*vbD + _t7*vbQ), _t8*(KiPlantP*epsilonP + KpPlantP*_t2 + PsetPlant + _t9), _t8*(KiPlantQ*epsilonQ + KpPlantQ*_t3 + QsetPlant + _t10), wbase*(-_t11 - wcom), -Po*wc + wc*(_t13*iod + _t15*ioq), -Qo*wc + wc*(-_t13*ioq + _t15*iod), _t16, _t17, _t18, _t20, _t22*(KiC*gammad + KpC*_t18 + Lt*_t21*iiq - Lt*iiq*wset - Rt*iid - _t13), _t22*(KiC*gammaq + KpC*_t20 - Lt*_t21*iid + Lt*iid*wset - Rt*iiq - _t15), _t24*(_t12 + _t23*vcq), _t24*(-_t19 - _t23*vcd - ioq), _t26*(-Rc*iod + _t13 + _t25*ioq - _t4*vbQ - _t5*vbD), _t26*(-Rc*ioq + _t14 - _t25*iod + _t4*vbD - _t5*vbQ + vcq)]
+    y = [_t7, _t6]
+    w = [_t21]
+    return {'f': f, 'y': y, 'w': w}
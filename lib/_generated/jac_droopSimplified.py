@@ -0,0 +1,146 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_droopSimplified_symbolic() in lib/ssmodel_droopSimplified.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = 'ff55a8108510bb6bd4376baea41ad253c28131c1efa1bf2d7f087ceb301ee1e8'
+PARAS = ('Pset', 'Qset', 'wset', 'Vset', 'Rc', 'Lc', 'mp', 'mq', 'wc')
+SHAPES = {'A': (5, 5), 'B': (5, 2), 'Bw': (5, 1), 'C': (2, 5), 'Cw': (5, 1)}
+
+def jac_droopSimplified(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Po, Qo, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    wc = paras['wc']
+    _t0 = mp*wbase
+    _t1 = -wc
+    _t2 = mq*wc
+    _t3 = wc*(Vset - mq*(Qo - Qset))
+    _t4 = numpy.sin(theta)
+    _t5 = numpy.cos(theta)
+    _t6 = wbase/Lc
+    _t7 = -Rc*_t6
+    _t8 = wbase*(-mp*(Po - Pset) + wset)
+    _t9 = -_t5*_t6
+    _t10 = _t4*_t6
+    A = numpy.zeros((5, 5))
+    B = numpy.zeros((5, 2))
+    Bw = numpy.zeros((5, 1))
+    C = numpy.zeros((2, 5))
+    Cw = numpy.zeros((5, 1))
+    A[0, 1] = -_t0
+    A[1, 1] = _t1
+    A[1, 2] = -_t2*iod
+    A[1, 3] = _t3
+    A[2, 2] = _t1 + _t2*ioq
+    A[2, 4] = -_t3
+    A[3, 0] = _t6*(_t4*vbD - _t5*vbQ)
+    A[3, 1] = -_t0*ioq
+    A[3, 2] = -_t6*mq
+    A[3, 3] = _t7
+    A[3, 4] = _t8
+    A[4, 0] = _t6*(_t4*vbQ + _t5*vbD)
+    A[4, 1] = _t0*iod
+    A[4, 3] = -_t8
+    A[4, 4] = _t7
+    B[3, 0] = _t9
+    B[3, 1] = -_t10
+    B[4, 0] = _t10
+    B[4, 1] = _t9
+    Bw[0, 0] = -wbase
+    C[0, 0] = -_t4*iod - _t5*ioq
+    C[0, 3] = _t5
+    C[0, 4] = -_t4
+    C[1, 0] = -_t4*ioq + _t5*iod
+    C[1, 3] = _t4
+    C[1, 4] = _t5
+    Cw[1, 0] = -mp
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_droopSimplified_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Po, Qo, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    Pset = numpy.asarray(paras['Pset'], dtype=float)
+    Qset = numpy.asarray(paras['Qset'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    wc = numpy.asarray(paras['wc'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(theta), numpy.shape(Po), numpy.shape(Qo), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(Pset), numpy.shape(Qset), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(wc))
+    _t0 = mp*wbase
+    _t1 = -wc
+    _t2 = mq*wc
+    _t3 = wc*(Vset - mq*(Qo - Qset))
+    _t4 = numpy.sin(theta)
+    _t5 = numpy.cos(theta)
+    _t6 = wbase/Lc
+    _t7 = -Rc*_t6
+    _t8 = wbase*(-mp*(Po - Pset) + wset)
+    _t9 = -_t5*_t6
+    _t10 = _t4*_t6
+    A = numpy.zeros(batch + (5, 5))
+    B = numpy.zeros(batch + (5, 2))
+    Bw = numpy.zeros(batch + (5, 1))
+    C = numpy.zeros(batch + (2, 5))
+    Cw = numpy.zeros(batch + (5, 1))
+    A[..., 0, 1] = -_t0
+    A[..., 1, 1] = _t1
+    A[..., 1, 2] = -_t2*iod
+    A[..., 1, 3] = _t3
+    A[..., 2, 2] = _t1 + _t2*ioq
+    A[..., 2, 4] = -_t3
+    A[..., 3, 0] = _t6*(_t4*vbD - _t5*vbQ)
+    A[..., 3, 1] = -_t0*ioq
+    A[..., 3, 2] = -_t6*mq
+    A[..., 3, 3] = _t7
+    A[..., 3, 4] = _t8
+    A[..., 4, 0] = _t6*(_t4*vbQ + _t5*vbD)
+    A[..., 4, 1] = _t0*iod
+    A[..., 4, 3] = -_t8
+    A[..., 4, 4] = _t7
+    B[..., 3, 0] = _t9
+    B[..., 3, 1] = -_t10
+    B[..., 4, 0] = _t10
+    B[..., 4, 1] = _t9
+    Bw[..., 0, 0] = -wbase
+    C[..., 0, 0] = -_t4*iod - _t5*ioq
+    C[..., 0, 3] = _t5
+    C[..., 0, 4] = -_t4
+    C[..., 1, 0] = -_t4*ioq + _t5*iod
+    C[..., 1, 3] = _t4
+    C[..., 1, 4] = _t5
+    Cw[..., 1, 0] = -mp
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_droopSimplified(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Po, Qo, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    wc = paras['wc']
+    _t0 = mp*(Po - Pset) - wset
+    _t1 = mq*(Qo - Qset)
+    _t2 = Vset - _t1
+    _t3 = numpy.cos(theta)
+    _t4 = numpy.sin(theta)
+    _t5 = -_t0
+    _t6 = wbase/Lc
+    f = [wbase*(-_t0 - wcom), -Po*wc + _t2*iod*wc, -Qo*wc - _t2*ioq*wc, _t6*(Lc*_t5*ioq - Rc*iod + Vset - _t1 - _t3*vbD - _t4*vbQ), _t6*(-Lc*_t5*iod - Rc*ioq - _t3*vbQ + _t4*vbD)]
+    y = [_t3*iod - _t4*ioq, _t3*ioq + _t4*iod]
+    w = [_t5]
+    return {'f': f, 'y': y, 'w': w}
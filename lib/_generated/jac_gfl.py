@@ -0,0 +1,435 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_gfl_symbolic() in lib/ssmodel_gfl.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = 'be67273604929940b76074fa5e660684e3cfafa1909dbe095faff5cc20e17dd7'
+PARAS = ('Pset', 'Qset', 'wset', 'Vset', 'Rt', 'Lt', 'Rd', 'Cf', 'Rc', 'Lc', 'mp', 'mq', 'KpL', 'KiL', 'KpS', 'KiS', 'KpC', 'KiC', 'wcpll', 'wc')
+SHAPES = {'A': (15, 15), 'B': (15, 2), 'Bw': (15, 1), 'C': (2, 15), 'Cw': (15, 1)}
+
+def jac_gfl(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpL = paras['KpL']
+    KiL = paras['KiL']
+    KpS = paras['KpS']
+    KiS = paras['KiS']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wcpll = paras['wcpll']
+    wc = paras['wc']
+    _t0 = KiL*wbase
+    _t1 = KpL*wbase
+    _t2 = Rd*_t1
+    _t3 = -Rd
+    _t4 = KpL*wcpll
+    _t5 = Rd*_t4
+    _t6 = -wc
+    _t7 = iod*wc
+    _t8 = Rd*_t7
+    _t9 = ioq*wc
+    _t10 = Rd*_t9
+    _t11 = Rd*iod
+    _t12 = Rd*(iid - iod) + vcd
+    _t13 = Rd*ioq
+    _t14 = Rd*(iiq - ioq) + vcq
+    _t15 = mp**(-1.0)
+    _t16 = mq**(-1.0)
+    _t17 = 1/numpy.sqrt(_t12**2 + _t14**2)
+    _t18 = _t16*_t17
+    _t19 = _t12*_t18
+    _t20 = Rd*_t19
+    _t21 = _t14*_t18
+    _t22 = Rd*_t21
+    _t23 = KpS*_t15
+    _t24 = KpS*_t20
+    _t25 = KpS*_t22
+    _t26 = _t25 - 1
+    _t27 = KpS*_t19
+    _t28 = wbase/Lt
+    _t29 = KpC*_t28
+    _t30 = KpS*_t29
+    _t31 = KiS*_t29
+    _t32 = KiC*_t28
+    _t33 = Rd + Rt
+    _t34 = Lt*wset
+    _t35 = KpL*Rd
+    _t36 = KiL*epsilonPLL + KpL*_t14 + wset
+    _t37 = Lt*_t36
+    _t38 = Rd*_t28
+    _t39 = Lt*iid
+    _t40 = _t35*_t39
+    _t41 = wbase/Cf
+    _t42 = _t2*vcq
+    _t43 = Cf*_t35*vcd - 1
+    _t44 = -_t36*wbase
+    _t45 = numpy.sin(theta)
+    _t46 = numpy.cos(theta)
+    _t47 = wbase/Lc
+    _t48 = Rc + Rd
+    _t49 = KpL*Lc
+    _t50 = _t11*_t49
+    _t51 = -_t46*_t47
+    _t52 = _t45*_t47
+    A = numpy.zeros((15, 15))
+    B = numpy.zeros((15, 2))
+    Bw = numpy.zeros((15, 1))
+    C = numpy.zeros((2, 15))
+    Cw = numpy.zeros((15, 1))
+    A[0, 1] = _t0
+    A[0, 10] = _t2
+    A[0, 12] = _t1
+    A[0, 14] = -_t2
+    A[1, 10] = Rd
+    A[1, 12] = 1
+    A[1, 14] = _t3
+    A[2, 1] = KiL*wcpll
+    A[2, 2] = -wcpll
+    A[2, 10] = _t5
+    A[2, 12] = _t4
+    A[2, 14] = -_t5
+    A[3, 3] = _t6
+    A[3, 9] = _t8
+    A[3, 10] = _t10
+    A[3, 11] = _t7
+    A[3, 12] = _t9
+    A[3, 13] = wc*(-_t11 + _t12)
+    A[3, 14] = wc*(-_t13 + _t14)
+    A[4, 4] = _t6
+    A[4, 9] = -_t10
+    A[4, 10] = _t8
+    A[4, 11] = -_t9
+    A[4, 12] = _t7
+    A[4, 13] = wc*(_t13 + _t14)
+    A[4, 14] = wc*(-_t11 - _t12)
+    A[5, 2] = -_t15
+    A[5, 3] = -1
+    A[6, 4] = 1
+    A[6, 9] = _t20
+    A[6, 10] = _t22
+    A[6, 11] = _t19
+    A[6, 12] = _t21
+    A[6, 13] = -_t20
+    A[6, 14] = -_t22
+    A[7, 2] = -_t23
+    A[7, 3] = -KpS
+    A[7, 5] = KiS
+    A[7, 9] = -1
+    A[8, 4] = KpS
+    A[8, 6] = KiS
+    A[8, 9] = _t24
+    A[8, 10] = _t26
+    A[8, 11] = _t27
+    A[8, 12] = KpS*_t21
+    A[8, 13] = -_t24
+    A[8, 14] = -_t25
+    A[9, 1] = _t0*iiq
+    A[9, 2] = -_t23*_t29
+    A[9, 3] = -_t30
+    A[9, 5] = _t31
+    A[9, 7] = _t32
+    A[9, 9] = _t28*(-KpC - _t33)
+    A[9, 10] = _t28*(Lt*_t35*iiq - _t34 + _t37)
+    A[9, 11] = -_t28
+    A[9, 12] = _t1*iiq
+    A[9, 13] = _t38
+    A[9, 14] = -_t2*iiq
+    A[10, 1] = -_t0*iid
+    A[10, 4] = _t30
+    A[10, 6] = _t31
+    A[10, 8] = _t32
+    A[10, 9] = _t28*(KpC*_t24 + _t34 - _t37)
+    A[10, 10] = _t28*(KpC*_t26 - _t33 - _t40)
+    A[10, 11] = _t27*_t29
+    A[10, 12] = _t28*(KpC*KpS*_t14*_t16*_t17 - KpL*_t39 - 1)
+    A[10, 13] = -KpC*_t27*_t38
+    A[10, 14] = _t28*(-KpC*_t25 + Rd + _t40)
+    A[11, 1] = _t0*vcq
+    A[11, 9] = _t41
+    A[11, 10] = _t42
+    A[11, 12] = _t41*(Cf*KpL*vcq + Cf*_t36)
+    A[11, 13] = -_t41
+    A[11, 14] = -_t42
+    A[12, 1] = -_t0*vcd
+    A[12, 10] = -_t41*_t43
+    A[12, 11] = _t44
+    A[12, 12] = -_t1*vcd
+    A[12, 14] = _t41*_t43
+    A[13, 0] = _t47*(_t45*vbD - _t46*vbQ)
+    A[13, 1] = _t0*ioq
+    A[13, 9] = Rd*_t47
+    A[13, 10] = _t1*_t13
+    A[13, 11] = _t47
+    A[13, 12] = _t1*ioq
+    A[13, 13] = -_t47*_t48
+    A[13, 14] = _t47*(Lc*_t36 - _t13*_t49)
+    A[14, 0] = _t47*(_t45*vbQ + _t46*vbD)
+    A[14, 1] = -_t0*iod
+    A[14, 10] = _t47*(-_t3 - _t50)
+    A[14, 12] = _t47*(-_t49*iod + 1)
+    A[14, 13] = _t44
+    A[14, 14] = _t47*(-_t48 + _t50)
+    B[13, 0] = _t51
+    B[13, 1] = -_t52
+    B[14, 0] = _t52
+    B[14, 1] = _t51
+    Bw[0, 0] = -wbase
+    C[0, 0] = -_t45*iod - _t46*ioq
+    C[0, 13] = _t46
+    C[0, 14] = -_t45
+    C[1, 0] = -_t45*ioq + _t46*iod
+    C[1, 13] = _t45
+    C[1, 14] = _t46
+    Cw[1, 0] = KiL
+    Cw[10, 0] = _t35
+    Cw[12, 0] = KpL
+    Cw[14, 0] = -_t35
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_gfl_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    Pset = numpy.asarray(paras['Pset'], dtype=float)
+    Qset = numpy.asarray(paras['Qset'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rt = numpy.asarray(paras['Rt'], dtype=float)
+    Lt = numpy.asarray(paras['Lt'], dtype=float)
+    Rd = numpy.asarray(paras['Rd'], dtype=float)
+    Cf = numpy.asarray(paras['Cf'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    KpL = numpy.asarray(paras['KpL'], dtype=float)
+    KiL = numpy.asarray(paras['KiL'], dtype=float)
+    KpS = numpy.asarray(paras['KpS'], dtype=float)
+    KiS = numpy.asarray(paras['KiS'], dtype=float)
+    KpC = numpy.asarray(paras['KpC'], dtype=float)
+    KiC = numpy.asarray(paras['KiC'], dtype=float)
+    wcpll = numpy.asarray(paras['wcpll'], dtype=float)
+    wc = numpy.asarray(paras['wc'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(theta), numpy.shape(epsilonPLL), numpy.shape(wf), numpy.shape(Po), numpy.shape(Qo), numpy.shape(phid), numpy.shape(phiq), numpy.shape(gammad), numpy.shape(gammaq), numpy.shape(iid), numpy.shape(iiq), numpy.shape(vcd), numpy.shape(vcq), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(Pset), numpy.shape(Qset), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rt), numpy.shape(Lt), numpy.shape(Rd), numpy.shape(Cf), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(KpL), numpy.shape(KiL), numpy.shape(KpS), numpy.shape(KiS), numpy.shape(KpC), numpy.shape(KiC), numpy.shape(wcpll), numpy.shape(wc))
+    _t0 = KiL*wbase
+    _t1 = KpL*wbase
+    _t2 = Rd*_t1
+    _t3 = -Rd
+    _t4 = KpL*wcpll
+    _t5 = Rd*_t4
+    _t6 = -wc
+    _t7 = iod*wc
+    _t8 = Rd*_t7
+    _t9 = ioq*wc
+    _t10 = Rd*_t9
+    _t11 = Rd*iod
+    _t12 = Rd*(iid - iod) + vcd
+    _t13 = Rd*ioq
+    _t14 = Rd*(iiq - ioq) + vcq
+    _t15 = mp**(-1.0)
+    _t16 = mq**(-1.0)
+    _t17 = 1/numpy.sqrt(_t12**2 + _t14**2)
+    _t18 = _t16*_t17
+    _t19 = _t12*_t18
+    _t20 = Rd*_t19
+    _t21 = _t14*_t18
+    _t22 = Rd*_t21
+    _t23 = KpS*_t15
+    _t24 = KpS*_t20
+    _t25 = KpS*_t22
+    _t26 = _t25 - 1
+    _t27 = KpS*_t19
+    _t28 = wbase/Lt
+    _t29 = KpC*_t28
+    _t30 = KpS*_t29
+    _t31 = KiS*_t29
+    _t32 = KiC*_t28
+    _t33 = Rd + Rt
+    _t34 = Lt*wset
+    _t35 = KpL*Rd
+    _t36 = KiL*epsilonPLL + KpL*_t14 + wset
+    _t37 = Lt*_t36
+    _t38 = Rd*_t28
+    _t39 = Lt*iid
+    _t40 = _t35*_t39
+    _t41 = wbase/Cf
+    _t42 = _t2*vcq
+    _t43 = Cf*_t35*vcd - 1
+    _t44 = -_t36*wbase
+    _t45 = numpy.sin(theta)
+    _t46 = numpy.cos(theta)
+    _t47 = wbase/Lc
+    _t48 = Rc + Rd
+    _t49 = KpL*Lc
+    _t50 = _t11*_t49
+    _t51 = -_t46*_t47
+    _t52 = _t45*_t47
+    A = numpy.zeros(batch + (15, 15))
+    B = numpy.zeros(batch + (15, 2))
+    Bw = numpy.zeros(batch + (15, 1))
+    C = numpy.zeros(batch + (2, 15))
+    Cw = numpy.zeros(batch + (15, 1))
+    A[..., 0, 1] = _t0
+    A[..., 0, 10] = _t2
+    A[..., 0, 12] = _t1
+    A[..., 0, 14] = -_t2
+    A[..., 1, 10] = Rd
+    A[..., 1, 12] = 1
+    A[..., 1, 14] = _t3
+    A[..., 2, 1] = KiL*wcpll
+    A[..., 2, 2] = -wcpll
+    A[..., 2, 10] = _t5
+    A[..., 2, 12] = _t4
+    A[..., 2, 14] = -_t5
+    A[..., 3, 3] = _t6
+    A[..., 3, 9] = _t8
+    A[..., 3, 10] = _t10
+    A[..., 3, 11] = _t7
+    A[..., 3, 12] = _t9
+    A[..., 3, 13] = wc*(-_t11 + _t12)
+    A[..., 3, 14] = wc*(-_t13 + _t14)
+    A[..., 4, 4] = _t6
+    A[..., 4, 9] = -_t10
+    A[..., 4, 10] = _t8
+    A[..., 4, 11] = -_t9
+    A[..., 4, 12] = _t7
+    A[..., 4, 13] = wc*(_t13 + _t14)
+    A[..., 4, 14] = wc*(-_t11 - _t12)
+    A[..., 5, 2] = -_t15
+    A[..., 5, 3] = -1
+    A[..., 6, 4] = 1
+    A[..., 6, 9] = _t20
+    A[..., 6, 10] = _t22
+    A[..., 6, 11] = _t19
+    A[..., 6, 12] = _t21
+    A[..., 6, 13] = -_t20
+    A[..., 6, 14] = -_t22
+    A[..., 7, 2] = -_t23
+    A[..., 7, 3] = -KpS
+    A[..., 7, 5] = KiS
+    A[..., 7, 9] = -1
+    A[..., 8, 4] = KpS
+    A[..., 8, 6] = KiS
+    A[..., 8, 9] = _t24
+    A[..., 8, 10] = _t26
+    A[..., 8, 11] = _t27
+    A[..., 8, 12] = KpS*_t21
+    A[..., 8, 13] = -_t24
+    A[..., 8, 14] = -_t25
+    A[..., 9, 1] = _t0*iiq
+    A[..., 9, 2] = -_t23*_t29
+    A[..., 9, 3] = -_t30
+    A[..., 9, 5] = _t31
+    A[..., 9, 7] = _t32
+    A[..., 9, 9] = _t28*(-KpC - _t33)
+    A[..., 9, 10] = _t28*(Lt*_t35*iiq - _t34 + _t37)
+    A[..., 9, 11] = -_t28
+    A[..., 9, 12] = _t1*iiq
+    A[..., 9, 13] = _t38
+    A[..., 9, 14] = -_t2*iiq
+    A[..., 10, 1] = -_t0*iid
+    A[..., 10, 4] = _t30
+    A[..., 10, 6] = _t31
+    A[..., 10, 8] = _t32
+    A[..., 10, 9] = _t28*(KpC*_t24 + _t34 - _t37)
+    A[..., 10, 10] = _t28*(KpC*_t26 - _t33 - _t40)
+    A[..., 10, 11] = _t27*_t29
+    A[..., 10, 12] = _t28*(KpC*KpS*_t14*_t16*_t17 - KpL*_t39 - 1)
+    A[..., 10, 13] = -KpC*_t27*_t38
+    A[..., 10, 14] = _t28*(-KpC*_t25 + Rd + _t40)
+    A[..., 11, 1] = _t0*vcq
+    A[..., 11, 9] = _t41
+    A[..., 11, 10] = _t42
+    A[..., 11, 12] = _t41*(Cf*KpL*vcq + Cf*_t36)
+    A[..., 11, 13] = -_t41
+    A[..., 11, 14] = -_t42
+    A[..., 12, 1] = -_t0*vcd
+    A[..., 12, 10] = -_t41*_t43
+    A[..., 12, 11] = _t44
+    A[..., 12, 12] = -_t1*vcd
+    A[..., 12, 14] = _t41*_t43
+    A[..., 13, 0] = _t47*(_t45*vbD - _t46*vbQ)
+    A[..., 13, 1] = _t0*ioq
+    A[..., 13, 9] = Rd*_t47
+    A[..., 13, 10] = _t1*_t13
+    A[..., 13, 11] = _t47
+    A[..., 13, 12] = _t1*ioq
+    A[..., 13, 13] = -_t47*_t48
+    A[..., 13, 14] = _t47*(Lc*_t36 - _t13*_t49)
+    A[..., 14, 0] = _t47*(_t45*vbQ + _t46*vbD)
+    A[..., 14, 1] = -_t0*iod
+    A[..., 14, 10] = _t47*(-_t3 - _t50)
+    A[..., 14, 12] = _t47*(-_t49*iod + 1)
+    A[..., 14, 13] = _t44
+    A[..., 14, 14] = _t47*(-_t48 + _t50)
+    B[..., 13, 0] = _t51
+    B[..., 13, 1] = -_t52
+    B[..., 14, 0] = _t52
+    B[..., 14, 1] = _t51
+    Bw[..., 0, 0] = -wbase
+    C[..., 0, 0] = -_t45*iod - _t46*ioq
+    C[..., 0, 13] = _t46
+    C[..., 0, 14] = -_t45
+    C[..., 1, 0] = -_t45*ioq + _t46*iod
+    C[..., 1, 13] = _t45
+    C[..., 1, 14] = _t46
+    Cw[..., 1, 0] = KiL
+    Cw[..., 10, 0] = _t35
+    Cw[..., 12, 0] = KpL
+    Cw[..., 14, 0] = -_t35
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_gfl(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpL = paras['KpL']
+    KiL = paras['KiL']
+    KpS = paras['KpS']
+    KiS = paras['KiS']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wcpll = paras['wcpll']
+    wc = paras['wc']
+    _t0 = Rd*(iiq - ioq)
+    _t1 = _t0 + vcq
+    _t2 = KiL*epsilonPLL + KpL*_t1 + wset
+    _t3 = iid - iod
+    _t4 = Rd*_t3 + vcd
+    _t5 = -Po + Pset + (-wf + wset)/mp
+    _t6 = Qo - Qset - (Vset - numpy.sqrt(_t1**2 + _t4**2))/mq
+    _t7 = KiS*phid + KpS*_t5 - iid
+    _t8 = -iiq
+    _t9 = KiS*phiq + KpS*_t6 + _t8
+    _t10 = wbase/Lt
+    _t11 = Cf*_t2
+    _t12 = wbase/Cf
+    _t13 = numpy.cos(theta)
+    _t14 = numpy.sin(theta)
+    _t15 = Lc*_t2
+    _t16 = wbase/Lc
+    f = [wbase*(_t2 - wcom), _t1, _t2*wcpll - wcpll*wf, -Po*wc + wc*(_t1*ioq + _t4*iod), -Qo*wc + wc*(_t1*iod - _t4*ioq), _t5, _t6, _t7, _t9, _t10*(KiC*gammad + KpC*_t7 + Lt*_t2*iiq - Lt*iiq*wset - Rt*iid - _t4), _t10*(KiC*gammaq + KpC*_t9 - Lt*_t2*iid + Lt*iid*wset - Rt*iiq - _t1), _t12*(_t11*vcq + _t3), _t12*(-_t11*vcd - _t8 - ioq), _t16*(-Rc*iod - _t13*vbD - _t14*vbQ + _t15*ioq + _t4), _t16*(-Rc*ioq + _t0 - _t13*vbQ + _t14*vbD - _t15*iod + vcq)]
+    y = [_t13*iod - _t14*ioq, _t13*ioq + _t14*iod]
+    w = [_t2]
+    return {'f': f, 'y': y, 'w': w}
@@ -0,0 +1,622 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_gflPlant_symbolic() in lib/ssmodel_gflPlant.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = 'd854d4974aada93aa4d10217ef461b3663ece148b46a3a325403a3b83bd502da'
+PARAS = ('PsetPlant', 'QsetPlant', 'wsetPlant', 'VsetPlant', 'mpPlant', 'mqPlant', 'KpPLLplant', 'KiPLLplant', 'KpPlantP', 'KiPlantP', 'KpPlantQ', 'KiPlantQ', 'wcpllPlant', 'wcPlant', 'tDelay', 'wset', 'Vset', 'Rt', 'Lt', 'Rd', 'Cf', 'Rc', 'Lc', 'mp', 'mq', 'KpL', 'KiL', 'KpS', 'KiS', 'KpC', 'KiC', 'wcpll', 'wc')
+SHAPES = {'A': (24, 24), 'B': (24, 2), 'Bw': (24, 1), 'C': (2, 24), 'Cw': (1, 24)}
+
+def jac_gflPlant(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    PsetPlant = paras['PsetPlant']
+    QsetPlant = paras['QsetPlant']
+    wsetPlant = paras['wsetPlant']
+    VsetPlant = paras['VsetPlant']
+    mpPlant = paras['mpPlant']
+    mqPlant = paras['mqPlant']
+    KpPLLplant = paras['KpPLLplant']
+    KiPLLplant = paras['KiPLLplant']
+    KpPlantP = paras['KpPlantP']
+    KiPlantP = paras['KiPlantP']
+    KpPlantQ = paras['KpPlantQ']
+    KiPlantQ = paras['KiPlantQ']
+    wcpllPlant = paras['wcpllPlant']
+    wcPlant = paras['wcPlant']
+    tDelay = paras['tDelay']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpL = paras['KpL']
+    KiL = paras['KiL']
+    KpS = paras['KpS']
+    KiS = paras['KiS']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wcpll = paras['wcpll']
+    wc = paras['wc']
+    _t0 = numpy.cos(thetaPlant)
+    _t1 = numpy.sin(thetaPlant)
+    _t2 = -_t0*vbD - _t1*vbQ
+    _t3 = KpPLLplant*_t2
+    _t4 = mpPlant**(-1.0)
+    _t5 = -wcPlant
+    _t6 = numpy.cos(theta)
+    _t7 = numpy.sin(theta)
+    _t8 = _t6*iod - _t7*ioq
+    _t9 = _t6*ioq + _t7*iod
+    _t10 = -_t9
+    _t11 = _t6*vbD + _t7*vbQ
+    _t12 = -_t6*vbQ + _t7*vbD
+    _t13 = -_t12*wcPlant
+    _t14 = tDelay**(-1.0)
+    _t15 = KpPlantP*_t14
+    _t16 = -_t14
+    _t17 = KpPlantQ*_t14
+    _t18 = KiL*wbase
+    _t19 = KpL*wbase
+    _t20 = Rd*_t19
+    _t21 = -Rd
+    _t22 = KpL*wcpll
+    _t23 = Rd*_t22
+    _t24 = -wc
+    _t25 = iod*wc
+    _t26 = Rd*_t25
+    _t27 = ioq*wc
+    _t28 = Rd*_t27
+    _t29 = Rd*iod
+    _t30 = Rd*(iid - iod) + vcd
+    _t31 = Rd*ioq
+    _t32 = Rd*(iiq - ioq) + vcq
+    _t33 = mp**(-1.0)
+    _t34 = mq**(-1.0)
+    _t35 = 1/numpy.sqrt(_t30**2 + _t32**2)
+    _t36 = _t34*_t35
+    _t37 = _t30*_t36
+    _t38 = Rd*_t37
+    _t39 = _t32*_t36
+    _t40 = Rd*_t39
+    _t41 = KpS*_t33
+    _t42 = -KpS
+    _t43 = KpS*_t38
+    _t44 = KpS*_t40
+    _t45 = _t44 - 1
+    _t46 = KpS*_t37
+    _t47 = wbase/Lt
+    _t48 = KpC*_t47
+    _t49 = KpS*_t48
+    _t50 = -_t49
+    _t51 = KiS*_t48
+    _t52 = KiC*_t47
+    _t53 = Rd + Rt
+    _t54 = Lt*wset
+    _t55 = KpL*Rd
+    _t56 = KiL*epsilonPLL + KpL*_t32 + wset
+    _t57 = Lt*_t56
+    _t58 = Rd*_t47
+    _t59 = Lt*iid
+    _t60 = _t55*_t59
+    _t61 = wbase/Cf
+    _t62 = _t20*vcq
+    _t63 = Cf*_t55*vcd - 1
+    _t64 = -_t56*wbase
+    _t65 = wbase/Lc
+    _t66 = Rc + Rd
+    _t67 = KpL*Lc
+    _t68 = _t29*_t67
+    _t69 = KpPLLplant*wbase
+    _t70 = KpPLLplant*wcpllPlant
+    _t71 = 1/(mqPlant*numpy.sqrt(vbD**2 + vbQ**2))
+    _t72 = _t71*vbD
+    _t73 = _t71*vbQ
+    _t74 = _t8*wcPlant
+    _t75 = -_t6*_t65
+    _t76 = _t65*_t7
+    _t77 = -wbase
+    A = numpy.zeros((24, 24))
+    B = numpy.zeros((24, 2))
+    Bw = numpy.zeros((24, 1))
+    C = numpy.zeros((2, 24))
+    Cw = numpy.zeros((1, 24))
+    A[0, 0] = _t3*wbase
+    A[0, 1] = KiPLLplant*wbase
+    A[1, 0] = _t2
+    A[2, 0] = _t3*wcpllPlant
+    A[2, 1] = KiPLLplant*wcpllPlant
+    A[2, 2] = -wcpllPlant
+    A[3, 2] = -_t4
+    A[3, 5] = -1
+    A[4, 6] = -1
+    A[5, 5] = _t5
+    A[5, 9] = wcPlant*(_t10*vbD + _t8*vbQ)
+    A[5, 22] = _t11*wcPlant
+    A[5, 23] = _t13
+    A[6, 6] = _t5
+    A[6, 9] = wcPlant*(_t10*vbQ - _t8*vbD)
+    A[6, 22] = _t13
+    A[6, 23] = -_t11*wcPlant
+    A[7, 2] = -_t15*_t4
+    A[7, 3] = KiPlantP*_t14
+    A[7, 5] = -_t15
+    A[7, 7] = _t16
+    A[8, 4] = KiPlantQ*_t14
+    A[8, 6] = -_t17
+    A[8, 8] = _t16
+    A[9, 10] = _t18
+    A[9, 19] = _t20
+    A[9, 21] = _t19
+    A[9, 23] = -_t20
+    A[10, 19] = Rd
+    A[10, 21] = 1
+    A[10, 23] = _t21
+    A[11, 10] = KiL*wcpll
+    A[11, 11] = -wcpll
+    A[11, 19] = _t23
+    A[11, 21] = _t22
+    A[11, 23] = -_t23
+    A[12, 12] = _t24
+    A[12, 18] = _t26
+    A[12, 19] = _t28
+    A[12, 20] = _t25
+    A[12, 21] = _t27
+    A[12, 22] = wc*(-_t29 + _t30)
+    A[12, 23] = wc*(-_t31 + _t32)
+    A[13, 13] = _t24
+    A[13, 18] = -_t28
+    A[13, 19] = _t26
+    A[13, 20] = -_t27
+    A[13, 21] = _t25
+    A[13, 22] = wc*(_t31 + _t32)
+    A[13, 23] = wc*(-_t29 - _t30)
+    A[14, 7] = 1
+    A[14, 11] = -_t33
+    A[14, 12] = -1
+    A[15, 8] = -1
+    A[15, 13] = 1
+    A[15, 18] = _t38
+    A[15, 19] = _t40
+    A[15, 20] = _t37
+    A[15, 21] = _t39
+    A[15, 22] = -_t38
+    A[15, 23] = -_t40
+    A[16, 7] = KpS
+    A[16, 11] = -_t41
+    A[16, 12] = _t42
+    A[16, 14] = KiS
+    A[16, 18] = -1
+    A[17, 8] = _t42
+    A[17, 13] = KpS
+    A[17, 15] = KiS
+    A[17, 18] = _t43
+    A[17, 19] = _t45
+    A[17, 20] = _t46
+    A[17, 21] = KpS*_t39
+    A[17, 22] = -_t43
+    A[17, 23] = -_t44
+    A[18, 7] = _t49
+    A[18, 10] = _t18*iiq
+    A[18, 11] = -_t41*_t48
+    A[18, 12] = _t50
+    A[18, 14] = _t51
+    A[18, 16] = _t52
+    A[18, 18] = _t47*(-KpC - _t53)
+    A[18, 19] = _t47*(Lt*_t55*iiq - _t54 + _t57)
+    A[18, 20] = -_t47
+    A[18, 21] = _t19*iiq
+    A[18, 22] = _t58
+    A[18, 23] = -_t20*iiq
+    A[19, 8] = _t50
+    A[19, 10] = -_t18*iid
+    A[19, 13] = _t49
+    A[19, 15] = _t51
+    A[19, 17] = _t52
+    A[19, 18] = _t47*(KpC*_t43 + _t54 - _t57)
+    A[19, 19] = _t47*(KpC*_t45 - _t53 - _t60)
+    A[19, 20] = _t46*_t48
+    A[19, 21] = _t47*(KpC*KpS*_t32*_t34*_t35 - KpL*_t59 - 1)
+    A[19, 22] = -KpC*_t46*_t58
+    A[19, 23] = _t47*(-KpC*_t44 + Rd + _t60)
+    A[20, 10] = _t18*vcq
+    A[20, 18] = _t61
+    A[20, 19] = _t62
+    A[20, 21] = _t61*(Cf*KpL*vcq + Cf*_t56)
+    A[20, 22] = -_t61
+    A[20, 23] = -_t62
+    A[21, 10] = -_t18*vcd
+    A[21, 19] = -_t61*_t63
+    A[21, 20] = _t64
+    A[21, 21] = -_t19*vcd
+    A[21, 23] = _t61*_t63
+    A[22, 9] = _t12*_t65
+    A[22, 10] = _t18*ioq
+    A[22, 18] = Rd*_t65
+    A[22, 19] = _t19*_t31
+    A[22, 20] = _t65
+    A[22, 21] = _t19*ioq
+    A[22, 22] = -_t65*_t66
+    A[22, 23] = _t65*(Lc*_t56 - _t31*_t67)
+    A[23, 9] = _t11*_t65
+    A[23, 10] = -_t18*iod
+    A[23, 19] = _t65*(-_t21 - _t68)
+    A[23, 21] = _t65*(-_t67*iod + 1)
+    A[23, 22] = _t64
+    A[23, 23] = _t65*(-_t66 + _t68)
+    B[0, 0] = -_t1*_t69
+    B[0, 1] = _t0*_t69
+    B[1, 0] = -_t1
+    B[1, 1] = _t0
+    B[2, 0] = -_t1*_t70
+    B[2, 1] = _t0*_t70
+    B[4, 0] = -_t72
+    B[4, 1] = -_t73
+    B[5, 0] = _t74
+    B[5, 1] = _t9*wcPlant
+    B[6, 0] = _t10*wcPlant
+    B[6, 1] = _t74
+    B[8, 0] = -_t17*_t72
+    B[8, 1] = -_t17*_t73
+    B[22, 0] = _t75
+    B[22, 1] = -_t76
+    B[23, 0] = _t76
+    B[23, 1] = _t75
+    Bw[0, 0] = _t77
+    Bw[9, 0] = _t77
+    C[0, 9] = _t10
+    C[0, 22] = _t6
+    C[0, 23] = -_t7
+    C[1, 9] = _t8
+    C[1, 22] = _t7
+    C[1, 23] = _t6
+    Cw[0, 10] = KiL
+    Cw[0, 19] = _t55
+    Cw[0, 21] = KpL
+    Cw[0, 23] = -_t55
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_gflPlant_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    PsetPlant = numpy.asarray(paras['PsetPlant'], dtype=float)
+    QsetPlant = numpy.asarray(paras['QsetPlant'], dtype=float)
+    wsetPlant = numpy.asarray(paras['wsetPlant'], dtype=float)
+    VsetPlant = numpy.asarray(paras['VsetPlant'], dtype=float)
+    mpPlant = numpy.asarray(paras['mpPlant'], dtype=float)
+    mqPlant = numpy.asarray(paras['mqPlant'], dtype=float)
+    KpPLLplant = numpy.asarray(paras['KpPLLplant'], dtype=float)
+    KiPLLplant = numpy.asarray(paras['KiPLLplant'], dtype=float)
+    KpPlantP = numpy.asarray(paras['KpPlantP'], dtype=float)
+    KiPlantP = numpy.asarray(paras['KiPlantP'], dtype=float)
+    KpPlantQ = numpy.asarray(paras['KpPlantQ'], dtype=float)
+    KiPlantQ = numpy.asarray(paras['KiPlantQ'], dtype=float)
+    wcpllPlant = numpy.asarray(paras['wcpllPlant'], dtype=float)
+    wcPlant = numpy.asarray(paras['wcPlant'], dtype=float)
+    tDelay = numpy.asarray(paras['tDelay'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rt = numpy.asarray(paras['Rt'], dtype=float)
+    Lt = numpy.asarray(paras['Lt'], dtype=float)
+    Rd = numpy.asarray(paras['Rd'], dtype=float)
+    Cf = numpy.asarray(paras['Cf'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    KpL = numpy.asarray(paras['KpL'], dtype=float)
+    KiL = numpy.asarray(paras['KiL'], dtype=float)
+    KpS = numpy.asarray(paras['KpS'], dtype=float)
+    KiS = numpy.asarray(paras['KiS'], dtype=float)
+    KpC = numpy.asarray(paras['KpC'], dtype=float)
+    KiC = numpy.asarray(paras['KiC'], dtype=float)
+    wcpll = numpy.asarray(paras['wcpll'], dtype=float)
+    wc = numpy.asarray(paras['wc'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(thetaPlant), numpy.shape(epsilonPLLPlant), numpy.shape(wPlant), numpy.shape(epsilonP), numpy.shape(epsilonQ), numpy.shape(PoPlant), numpy.shape(QoPlant), numpy.shape(PsetDelay), numpy.shape(QsetDelay), numpy.shape(theta), numpy.shape(epsilonPLL), numpy.shape(wf), numpy.shape(Po), numpy.shape(Qo), numpy.shape(phid), numpy.shape(phiq), numpy.shape(gammad), numpy.shape(gammaq), numpy.shape(iid), numpy.shape(iiq), numpy.shape(vcd), numpy.shape(vcq), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(PsetPlant), numpy.shape(QsetPlant), numpy.shape(wsetPlant), numpy.shape(VsetPlant), numpy.shape(mpPlant), numpy.shape(mqPlant), numpy.shape(KpPLLplant), numpy.shape(KiPLLplant), numpy.shape(KpPlantP), numpy.shape(KiPlantP), numpy.shape(KpPlantQ), numpy.shape(KiPlantQ), numpy.shape(wcpllPlant), numpy.shape(wcPlant), numpy.shape(tDelay), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rt), numpy.shape(Lt), numpy.shape(Rd), numpy.shape(Cf), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(KpL), numpy.shape(KiL), numpy.shape(KpS), numpy.shape(KiS), numpy.shape(KpC), numpy.shape(KiC), numpy.shape(wcpll), numpy.shape(wc))
+    _t0 = numpy.cos(thetaPlant)
+    _t1 = numpy.sin(thetaPlant)
+    _t2 = -_t0*vbD - _t1*vbQ
+    _t3 = KpPLLplant*_t2
+    _t4 = mpPlant**(-1.0)
+    _t5 = -wcPlant
+    _t6 = numpy.cos(theta)
+    _t7 = numpy.sin(theta)
+    _t8 = _t6*iod - _t7*ioq
+    _t9 = _t6*ioq + _t7*iod
+    _t10 = -_t9
+    _t11 = _t6*vbD + _t7*vbQ
+    _t12 = -_t6*vbQ + _t7*vbD
+    _t13 = -_t12*wcPlant
+    _t14 = tDelay**(-1.0)
+    _t15 = KpPlantP*_t14
+    _t16 = -_t14
+    _t17 = KpPlantQ*_t14
+    _t18 = KiL*wbase
+    _t19 = KpL*wbase
+    _t20 = Rd*_t19
+    _t21 = -Rd
+    _t22 = KpL*wcpll
+    _t23 = Rd*_t22
+    _t24 = -wc
+    _t25 = iod*wc
+    _t26 = Rd*_t25
+    _t27 = ioq*wc
+    _t28 = Rd*_t27
+    _t29 = Rd*iod
+    _t30 = Rd*(iid - iod) + vcd
+    _t31 = Rd*ioq
+    _t32 = Rd*(iiq - ioq) + vcq
+    _t33 = mp**(-1.0)
+    _t34 = mq**(-1.0)
+    _t35 = 1/numpy.sqrt(_t30**2 + _t32**2)
+    _t36 = _t34*_t35
+    _t37 = _t30*_t36
+    _t38 = Rd*_t37
+    _t39 = _t32*_t36
+    _t40 = Rd*_t39
+    _t41 = KpS*_t33
+    _t42 = -KpS
+    _t43 = KpS*_t38
+    _t44 = KpS*_t40
+    _t45 = _t44 - 1
+    _t46 = KpS*_t37
+    _t47 = wbase/Lt
+    _t48 = KpC*_t47
+    _t49 = KpS*_t48
+    _t50 = -_t49
+    _t51 = KiS*_t48
+    _t52 = KiC*_t47
+    _t53 = Rd + Rt
+    _t54 = Lt*wset
+    _t55 = KpL*Rd
+    _t56 = KiL*epsilonPLL + KpL*_t32 + wset
+    _t57 = Lt*_t56
+    _t58 = Rd*_t47
+    _t59 = Lt*iid
+    _t60 = _t55*_t59
+    _t61 = wbase/Cf
+    _t62 = _t20*vcq
+    _t63 = Cf*_t55*vcd - 1
+    _t64 = -_t56*wbase
+    _t65 = wbase/Lc
+    _t66 = Rc + Rd
+    _t67 = KpL*Lc
+    _t68 = _t29*_t67
+    _t69 = KpPLLplant*wbase
+    _t70 = KpPLLplant*wcpllPlant
+    _t71 = 1/(mqPlant*numpy.sqrt(vbD**2 + vbQ**2))
+    _t72 = _t71*vbD
+    _t73 = _t71*vbQ
+    _t74 = _t8*wcPlant
+    _t75 = -_t6*_t65
+    _t76 = _t65*_t7
+    _t77 = -wbase
+    A = numpy.zeros(batch + (24, 24))
+    B = numpy.zeros(batch + (24, 2))
+    Bw = numpy.zeros(batch + (24, 1))
+    C = numpy.zeros(batch + (2, 24))
+    Cw = numpy.zeros(batch + (1, 24))
+    A[..., 0, 0] = _t3*wbase
+    A[..., 0, 1] = KiPLLplant*wbase
+    A[..., 1, 0] = _t2
+    A[..., 2, 0] = _t3*wcpllPlant
+    A[..., 2, 1] = KiPLLplant*wcpllPlant
+    A[..., 2, 2] = -wcpllPlant
+    A[..., 3, 2] = -_t4
+    A[..., 3, 5] = -1
+    A[..., 4, 6] = -1
+    A[..., 5, 5] = _t5
+    A[..., 5, 9] = wcPlant*(_t10*vbD + _t8*vbQ)
+    A[..., 5, 22] = _t11*wcPlant
+    A[..., 5, 23] = _t13
+    A[..., 6, 6] = _t5
+    A[..., 6, 9] = wcPlant*(_t10*vbQ - _t8*vbD)
+    A[..., 6, 22] = _t13
+    A[..., 6, 23] = -_t11*wcPlant
+    A[..., 7, 2] = -_t15*_t4
+    A[..., 7, 3] = KiPlantP*_t14
+    A[..., 7, 5] = -_t15
+    A[..., 7, 7] = _t16
+    A[..., 8, 4] = KiPlantQ*_t14
+    A[..., 8, 6] = -_t17
+    A[..., 8, 8] = _t16
+    A[..., 9, 10] = _t18
+    A[..., 9, 19] = _t20
+    A[..., 9, 21] = _t19
+    A[..., 9, 23] = -_t20
+    A[..., 10, 19] = Rd
+    A[..., 10, 21] = 1
+    A[..., 10, 23] = _t21
+    A[..., 11, 10] = KiL*wcpll
+    A[..., 11, 11] = -wcpll
+    A[..., 11, 19] = _t23
+    A[..., 11, 21] = _t22
+    A[..., 11, 23] = -_t23
+    A[..., 12, 12] = _t24
+    A[..., 12, 18] = _t26
+    A[..., 12, 19] = _t28
+    A[..., 12, 20] = _t25
+    A[..., 12, 21] = _t27
+    A[..., 12, 22] = wc*(-_t29 + _t30)
+    A[..., 12, 23] = wc*(-_t31 + _t32)
+    A[..., 13, 13] = _t24
+    A[..., 13, 18] = -_t28
+    A[..., 13, 19] = _t26
+    A[..., 13, 20] = -_t27
+    A[..., 13, 21] = _t25
+    A[..., 13, 22] = wc*(_t31 + _t32)
+    A[..., 13, 23] = wc*(-_t29 - _t30)
+    A[..., 14, 7] = 1
+    A[..., 14, 11] = -_t33
+    A[..., 14, 12] = -1
+    A[..., 15, 8] = -1
+    A[..., 15, 13] = 1
+    A[..., 15, 18] = _t38
+    A[..., 15, 19] = _t40
+    A[..., 15, 20] = _t37
+    A[..., 15, 21] = _t39
+    A[..., 15, 22] = -_t38
+    A[..., 15, 23] = -_t40
+    A[..., 16, 7] = KpS
+    A[..., 16, 11] = -_t41
+    A[..., 16, 12] = _t42
+    A[..., 16, 14] = KiS
+    A[..., 16, 18] = -1
+    A[..., 17, 8] = _t42
+    A[..., 17, 13] = KpS
+    A[..., 17, 15] = KiS
+    A[..., 17, 18] = _t43
+    A[..., 17, 19] = _t45
+    A[..., 17, 20] = _t46
+    A[..., 17, 21] = KpS*_t39
+    A[..., 17, 22] = -_t43
+    A[..., 17, 23] = -_t44
+    A[..., 18, 7] = _t49
+    A[..., 18, 10] = _t18*iiq
+    A[..., 18, 11] = -_t41*_t48
+    A[..., 18, 12] = _t50
+    A[..., 18, 14] = _t51
+    A[..., 18, 16] = _t52
+    A[..., 18, 18] = _t47*(-KpC - _t53)
+    A[..., 18, 19] = _t47*(Lt*_t55*iiq - _t54 + _t57)
+    A[..., 18, 20] = -_t47
+    A[..., 18, 21] = _t19*iiq
+    A[..., 18, 22] = _t58
+    A[..., 18, 23] = -_t20*iiq
+    A[..., 19, 8] = _t50
+    A[..., 19, 10] = -_t18*iid
+    A[..., 19, 13] = _t49
+    A[..., 19, 15] = _t51
+    A[..., 19, 17] = _t52
+    A[..., 19, 18] = _t47*(KpC*_t43 + _t54 - _t57)
+    A[..., 19, 19] = _t47*(KpC*_t45 - _t53 - _t60)
+    A[..., 19, 20] = _t46*_t48
+    A[..., 19, 21] = _t47*(KpC*KpS*_t32*_t34*_t35 - KpL*_t59 - 1)
+    A[..., 19, 22] = -KpC*_t46*_t58
+    A[..., 19, 23] = _t47*(-KpC*_t44 + Rd + _t60)
+    A[..., 20, 10] = _t18*vcq
+    A[..., 20, 18] = _t61
+    A[..., 20, 19] = _t62
+    A[..., 20, 21] = _t61*(Cf*KpL*vcq + Cf*_t56)
+    A[..., 20, 22] = -_t61
+    A[..., 20, 23] = -_t62
+    A[..., 21, 10] = -_t18*vcd
+    A[..., 21, 19] = -_t61*_t63
+    A[..., 21, 20] = _t64
+    A[..., 21, 21] = -_t19*vcd
+    A[..., 21, 23] = _t61*_t63
+    A[..., 22, 9] = _t12*_t65
+    A[..., 22, 10] = _t18*ioq
+    A[..., 22, 18] = Rd*_t65
+    A[..., 22, 19] = _t19*_t31
+    A[..., 22, 20] = _t65
+    A[..., 22, 21] = _t19*ioq
+    A[..., 22, 22] = -_t65*_t66
+    A[..., 22, 23] = _t65*(Lc*_t56 - _t31*_t67)
+    A[..., 23, 9] = _t11*_t65
+    A[..., 23, 10] = -_t18*iod
+    A[..., 23, 19] = _t65*(-_t21 - _t68)
+    A[..., 23, 21] = _t65*(-_t67*iod + 1)
+    A[..., 23, 22] = _t64
+    A[..., 23, 23] = _t65*(-_t66 + _t68)
+    B[..., 0, 0] = -_t1*_t69
+    B[..., 0, 1] = _t0*_t69
+    B[..., 1, 0] = -_t1
+    B[..., 1, 1] = _t0
+    B[..., 2, 0] = -_t1*_t70
+    B[..., 2, 1] = _t0*_t70
+    B[..., 4, 0] = -_t72
+    B[..., 4, 1] = -_t73
+    B[..., 5, 0] = _t74
+    B[..., 5, 1] = _t9*wcPlant
+    B[..., 6, 0] = _t10*wcPlant
+    B[..., 6, 1] = _t74
+    B[..., 8, 0] = -_t17*_t72
+    B[..., 8, 1] = -_t17*_t73
+    B[..., 22, 0] = _t75
+    B[..., 22, 1] = -_t76
+    B[..., 23, 0] = _t76
+    B[..., 23, 1] = _t75
+    Bw[..., 0, 0] = _t77
+    Bw[..., 9, 0] = _t77
+    C[..., 0, 9] = _t10
+    C[..., 0, 22] = _t6
+    C[..., 0, 23] = -_t7
+    C[..., 1, 9] = _t8
+    C[..., 1, 22] = _t7
+    C[..., 1, 23] = _t6
+    Cw[..., 0, 10] = KiL
+    Cw[..., 0, 19] = _t55
+    Cw[..., 0, 21] = KpL
+    Cw[..., 0, 23] = -_t55
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_gflPlant(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    PsetPlant = paras['PsetPlant']
+    QsetPlant = paras['QsetPlant']
+    wsetPlant = paras['wsetPlant']
+    VsetPlant = paras['VsetPlant']
+    mpPlant = paras['mpPlant']
+    mqPlant = paras['mqPlant']
+    KpPLLplant = paras['KpPLLplant']
+    KiPLLplant = paras['KiPLLplant']
+    KpPlantP = paras['KpPlantP']
+    KiPlantP = paras['KiPlantP']
+    KpPlantQ = paras['KpPlantQ']
+    KiPlantQ = paras['KiPlantQ']
+    wcpllPlant = paras['wcpllPlant']
+    wcPlant = paras['wcPlant']
+    tDelay = paras['tDelay']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    KpL = paras['KpL']
+    KiL = paras['KiL']
+    KpS = paras['KpS']
+    KiS = paras['KiS']
+    KpC = paras['KpC']
+    KiC = paras['KiC']
+    wcpll = paras['wcpll']
+    wc = paras['wc']
+    _t0 = -wcom
+    _t1 = -vbD*numpy.sin(thetaPlant) + vbQ*numpy.cos(thetaPlant)
+    _t2 = KiPLLplant*epsilonPLLPlant + KpPLLplant*_t1 + wsetPlant
+    _t3 = -PoPlant + PsetPlant + (-wPlant + wsetPlant)/mpPlant
+    _t4 = -QoPlant + QsetPlant + (VsetPlant - numpy.sqrt(vbD**2 + vbQ**2))/mqPlant
+    _t5 = numpy.sin(theta)
+    _t6 = numpy.cos(theta)
+    _t7 = _t5*iod + _t6*ioq
+    _t8 = -_t5*ioq + _t6*iod
+    _t9 = tDelay**(-1.0)
+    _t10 = Rd*(iiq - ioq)
+    _t11 = _t10 + vcq
+    _t12 = KiL*epsilonPLL + KpL*_t11 + wset
+    _t13 = iid - iod
+    _t14 = Rd*_t13 + vcd
+    _t15 = -Po + PsetDelay + (-wf + wset)/mp
+    _t16 = Qo - QsetDelay - (Vset - numpy.sqrt(_t11**2 + _t14**2))/mq
+    _t17 = KiS*phid + KpS*_t15 - iid
+    _t18 = -iiq
+    _t19 = KiS*phiq + KpS*_t16 + _t18
+    _t20 = wbase/Lt
+    _t21 = Cf*_t12
+    _t22 = wbase/Cf
+    _t23 = Lc*_t12
+    _t24 = wbase/Lc
+    f = [wbase*(_t0 + _t2), _t1, _t2*wcpllPlant - wPlant*wcpllPlant, _t3, _t4, -PoPlant*wcPlant + wcPlant*(_t7*vbQ + _t8*vbD), -QoPlant*wcPlant + wcPlant*(-_t7*vbD + _t8*vbQ), _t9*(KiPlantP*epsilonP + KpPlantP*_t3 - PsetDelay + PsetPlant), _t9*(KiPlantQ*epsilonQ + KpPlantQ*_t4 - QsetDelay + QsetPlant), wbase*(_t0 + _t12), _t11, _t12*wcpll - wcpll*wf, -Po*wc + wc*(_t11*ioq + _t14*iod), -Qo*wc + wc*(_t11*iod - _t14*ioq), _t15, _t16, _t17, _t19, _t20*(KiC*gammad + KpC*_t17 + Lt*_t12*iiq - Lt*iiq*wset - Rt*iid - _t14), _t20*(KiC*gammaq + KpC*_t19 - Lt*_t12*iid + Lt*iid*wset - Rt*iiq - _t11), _t22*(_t13 + _t21*vcq), _t22*(-_t18 - _t21*vcd - ioq), _t24*(-Rc*iod + _t14 + _t23*ioq - _t5*vbQ - _t6*vbD), _t24*(-Rc*ioq + _t10 - _t23*iod + _t5*vbD - _t6*vbQ + vcq)]
+    y = [_t8, _t7]
+    w = [_t12]
+    return {'f': f, 'y': y, 'w': w}
@@ -0,0 +1,68 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_line_symbolic() in lib/ssmodel_line.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = '2f1294d81ca2d5857c66a5fa0499eae2f3881cebcba6af9d7649e9fd6bc7c6ad'
+PARAS = ('Rline', 'Lline')
+SHAPES = {'A': (2, 2), 'B1': (2, 2), 'B2': (2, 2), 'Bw': (2, 1)}
+
+def jac_line(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    ilineD, ilineQ, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD1, vbQ1, vbD2, vbQ2, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    Rline = paras['Rline']
+    Lline = paras['Lline']
+    _t0 = wbase/Lline
+    _t1 = -Rline*_t0
+    _t2 = wbase*wcom
+    _t3 = -_t0
+    A = numpy.zeros((2, 2))
+    B1 = numpy.zeros((2, 2))
+    B2 = numpy.zeros((2, 2))
+    Bw = numpy.zeros((2, 1))
+    A[0, 0] = _t1
+    A[0, 1] = _t2
+    A[1, 0] = -_t2
+    A[1, 1] = _t1
+    B1[0, 0] = _t0
+    B1[1, 1] = _t0
+    B2[0, 0] = _t3
+    B2[1, 1] = _t3
+    Bw[0, 0] = ilineQ*wbase
+    Bw[1, 0] = -ilineD*wbase
+    return {'A': A, 'B1': B1, 'B2': B2, 'Bw': Bw}
+
+def jac_line_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    ilineD, ilineQ, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD1, vbQ1, vbD2, vbQ2, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    Rline = numpy.asarray(paras['Rline'], dtype=float)
+    Lline = numpy.asarray(paras['Lline'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(ilineD), numpy.shape(ilineQ), numpy.shape(vbD1), numpy.shape(vbQ1), numpy.shape(vbD2), numpy.shape(vbQ2), numpy.shape(wcom), numpy.shape(Rline), numpy.shape(Lline))
+    _t0 = wbase/Lline
+    _t1 = -Rline*_t0
+    _t2 = wbase*wcom
+    _t3 = -_t0
+    A = numpy.zeros(batch + (2, 2))
+    B1 = numpy.zeros(batch + (2, 2))
+    B2 = numpy.zeros(batch + (2, 2))
+    Bw = numpy.zeros(batch + (2, 1))
+    A[..., 0, 0] = _t1
+    A[..., 0, 1] = _t2
+    A[..., 1, 0] = -_t2
+    A[..., 1, 1] = _t1
+    B1[..., 0, 0] = _t0
+    B1[..., 1, 1] = _t0
+    B2[..., 0, 0] = _t3
+    B2[..., 1, 1] = _t3
+    Bw[..., 0, 0] = ilineQ*wbase
+    Bw[..., 1, 0] = -ilineD*wbase
+    return {'A': A, 'B1': B1, 'B2': B2, 'Bw': Bw}
+
+def rhs_line(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    ilineD, ilineQ, = steadyStateValuesX
+    vbD1, vbQ1, vbD2, vbQ2, wcom, = steadyStateValuesU
+    Rline = paras['Rline']
+    Lline = paras['Lline']
+    _t0 = Lline*wcom
+    _t1 = wbase/Lline
+    f = [_t1*(-Rline*ilineD + _t0*ilineQ + vbD1 - vbD2), _t1*(-Rline*ilineQ - _t0*ilineD + vbQ1 - vbQ2)]
+    return {'f': f}
@@ -0,0 +1,60 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_load_symbolic() in lib/ssmodel_load.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = 'cf2e35c8fc42d1101e6b78b63d127dcd571f554ff1861c69d87a1164a563155e'
+PARAS = ('Rload', 'Lload')
+SHAPES = {'A': (2, 2), 'B': (2, 2), 'Bw': (2, 1)}
+
+def jac_load(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    iloadD, iloadQ, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    Rload = paras['Rload']
+    Lload = paras['Lload']
+    _t0 = wbase/Lload
+    _t1 = -Rload*_t0
+    _t2 = wbase*wcom
+    A = numpy.zeros((2, 2))
+    B = numpy.zeros((2, 2))
+    Bw = numpy.zeros((2, 1))
+    A[0, 0] = _t1
+    A[0, 1] = _t2
+    A[1, 0] = -_t2
+    A[1, 1] = _t1
+    B[0, 0] = _t0
+    B[1, 1] = _t0
+    Bw[0, 0] = iloadQ*wbase
+    Bw[1, 0] = -iloadD*wbase
+    return {'A': A, 'B': B, 'Bw': Bw}
+
+def jac_load_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    iloadD, iloadQ, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    Rload = numpy.asarray(paras['Rload'], dtype=float)
+    Lload = numpy.asarray(paras['Lload'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(iloadD), numpy.shape(iloadQ), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(Rload), numpy.shape(Lload))
+    _t0 = wbase/Lload
+    _t1 = -Rload*_t0
+    _t2 = wbase*wcom
+    A = numpy.zeros(batch + (2, 2))
+    B = numpy.zeros(batch + (2, 2))
+    Bw = numpy.zeros(batch + (2, 1))
+    A[..., 0, 0] = _t1
+    A[..., 0, 1] = _t2
+    A[..., 1, 0] = -_t2
+    A[..., 1, 1] = _t1
+    B[..., 0, 0] = _t0
+    B[..., 1, 1] = _t0
+    Bw[..., 0, 0] = iloadQ*wbase
+    Bw[..., 1, 0] = -iloadD*wbase
+    return {'A': A, 'B': B, 'Bw': Bw}
+
+def rhs_load(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    iloadD, iloadQ, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    Rload = paras['Rload']
+    Lload = paras['Lload']
+    _t0 = Lload*wcom
+    _t1 = wbase/Lload
+    f = [_t1*(-Rload*iloadD + _t0*iloadQ + vbD), _t1*(-Rload*iloadQ - _t0*iloadD + vbQ)]
+    return {'f': f}
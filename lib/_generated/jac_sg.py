@@ -0,0 +1,447 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_sg_symbolic() in lib/ssmodel_sg.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = '8749e2bb17e2a5942034c172cefa86c388892ab864d0be6642a696cc913fae7f'
+PARAS = ('wset', 'Pset', 'Vset', 'Rs', 'Ld', 'Ld1', 'Ld2', 'Lq', 'Lq1', 'Lq2', 'Ll', 'Tdo1', 'Tqo1', 'Tdo2', 'Tqo2', 'H', 'D', 'Kg', 'T1', 'T2', 'T3', 'T4', 'T5', 'K1', 'K2', 'Ta', 'Tb', 'Ke', 'Te')
+SHAPES = {'A': (14, 14), 'B': (14, 2), 'Bw': (14, 1), 'C': (2, 14), 'Cw': (14, 1)}
+
+def jac_sg(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, wr, psid, psiq, Eq1, Ed1, psi1d, psi2q, P1, Pg, Pf, P2, vx, Efd, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    wset = paras['wset']
+    Pset = paras['Pset']
+    Vset = paras['Vset']
+    Rs = paras['Rs']
+    Ld = paras['Ld']
+    Ld1 = paras['Ld1']
+    Ld2 = paras['Ld2']
+    Lq = paras['Lq']
+    Lq1 = paras['Lq1']
+    Lq2 = paras['Lq2']
+    Ll = paras['Ll']
+    Tdo1 = paras['Tdo1']
+    Tqo1 = paras['Tqo1']
+    Tdo2 = paras['Tdo2']
+    Tqo2 = paras['Tqo2']
+    H = paras['H']
+    D = paras['D']
+    Kg = paras['Kg']
+    T1 = paras['T1']
+    T2 = paras['T2']
+    T3 = paras['T3']
+    T4 = paras['T4']
+    T5 = paras['T5']
+    K1 = paras['K1']
+    K2 = paras['K2']
+    Ta = paras['Ta']
+    Tb = paras['Tb']
+    Ke = paras['Ke']
+    Te = paras['Te']
+    _t0 = (1/2)/H
+    _t1 = Ld2**(-1.0)
+    _t2 = _t1*psiq
+    _t3 = Lq2**(-1.0)
+    _t4 = -Lq2
+    _t5 = -Ll - _t4
+    _t6 = -Lq1
+    _t7 = -Ll - _t6
+    _t8 = _t7**(-1.0)
+    _t9 = _t5*_t8
+    _t10 = Lq1 + _t4
+    _t11 = _t3*(-Ed1*_t9 + _t10*_t8*psi2q - psiq)
+    _t12 = _t3*psid
+    _t13 = -Ll
+    _t14 = Ld2 + _t13
+    _t15 = Ld1 + _t13
+    _t16 = _t15**(-1.0)
+    _t17 = _t14*_t16
+    _t18 = Ld1 - Ld2
+    _t19 = _t16*_t18
+    _t20 = Eq1*_t17 + _t19*psi1d - psid
+    _t21 = _t1*_t20
+    _t22 = _t0*_t2
+    _t23 = _t0*_t12
+    _t24 = _t0/wr
+    _t25 = numpy.sin(theta)
+    _t26 = _t25*vbD
+    _t27 = numpy.cos(theta)
+    _t28 = -_t26 + _t27*vbQ
+    _t29 = Rs*wbase
+    _t30 = wbase*wr
+    _t31 = _t1*_t14*_t16
+    _t32 = _t1*_t18
+    _t33 = _t16*_t32
+    _t34 = _t27*vbD
+    _t35 = _t25*vbQ
+    _t36 = _t34 + _t35
+    _t37 = _t3*_t5
+    _t38 = _t37*_t8
+    _t39 = _t10*_t3
+    _t40 = _t39*_t8
+    _t41 = Ld - Ld1
+    _t42 = Tdo1**(-1.0)
+    _t43 = _t41*_t42
+    _t44 = -_t1*_t14 + 1
+    _t45 = _t18/_t15**2
+    _t46 = _t32 + 1
+    _t47 = -_t10*_t3*_t8
+    _t48 = Lq + _t6
+    _t49 = Tqo1**(-1.0)
+    _t50 = _t48*_t49
+    _t51 = 1 - _t37
+    _t52 = _t10/_t7**2
+    _t53 = _t39 + 1
+    _t54 = Tdo2**(-1.0)
+    _t55 = Tqo2**(-1.0)
+    _t56 = T1**(-1.0)
+    _t57 = Kg*T2*_t56
+    _t58 = T3**(-1.0)
+    _t59 = -_t58
+    _t60 = T4**(-1.0)
+    _t61 = T5**(-1.0)
+    _t62 = Tb**(-1.0)
+    _t63 = 1/numpy.sqrt(_t28**2 + _t36**2)
+    _t64 = _t63*((1/2)*_t28*(-2*_t34 - 2*_t35) + (1/2)*_t36*(-2*_t26 + 2*_t27*vbQ))
+    _t65 = Ta*_t62
+    _t66 = _t64*_t65
+    _t67 = Te**(-1.0)
+    _t68 = Ke*_t67
+    _t69 = _t27*wbase
+    _t70 = _t25*wbase
+    _t71 = _t63*(-_t25*_t28 + _t27*_t36)
+    _t72 = _t65*_t71
+    _t73 = _t63*(_t25*_t36 + _t27*_t28)
+    _t74 = _t65*_t73
+    A = numpy.zeros((14, 14))
+    B = numpy.zeros((14, 2))
+    Bw = numpy.zeros((14, 1))
+    C = numpy.zeros((2, 14))
+    Cw = numpy.zeros((14, 1))
+    A[0, 1] = wbase
+    A[1, 1] = _t0*(-D - (K1*Pf + P2)/wr**2)
+    A[1, 2] = _t0*(-_t11 - _t2)
+    A[1, 3] = _t0*(_t12 + _t21)
+    A[1, 4] = _t17*_t22
+    A[1, 5] = _t23*_t9
+    A[1, 6] = _t19*_t22
+    A[1, 7] = -_t10*_t23*_t8
+    A[1, 10] = K1*_t24
+    A[1, 11] = _t24
+    A[2, 0] = _t28*wbase
+    A[2, 1] = psiq*wbase
+    A[2, 2] = -_t1*_t29
+    A[2, 3] = _t30
+    A[2, 4] = _t29*_t31
+    A[2, 6] = _t29*_t33
+    A[3, 0] = -_t36*wbase
+    A[3, 1] = -psid*wbase
+    A[3, 2] = -_t30
+    A[3, 3] = -_t29*_t3
+    A[3, 5] = -_t29*_t38
+    A[3, 7] = _t29*_t40
+    A[4, 2] = -_t43*(-_t1 + _t33)
+    A[4, 4] = _t42*(-_t41*(_t1*_t14*_t16 + _t44*_t45) - 1)
+    A[4, 6] = -_t43*(_t1*_t16*_t18 - _t45*_t46)
+    A[4, 13] = _t42
+    A[5, 3] = _t50*(-_t3 - _t47)
+    A[5, 5] = _t49*(_t48*(-_t38 - _t51*_t52) - 1)
+    A[5, 7] = _t50*(-_t47 - _t52*_t53)
+    A[6, 2] = _t1*_t15*_t54
+    A[6, 4] = _t44*_t54
+    A[6, 6] = -_t46*_t54
+    A[7, 3] = _t3*_t55*_t7
+    A[7, 5] = -_t51*_t55
+    A[7, 7] = -_t53*_t55
+    A[8, 1] = _t56*(Kg - _t57)
+    A[8, 8] = -_t56
+    A[9, 1] = -_t57*_t58
+    A[9, 8] = _t59
+    A[9, 9] = _t59
+    A[10, 9] = _t60
+    A[10, 10] = -_t60
+    A[11, 10] = K2*_t61
+    A[11, 11] = -_t61
+    A[12, 0] = _t62*(-_t64 + _t66)
+    A[12, 12] = -_t62
+    A[13, 0] = -_t66*_t68
+    A[13, 12] = _t68
+    A[13, 13] = -_t67
+    B[2, 0] = _t69
+    B[2, 1] = _t70
+    B[3, 0] = -_t70
+    B[3, 1] = _t69
+    B[12, 0] = _t62*(-_t71 + _t72)
+    B[12, 1] = _t62*(-_t73 + _t74)
+    B[13, 0] = -_t68*_t72
+    B[13, 1] = -_t68*_t74
+    Bw[0, 0] = -wbase
+    C[0, 0] = -_t11*_t27 - _t21*_t25
+    C[0, 2] = -_t1*_t27
+    C[0, 3] = _t25*_t3
+    C[0, 4] = _t27*_t31
+    C[0, 5] = _t25*_t38
+    C[0, 6] = _t27*_t33
+    C[0, 7] = -_t25*_t40
+    C[1, 0] = _t1*_t20*_t27 - _t11*_t25
+    C[1, 2] = -_t1*_t25
+    C[1, 3] = -_t27*_t3
+    C[1, 4] = _t25*_t31
+    C[1, 5] = -_t27*_t38
+    C[1, 6] = _t25*_t33
+    C[1, 7] = _t27*_t40
+    Cw[1, 0] = 1
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_sg_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, wr, psid, psiq, Eq1, Ed1, psi1d, psi2q, P1, Pg, Pf, P2, vx, Efd, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Pset = numpy.asarray(paras['Pset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rs = numpy.asarray(paras['Rs'], dtype=float)
+    Ld = numpy.asarray(paras['Ld'], dtype=float)
+    Ld1 = numpy.asarray(paras['Ld1'], dtype=float)
+    Ld2 = numpy.asarray(paras['Ld2'], dtype=float)
+    Lq = numpy.asarray(paras['Lq'], dtype=float)
+    Lq1 = numpy.asarray(paras['Lq1'], dtype=float)
+    Lq2 = numpy.asarray(paras['Lq2'], dtype=float)
+    Ll = numpy.asarray(paras['Ll'], dtype=float)
+    Tdo1 = numpy.asarray(paras['Tdo1'], dtype=float)
+    Tqo1 = numpy.asarray(paras['Tqo1'], dtype=float)
+    Tdo2 = numpy.asarray(paras['Tdo2'], dtype=float)
+    Tqo2 = numpy.asarray(paras['Tqo2'], dtype=float)
+    H = numpy.asarray(paras['H'], dtype=float)
+    D = numpy.asarray(paras['D'], dtype=float)
+    Kg = numpy.asarray(paras['Kg'], dtype=float)
+    T1 = numpy.asarray(paras['T1'], dtype=float)
+    T2 = numpy.asarray(paras['T2'], dtype=float)
+    T3 = numpy.asarray(paras['T3'], dtype=float)
+    T4 = numpy.asarray(paras['T4'], dtype=float)
+    T5 = numpy.asarray(paras['T5'], dtype=float)
+    K1 = numpy.asarray(paras['K1'], dtype=float)
+    K2 = numpy.asarray(paras['K2'], dtype=float)
+    Ta = numpy.asarray(paras['Ta'], dtype=float)
+    Tb = numpy.asarray(paras['Tb'], dtype=float)
+    Ke = numpy.asarray(paras['Ke'], dtype=float)
+    Te = numpy.asarray(paras['Te'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(theta), numpy.shape(wr), numpy.shape(psid), numpy.shape(psiq), numpy.shape(Eq1), numpy.shape(Ed1), numpy.shape(psi1d), numpy.shape(psi2q), numpy.shape(P1), numpy.shape(Pg), numpy.shape(Pf), numpy.shape(P2), numpy.shape(vx), numpy.shape(Efd), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(wset), numpy.shape(Pset), numpy.shape(Vset), numpy.shape(Rs), numpy.shape(Ld), numpy.shape(Ld1), numpy.shape(Ld2), numpy.shape(Lq), numpy.shape(Lq1), numpy.shape(Lq2), numpy.shape(Ll), numpy.shape(Tdo1), numpy.shape(Tqo1), numpy.shape(Tdo2), numpy.shape(Tqo2), numpy.shape(H), numpy.shape(D), numpy.shape(Kg), numpy.shape(T1), numpy.shape(T2), numpy.shape(T3), numpy.shape(T4), numpy.shape(T5), numpy.shape(K1), numpy.shape(K2), numpy.shape(Ta), numpy.shape(Tb), numpy.shape(Ke), numpy.shape(Te))
+    _t0 = (1/2)/H
+    _t1 = Ld2**(-1.0)
+    _t2 = _t1*psiq
+    _t3 = Lq2**(-1.0)
+    _t4 = -Lq2
+    _t5 = -Ll - _t4
+    _t6 = -Lq1
+    _t7 = -Ll - _t6
+    _t8 = _t7**(-1.0)
+    _t9 = _t5*_t8
+    _t10 = Lq1 + _t4
+    _t11 = _t3*(-Ed1*_t9 + _t10*_t8*psi2q - psiq)
+    _t12 = _t3*psid
+    _t13 = -Ll
+    _t14 = Ld2 + _t13
+    _t15 = Ld1 + _t13
+    _t16 = _t15**(-1.0)
+    _t17 = _t14*_t16
+    _t18 = Ld1 - Ld2
+    _t19 = _t16*_t18
+    _t20 = Eq1*_t17 + _t19*psi1d - psid
+    _t21 = _t1*_t20
+    _t22 = _t0*_t2
+    _t23 = _t0*_t12
+    _t24 = _t0/wr
+    _t25 = numpy.sin(theta)
+    _t26 = _t25*vbD
+    _t27 = numpy.cos(theta)
+    _t28 = -_t26 + _t27*vbQ
+    _t29 = Rs*wbase
+    _t30 = wbase*wr
+    _t31 = _t1*_t14*_t16
+    _t32 = _t1*_t18
+    _t33 = _t16*_t32
+    _t34 = _t27*vbD
+    _t35 = _t25*vbQ
+    _t36 = _t34 + _t35
+    _t37 = _t3*_t5
+    _t38 = _t37*_t8
+    _t39 = _t10*_t3
+    _t40 = _t39*_t8
+    _t41 = Ld - Ld1
+    _t42 = Tdo1**(-1.0)
+    _t43 = _t41*_t42
+    _t44 = -_t1*_t14 + 1
+    _t45 = _t18/_t15**2
+    _t46 = _t32 + 1
+    _t47 = -_t10*_t3*_t8
+    _t48 = Lq + _t6
+    _t49 = Tqo1**(-1.0)
+    _t50 = _t48*_t49
+    _t51 = 1 - _t37
+    _t52 = _t10/_t7**2
+    _t53 = _t39 + 1
+    _t54 = Tdo2**(-1.0)
+    _t55 = Tqo2**(-1.0)
+    _t56 = T1**(-1.0)
+    _t57 = Kg*T2*_t56
+    _t58 = T3**(-1.0)
+    _t59 = -_t58
+    _t60 = T4**(-1.0)
+    _t61 = T5**(-1.0)
+    _t62 = Tb**(-1.0)
+    _t63 = 1/numpy.sqrt(_t28**2 + _t36**2)
+    _t64 = _t63*((1/2)*_t28*(-2*_t34 - 2*_t35) + (1/2)*_t36*(-2*_t26 + 2*_t27*vbQ))
+    _t65 = Ta*_t62
+    _t66 = _t64*_t65
+    _t67 = Te**(-1.0)
+    _t68 = Ke*_t67
+    _t69 = _t27*wbase
+    _t70 = _t25*wbase
+    _t71 = _t63*(-_t25*_t28 + _t27*_t36)
+    _t72 = _t65*_t71
+    _t73 = _t63*(_t25*_t36 + _t27*_t28)
+    _t74 = _t65*_t73
+    A = numpy.zeros(batch + (14, 14))
+    B = numpy.zeros(batch + (14, 2))
+    Bw = numpy.zeros(batch + (14, 1))
+    C = numpy.zeros(batch + (2, 14))
+    Cw = numpy.zeros(batch + (14, 1))
+    A[..., 0, 1] = wbase
+    A[..., 1, 1] = _t0*(-D - (K1*Pf + P2)/wr**2)
+    A[..., 1, 2] = _t0*(-_t11 - _t2)
+    A[..., 1, 3] = _t0*(_t12 + _t21)
+    A[..., 1, 4] = _t17*_t22
+    A[..., 1, 5] = _t23*_t9
+    A[..., 1, 6] = _t19*_t22
+    A[..., 1, 7] = -_t10*_t23*_t8
+    A[..., 1, 10] = K1*_t24
+    A[..., 1, 11] = _t24
+    A[..., 2, 0] = _t28*wbase
+    A[..., 2, 1] = psiq*wbase
+    A[..., 2, 2] = -_t1*_t29
+    A[..., 2, 3] = _t30
+    A[..., 2, 4] = _t29*_t31
+    A[..., 2, 6] = _t29*_t33
+    A[..., 3, 0] = -_t36*wbase
+    A[..., 3, 1] = -psid*wbase
+    A[..., 3, 2] = -_t30
+    A[..., 3, 3] = -_t29*_t3
+    A[..., 3, 5] = -_t29*_t38
+    A[..., 3, 7] = _t29*_t40
+    A[..., 4, 2] = -_t43*(-_t1 + _t33)
+    A[..., 4, 4] = _t42*(-_t41*(_t1*_t14*_t16 + _t44*_t45) - 1)
+    A[..., 4, 6] = -_t43*(_t1*_t16*_t18 - _t45*_t46)
+    A[..., 4, 13] = _t42
+    A[..., 5, 3] = _t50*(-_t3 - _t47)
+    A[..., 5, 5] = _t49*(_t48*(-_t38 - _t51*_t52) - 1)
+    A[..., 5, 7] = _t50*(-_t47 - _t52*_t53)
+    A[..., 6, 2] = _t1*_t15*_t54
+    A[..., 6, 4] = _t44*_t54
+    A[..., 6, 6] = -_t46*_t54
+    A[..., 7, 3] = _t3*_t55*_t7
+    A[..., 7, 5] = -_t51*_t55
+    A[..., 7, 7] = -_t53*_t55
+    A[..., 8, 1] = _t56*(Kg - _t57)
+    A[..., 8, 8] = -_t56
+    A[..., 9, 1] = -_t57*_t58
+    A[..., 9, 8] = _t59
+    A[..., 9, 9] = _t59
+    A[..., 10, 9] = _t60
+    A[..., 10, 10] = -_t60
+    A[..., 11, 10] = K2*_t61
+    A[..., 11, 11] = -_t61
+    A[..., 12, 0] = _t62*(-_t64 + _t66)
+    A[..., 12, 12] = -_t62
+    A[..., 13, 0] = -_t66*_t68
+    A[..., 13, 12] = _t68
+    A[..., 13, 13] = -_t67
+    B[..., 2, 0] = _t69
+    B[..., 2, 1] = _t70
+    B[..., 3, 0] = -_t70
+    B[..., 3, 1] = _t69
+    B[..., 12, 0] = _t62*(-_t71 + _t72)
+    B[..., 12, 1] = _t62*(-_t73 + _t74)
+    B[..., 13, 0] = -_t68*_t72
+    B[..., 13, 1] = -_t68*_t74
+    Bw[..., 0, 0] = -wbase
+    C[..., 0, 0] = -_t11*_t27 - _t21*_t25
+    C[..., 0, 2] = -_t1*_t27
+    C[..., 0, 3] = _t25*_t3
+    C[..., 0, 4] = _t27*_t31
+    C[..., 0, 5] = _t25*_t38
+    C[..., 0, 6] = _t27*_t33
+    C[..., 0, 7] = -_t25*_t40
+    C[..., 1, 0] = _t1*_t20*_t27 - _t11*_t25
+    C[..., 1, 2] = -_t1*_t25
+    C[..., 1, 3] = -_t27*_t3
+    C[..., 1, 4] = _t25*_t31
+    C[..., 1, 5] = -_t27*_t38
+    C[..., 1, 6] = _t25*_t33
+    C[..., 1, 7] = _t27*_t40
+    Cw[..., 1, 0] = 1
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_sg(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, wr, psid, psiq, Eq1, Ed1, psi1d, psi2q, P1, Pg, Pf, P2, vx, Efd, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    wset = paras['wset']
+    Pset = paras['Pset']
+    Vset = paras['Vset']
+    Rs = paras['Rs']
+    Ld = paras['Ld']
+    Ld1 = paras['Ld1']
+    Ld2 = paras['Ld2']
+    Lq = paras['Lq']
+    Lq1 = paras['Lq1']
+    Lq2 = paras['Lq2']
+    Ll = paras['Ll']
+    Tdo1 = paras['Tdo1']
+    Tqo1 = paras['Tqo1']
+    Tdo2 = paras['Tdo2']
+    Tqo2 = paras['Tqo2']
+    H = paras['H']
+    D = paras['D']
+    Kg = paras['Kg']
+    T1 = paras['T1']
+    T2 = paras['T2']
+    T3 = paras['T3']
+    T4 = paras['T4']
+    T5 = paras['T5']
+    K1 = paras['K1']
+    K2 = paras['K2']
+    Ta = paras['Ta']
+    Tb = paras['Tb']
+    Ke = paras['Ke']
+    Te = paras['Te']
+    _t0 = wr - wset
+    _t1 = Ld2**(-1.0)
+    _t2 = -Ll
+    _t3 = Ld1 + _t2
+    _t4 = _t3**(-1.0)
+    _t5 = Ld1 - Ld2
+    _t6 = Eq1*_t4*(Ld2 + _t2) + _t4*_t5*psi1d - psid
+    _t7 = Lq2**(-1.0)
+    _t8 = -Lq2
+    _t9 = -Lq1
+    _t10 = -Ll - _t9
+    _t11 = _t10**(-1.0)
+    _t12 = Lq1 + _t8
+    _t13 = -Ed1*_t11*(-Ll - _t8) + _t11*_t12*psi2q - psiq
+    _t14 = _t13*_t7
+    _t15 = _t1*_t6
+    _t16 = numpy.cos(theta)
+    _t17 = numpy.sin(theta)
+    _t18 = _t16*vbD + _t17*vbQ
+    _t19 = -_t16*vbQ + _t17*vbD
+    _t20 = -Efd
+    _t21 = -Eq1 + _t15*_t3 + psi1d
+    _t22 = Ed1 + _t10*_t14 + psi2q
+    _t23 = T1**(-1.0)
+    _t24 = Kg*T2*_t0*_t23 + P1
+    _t25 = Tb**(-1.0)
+    _t26 = numpy.sqrt(_t18**2 + _t19**2)
+    _t27 = Ta*_t25*(Vset - _t26)
+    f = [wbase*(-wcom + wr), (1/2)*(-D*_t0 + _t1*_t6*psiq - _t14*psid + (K1*Pf + P2)/wr)/H, wbase*(Rs*_t15 + _t18 + psiq*wr), wbase*(Rs*_t13*_t7 - _t19 - psid*wr), (-Eq1 - _t20 - (Ld - Ld1)*(_t1*_t6 - _t21*_t5/_t3**2))/Tdo1, (-Ed1 + (Lq + _t9)*(_t13*_t7 - _t12*_t22/_t10**2))/Tqo1, -_t21/Tdo2, -_t22/Tqo2, _t23*(Kg*_t0 - _t24), (-Pg + Pset - _t24)/T3, (-Pf + Pg)/T4, (K2*Pf - P2)/T5, _t25*(Vset - _t26 - _t27 - vx), (Ke*_t27 + Ke*vx + _t20)/Te]
+    y = [_t1*_t16*_t6 - _t14*_t17, _t14*_t16 + _t15*_t17]
+    w = [wr]
+    return {'f': f, 'y': y, 'w': w}
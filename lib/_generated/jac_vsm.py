@@ -0,0 +1,298 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_vsm_symbolic() in lib/ssmodel_vsm.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = '853b57654f6db08fd05e6d6b6d73d9e95eb4185e21b48e9755bd9e7069a2d5d7'
+PARAS = ('Pset', 'Qset', 'wset', 'Vset', 'Rt', 'Lt', 'Rd', 'Cf', 'Rc', 'Lc', 'mp', 'mq', 'J', 'K', 'tauf')
+SHAPES = {'A': (12, 12), 'B': (12, 2), 'Bw': (12, 1), 'C': (2, 12), 'Cw': (12, 1)}
+
+def jac_vsm(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    J = paras['J']
+    K = paras['K']
+    tauf = paras['tauf']
+    _t0 = tauf**(-1.0)
+    _t1 = -_t0
+    _t2 = Rd*iod
+    _t3 = wset**(-1.0)
+    _t4 = _t0*_t3
+    _t5 = Rd*ioq
+    _t6 = _t0*iod
+    _t7 = _t0*ioq
+    _t8 = Rd*(iid - iod) + vcd
+    _t9 = Rd*(iiq - ioq) + vcq
+    _t10 = _t0/numpy.sqrt(_t8**2 + _t9**2)
+    _t11 = _t10*_t8
+    _t12 = Rd*_t11
+    _t13 = _t10*_t9
+    _t14 = Rd*_t13
+    _t15 = J**(-1.0)
+    _t16 = K**(-1.0)
+    _t17 = Lt**(-1.0)
+    _t18 = _t17*wbase
+    _t19 = wbase*winv
+    _t20 = _t18*(-Rd - Rt)
+    _t21 = -_t18
+    _t22 = Rd*_t18
+    _t23 = -_t19
+    _t24 = wbase/Cf
+    _t25 = -_t24
+    _t26 = numpy.sin(theta)
+    _t27 = numpy.cos(theta)
+    _t28 = wbase/Lc
+    _t29 = Rd*_t28
+    _t30 = _t28*(-Rc - Rd)
+    _t31 = -_t27*_t28
+    _t32 = _t26*_t28
+    A = numpy.zeros((12, 12))
+    B = numpy.zeros((12, 2))
+    Bw = numpy.zeros((12, 1))
+    C = numpy.zeros((2, 12))
+    Cw = numpy.zeros((12, 1))
+    A[0, 4] = wbase
+    A[1, 1] = _t1
+    A[1, 6] = _t2*_t4
+    A[1, 7] = _t4*_t5
+    A[1, 8] = _t3*_t6
+    A[1, 9] = _t3*_t7
+    A[1, 10] = _t4*(-_t2 + _t8)
+    A[1, 11] = _t4*(-_t5 + _t9)
+    A[2, 2] = _t1
+    A[2, 6] = -_t0*_t5
+    A[2, 7] = _t0*_t2
+    A[2, 8] = -_t7
+    A[2, 9] = _t6
+    A[2, 10] = _t0*(_t5 + _t9)
+    A[2, 11] = _t0*(-_t2 - _t8)
+    A[3, 3] = _t1
+    A[3, 6] = _t12
+    A[3, 7] = _t14
+    A[3, 8] = _t11
+    A[3, 9] = _t13
+    A[3, 10] = -_t12
+    A[3, 11] = -_t14
+    A[4, 1] = -_t15
+    A[4, 4] = -_t15/mp
+    A[5, 2] = -_t16
+    A[5, 3] = -_t16/mq
+    A[6, 4] = _t18*(Lt*iiq + psif)
+    A[6, 5] = _t17*_t19
+    A[6, 6] = _t20
+    A[6, 7] = _t19
+    A[6, 8] = _t21
+    A[6, 10] = _t22
+    A[7, 4] = -iid*wbase
+    A[7, 6] = _t23
+    A[7, 7] = _t20
+    A[7, 9] = _t21
+    A[7, 11] = _t22
+    A[8, 4] = vcq*wbase
+    A[8, 6] = _t24
+    A[8, 9] = _t19
+    A[8, 10] = _t25
+    A[9, 4] = -vcd*wbase
+    A[9, 7] = _t24
+    A[9, 8] = _t23
+    A[9, 11] = _t25
+    A[10, 0] = _t28*(_t26*vbD - _t27*vbQ)
+    A[10, 4] = ioq*wbase
+    A[10, 6] = _t29
+    A[10, 8] = _t28
+    A[10, 10] = _t30
+    A[10, 11] = _t19
+    A[11, 0] = _t28*(_t26*vbQ + _t27*vbD)
+    A[11, 4] = -iod*wbase
+    A[11, 7] = _t29
+    A[11, 9] = _t28
+    A[11, 10] = _t23
+    A[11, 11] = _t30
+    B[10, 0] = _t31
+    B[10, 1] = -_t32
+    B[11, 0] = _t32
+    B[11, 1] = _t31
+    Bw[0, 0] = -wbase
+    C[0, 0] = -_t26*iod - _t27*ioq
+    C[0, 10] = _t27
+    C[0, 11] = -_t26
+    C[1, 0] = -_t26*ioq + _t27*iod
+    C[1, 10] = _t26
+    C[1, 11] = _t27
+    Cw[4, 0] = 1
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_vsm_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    Pset = numpy.asarray(paras['Pset'], dtype=float)
+    Qset = numpy.asarray(paras['Qset'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rt = numpy.asarray(paras['Rt'], dtype=float)
+    Lt = numpy.asarray(paras['Lt'], dtype=float)
+    Rd = numpy.asarray(paras['Rd'], dtype=float)
+    Cf = numpy.asarray(paras['Cf'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    J = numpy.asarray(paras['J'], dtype=float)
+    K = numpy.asarray(paras['K'], dtype=float)
+    tauf = numpy.asarray(paras['tauf'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(theta), numpy.shape(Tef), numpy.shape(Qof), numpy.shape(Vof), numpy.shape(winv), numpy.shape(psif), numpy.shape(iid), numpy.shape(iiq), numpy.shape(vcd), numpy.shape(vcq), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(Pset), numpy.shape(Qset), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rt), numpy.shape(Lt), numpy.shape(Rd), numpy.shape(Cf), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(J), numpy.shape(K), numpy.shape(tauf))
+    _t0 = tauf**(-1.0)
+    _t1 = -_t0
+    _t2 = Rd*iod
+    _t3 = wset**(-1.0)
+    _t4 = _t0*_t3
+    _t5 = Rd*ioq
+    _t6 = _t0*iod
+    _t7 = _t0*ioq
+    _t8 = Rd*(iid - iod) + vcd
+    _t9 = Rd*(iiq - ioq) + vcq
+    _t10 = _t0/numpy.sqrt(_t8**2 + _t9**2)
+    _t11 = _t10*_t8
+    _t12 = Rd*_t11
+    _t13 = _t10*_t9
+    _t14 = Rd*_t13
+    _t15 = J**(-1.0)
+    _t16 = K**(-1.0)
+    _t17 = Lt**(-1.0)
+    _t18 = _t17*wbase
+    _t19 = wbase*winv
+    _t20 = _t18*(-Rd - Rt)
+    _t21 = -_t18
+    _t22 = Rd*_t18
+    _t23 = -_t19
+    _t24 = wbase/Cf
+    _t25 = -_t24
+    _t26 = numpy.sin(theta)
+    _t27 = numpy.cos(theta)
+    _t28 = wbase/Lc
+    _t29 = Rd*_t28
+    _t30 = _t28*(-Rc - Rd)
+    _t31 = -_t27*_t28
+    _t32 = _t26*_t28
+    A = numpy.zeros(batch + (12, 12))
+    B = numpy.zeros(batch + (12, 2))
+    Bw = numpy.zeros(batch + (12, 1))
+    C = numpy.zeros(batch + (2, 12))
+    Cw = numpy.zeros(batch + (12, 1))
+    A[..., 0, 4] = wbase
+    A[..., 1, 1] = _t1
+    A[..., 1, 6] = _t2*_t4
+    A[..., 1, 7] = _t4*_t5
+    A[..., 1, 8] = _t3*_t6
+    A[..., 1, 9] = _t3*_t7
+    A[..., 1, 10] = _t4*(-_t2 + _t8)
+    A[..., 1, 11] = _t4*(-_t5 + _t9)
+    A[..., 2, 2] = _t1
+    A[..., 2, 6] = -_t0*_t5
+    A[..., 2, 7] = _t0*_t2
+    A[..., 2, 8] = -_t7
+    A[..., 2, 9] = _t6
+    A[..., 2, 10] = _t0*(_t5 + _t9)
+    A[..., 2, 11] = _t0*(-_t2 - _t8)
+    A[..., 3, 3] = _t1
+    A[..., 3, 6] = _t12
+    A[..., 3, 7] = _t14
+    A[..., 3, 8] = _t11
+    A[..., 3, 9] = _t13
+    A[..., 3, 10] = -_t12
+    A[..., 3, 11] = -_t14
+    A[..., 4, 1] = -_t15
+    A[..., 4, 4] = -_t15/mp
+    A[..., 5, 2] = -_t16
+    A[..., 5, 3] = -_t16/mq
+    A[..., 6, 4] = _t18*(Lt*iiq + psif)
+    A[..., 6, 5] = _t17*_t19
+    A[..., 6, 6] = _t20
+    A[..., 6, 7] = _t19
+    A[..., 6, 8] = _t21
+    A[..., 6, 10] = _t22
+    A[..., 7, 4] = -iid*wbase
+    A[..., 7, 6] = _t23
+    A[..., 7, 7] = _t20
+    A[..., 7, 9] = _t21
+    A[..., 7, 11] = _t22
+    A[..., 8, 4] = vcq*wbase
+    A[..., 8, 6] = _t24
+    A[..., 8, 9] = _t19
+    A[..., 8, 10] = _t25
+    A[..., 9, 4] = -vcd*wbase
+    A[..., 9, 7] = _t24
+    A[..., 9, 8] = _t23
+    A[..., 9, 11] = _t25
+    A[..., 10, 0] = _t28*(_t26*vbD - _t27*vbQ)
+    A[..., 10, 4] = ioq*wbase
+    A[..., 10, 6] = _t29
+    A[..., 10, 8] = _t28
+    A[..., 10, 10] = _t30
+    A[..., 10, 11] = _t19
+    A[..., 11, 0] = _t28*(_t26*vbQ + _t27*vbD)
+    A[..., 11, 4] = -iod*wbase
+    A[..., 11, 7] = _t29
+    A[..., 11, 9] = _t28
+    A[..., 11, 10] = _t23
+    A[..., 11, 11] = _t30
+    B[..., 10, 0] = _t31
+    B[..., 10, 1] = -_t32
+    B[..., 11, 0] = _t32
+    B[..., 11, 1] = _t31
+    Bw[..., 0, 0] = -wbase
+    C[..., 0, 0] = -_t26*iod - _t27*ioq
+    C[..., 0, 10] = _t27
+    C[..., 0, 11] = -_t26
+    C[..., 1, 0] = -_t26*ioq + _t27*iod
+    C[..., 1, 10] = _t26
+    C[..., 1, 11] = _t27
+    Cw[..., 4, 0] = 1
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_vsm(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    Pset = paras['Pset']
+    Qset = paras['Qset']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    J = paras['J']
+    K = paras['K']
+    tauf = paras['tauf']
+    _t0 = tauf**(-1.0)
+    _t1 = wset**(-1.0)
+    _t2 = iid - iod
+    _t3 = Rd*_t2 + vcd
+    _t4 = Rd*(iiq - ioq)
+    _t5 = _t4 + vcq
+    _t6 = wbase/Lt
+    _t7 = Cf*winv
+    _t8 = wbase/Cf
+    _t9 = numpy.cos(theta)
+    _t10 = numpy.sin(theta)
+    _t11 = Lc*winv
+    _t12 = wbase/Lc
+    f = [wbase*(-wcom + winv), _t0*(-Tef + _t1*(_t3*iod + _t5*ioq)), _t0*(-Qof - _t3*ioq + _t5*iod), _t0*(-Vof + numpy.sqrt(_t3**2 + _t5**2)), (Pset*_t1 - Tef + (-winv + wset)/mp)/J, (-Qof + Qset + (-Vof + Vset)/mq)/K, _t6*(Lt*iiq*winv - Rt*iid - _t3 + psif*winv), _t6*(-Lt*iid*winv - Rt*iiq - _t5), _t8*(_t2 + _t7*vcq), _t8*(-_t7*vcd + iiq - ioq), _t12*(-Rc*iod - _t10*vbQ + _t11*ioq + _t3 - _t9*vbD), _t12*(-Rc*ioq + _t10*vbD - _t11*iod + _t4 - _t9*vbQ + vcq)]
+    y = [-_t10*ioq + _t9*iod, _t10*iod + _t9*ioq]
+    w = [winv]
+    return {'f': f, 'y': y, 'w': w}
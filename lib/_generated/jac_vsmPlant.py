@@ -0,0 +1,472 @@
+# Generated by lib/ssmodel_codegen.py from ssmodel_vsmPlant_symbolic() in lib/ssmodel_vsmPlant.py.
+# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.
+import numpy
+
+SOURCE_HASH = '961fa4c980c7119025dd048eecef0aca203c888a80775e87ebc5347ccd2cb49c'
+PARAS = ('PsetPlant', 'QsetPlant', 'wsetPlant', 'VsetPlant', 'mpPlant', 'mqPlant', 'KpPLLplant', 'KiPLLplant', 'KpPlantP', 'KiPlantP', 'KpPlantQ', 'KiPlantQ', 'wcpllPlant', 'wcPlant', 'tDelay', 'wset', 'Vset', 'Rt', 'Lt', 'Rd', 'Cf', 'Rc', 'Lc', 'mp', 'mq', 'J', 'K', 'tauf')
+SHAPES = {'A': (21, 21), 'B': (21, 2), 'Bw': (21, 1), 'C': (2, 21), 'Cw': (1, 21)}
+
+def jac_vsmPlant(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()
+    vbD, vbQ, wcom, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()
+    PsetPlant = paras['PsetPlant']
+    QsetPlant = paras['QsetPlant']
+    wsetPlant = paras['wsetPlant']
+    VsetPlant = paras['VsetPlant']
+    mpPlant = paras['mpPlant']
+    mqPlant = paras['mqPlant']
+    KpPLLplant = paras['KpPLLplant']
+    KiPLLplant = paras['KiPLLplant']
+    KpPlantP = paras['KpPlantP']
+    KiPlantP = paras['KiPlantP']
+    KpPlantQ = paras['KpPlantQ']
+    KiPlantQ = paras['KiPlantQ']
+    wcpllPlant = paras['wcpllPlant']
+    wcPlant = paras['wcPlant']
+    tDelay = paras['tDelay']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    J = paras['J']
+    K = paras['K']
+    tauf = paras['tauf']
+    _t0 = numpy.cos(thetaPlant)
+    _t1 = numpy.sin(thetaPlant)
+    _t2 = -_t0*vbD - _t1*vbQ
+    _t3 = KpPLLplant*_t2
+    _t4 = mpPlant**(-1.0)
+    _t5 = -wcPlant
+    _t6 = numpy.cos(theta)
+    _t7 = numpy.sin(theta)
+    _t8 = _t6*iod - _t7*ioq
+    _t9 = _t6*ioq + _t7*iod
+    _t10 = -_t9
+    _t11 = _t6*vbD + _t7*vbQ
+    _t12 = -_t6*vbQ + _t7*vbD
+    _t13 = -_t12*wcPlant
+    _t14 = tDelay**(-1.0)
+    _t15 = KpPlantP*_t14
+    _t16 = -_t14
+    _t17 = KpPlantQ*_t14
+    _t18 = tauf**(-1.0)
+    _t19 = -_t18
+    _t20 = Rd*iod
+    _t21 = wset**(-1.0)
+    _t22 = _t18*_t21
+    _t23 = Rd*ioq
+    _t24 = _t18*iod
+    _t25 = _t18*ioq
+    _t26 = Rd*(iid - iod) + vcd
+    _t27 = Rd*(iiq - ioq) + vcq
+    _t28 = _t18/numpy.sqrt(_t26**2 + _t27**2)
+    _t29 = _t26*_t28
+    _t30 = Rd*_t29
+    _t31 = _t27*_t28
+    _t32 = Rd*_t31
+    _t33 = J**(-1.0)
+    _t34 = K**(-1.0)
+    _t35 = Lt**(-1.0)
+    _t36 = _t35*wbase
+    _t37 = wbase*winv
+    _t38 = _t36*(-Rd - Rt)
+    _t39 = -_t36
+    _t40 = Rd*_t36
+    _t41 = -_t37
+    _t42 = wbase/Cf
+    _t43 = -_t42
+    _t44 = wbase/Lc
+    _t45 = Rd*_t44
+    _t46 = _t44*(-Rc - Rd)
+    _t47 = KpPLLplant*wbase
+    _t48 = KpPLLplant*wcpllPlant
+    _t49 = 1/(mqPlant*numpy.sqrt(vbD**2 + vbQ**2))
+    _t50 = _t49*vbD
+    _t51 = _t49*vbQ
+    _t52 = _t8*wcPlant
+    _t53 = -_t44*_t6
+    _t54 = _t44*_t7
+    _t55 = -wbase
+    A = numpy.zeros((21, 21))
+    B = numpy.zeros((21, 2))
+    Bw = numpy.zeros((21, 1))
+    C = numpy.zeros((2, 21))
+    Cw = numpy.zeros((1, 21))
+    A[0, 0] = _t3*wbase
+    A[0, 1] = KiPLLplant*wbase
+    A[1, 0] = _t2
+    A[2, 0] = _t3*wcpllPlant
+    A[2, 1] = KiPLLplant*wcpllPlant
+    A[2, 2] = -wcpllPlant
+    A[3, 2] = -_t4
+    A[3, 5] = -1
+    A[4, 6] = -1
+    A[5, 5] = _t5
+    A[5, 9] = wcPlant*(_t10*vbD + _t8*vbQ)
+    A[5, 19] = _t11*wcPlant
+    A[5, 20] = _t13
+    A[6, 6] = _t5
+    A[6, 9] = wcPlant*(_t10*vbQ - _t8*vbD)
+    A[6, 19] = _t13
+    A[6, 20] = -_t11*wcPlant
+    A[7, 2] = -_t15*_t4
+    A[7, 3] = KiPlantP*_t14
+    A[7, 5] = -_t15
+    A[7, 7] = _t16
+    A[8, 4] = KiPlantQ*_t14
+    A[8, 6] = -_t17
+    A[8, 8] = _t16
+    A[9, 13] = wbase
+    A[10, 10] = _t19
+    A[10, 15] = _t20*_t22
+    A[10, 16] = _t22*_t23
+    A[10, 17] = _t21*_t24
+    A[10, 18] = _t21*_t25
+    A[10, 19] = _t22*(-_t20 + _t26)
+    A[10, 20] = _t22*(-_t23 + _t27)
+    A[11, 11] = _t19
+    A[11, 15] = -_t18*_t23
+    A[11, 16] = _t18*_t20
+    A[11, 17] = -_t25
+    A[11, 18] = _t24
+    A[11, 19] = _t18*(_t23 + _t27)
+    A[11, 20] = _t18*(-_t20 - _t26)
+    A[12, 12] = _t19
+    A[12, 15] = _t30
+    A[12, 16] = _t32
+    A[12, 17] = _t29
+    A[12, 18] = _t31
+    A[12, 19] = -_t30
+    A[12, 20] = -_t32
+    A[13, 7] = _t21*_t33
+    A[13, 10] = -_t33
+    A[13, 13] = -_t33/mp
+    A[14, 8] = _t34
+    A[14, 11] = -_t34
+    A[14, 12] = -_t34/mq
+    A[15, 13] = _t36*(Lt*iiq + psif)
+    A[15, 14] = _t35*_t37
+    A[15, 15] = _t38
+    A[15, 16] = _t37
+    A[15, 17] = _t39
+    A[15, 19] = _t40
+    A[16, 13] = -iid*wbase
+    A[16, 15] = _t41
+    A[16, 16] = _t38
+    A[16, 18] = _t39
+    A[16, 20] = _t40
+    A[17, 13] = vcq*wbase
+    A[17, 15] = _t42
+    A[17, 18] = _t37
+    A[17, 19] = _t43
+    A[18, 13] = -vcd*wbase
+    A[18, 16] = _t42
+    A[18, 17] = _t41
+    A[18, 20] = _t43
+    A[19, 9] = _t12*_t44
+    A[19, 13] = ioq*wbase
+    A[19, 15] = _t45
+    A[19, 17] = _t44
+    A[19, 19] = _t46
+    A[19, 20] = _t37
+    A[20, 9] = _t11*_t44
+    A[20, 13] = -iod*wbase
+    A[20, 16] = _t45
+    A[20, 18] = _t44
+    A[20, 19] = _t41
+    A[20, 20] = _t46
+    B[0, 0] = -_t1*_t47
+    B[0, 1] = _t0*_t47
+    B[1, 0] = -_t1
+    B[1, 1] = _t0
+    B[2, 0] = -_t1*_t48
+    B[2, 1] = _t0*_t48
+    B[4, 0] = -_t50
+    B[4, 1] = -_t51
+    B[5, 0] = _t52
+    B[5, 1] = _t9*wcPlant
+    B[6, 0] = _t10*wcPlant
+    B[6, 1] = _t52
+    B[8, 0] = -_t17*_t50
+    B[8, 1] = -_t17*_t51
+    B[19, 0] = _t53
+    B[19, 1] = -_t54
+    B[20, 0] = _t54
+    B[20, 1] = _t53
+    Bw[0, 0] = _t55
+    Bw[9, 0] = _t55
+    C[0, 9] = _t10
+    C[0, 19] = _t6
+    C[0, 20] = -_t7
+    C[1, 9] = _t8
+    C[1, 19] = _t7
+    C[1, 20] = _t6
+    Cw[0, 13] = 1
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def jac_vsmPlant_batch(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)
+    vbD, vbQ, wcom, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)
+    PsetPlant = numpy.asarray(paras['PsetPlant'], dtype=float)
+    QsetPlant = numpy.asarray(paras['QsetPlant'], dtype=float)
+    wsetPlant = numpy.asarray(paras['wsetPlant'], dtype=float)
+    VsetPlant = numpy.asarray(paras['VsetPlant'], dtype=float)
+    mpPlant = numpy.asarray(paras['mpPlant'], dtype=float)
+    mqPlant = numpy.asarray(paras['mqPlant'], dtype=float)
+    KpPLLplant = numpy.asarray(paras['KpPLLplant'], dtype=float)
+    KiPLLplant = numpy.asarray(paras['KiPLLplant'], dtype=float)
+    KpPlantP = numpy.asarray(paras['KpPlantP'], dtype=float)
+    KiPlantP = numpy.asarray(paras['KiPlantP'], dtype=float)
+    KpPlantQ = numpy.asarray(paras['KpPlantQ'], dtype=float)
+    KiPlantQ = numpy.asarray(paras['KiPlantQ'], dtype=float)
+    wcpllPlant = numpy.asarray(paras['wcpllPlant'], dtype=float)
+    wcPlant = numpy.asarray(paras['wcPlant'], dtype=float)
+    tDelay = numpy.asarray(paras['tDelay'], dtype=float)
+    wset = numpy.asarray(paras['wset'], dtype=float)
+    Vset = numpy.asarray(paras['Vset'], dtype=float)
+    Rt = numpy.asarray(paras['Rt'], dtype=float)
+    Lt = numpy.asarray(paras['Lt'], dtype=float)
+    Rd = numpy.asarray(paras['Rd'], dtype=float)
+    Cf = numpy.asarray(paras['Cf'], dtype=float)
+    Rc = numpy.asarray(paras['Rc'], dtype=float)
+    Lc = numpy.asarray(paras['Lc'], dtype=float)
+    mp = numpy.asarray(paras['mp'], dtype=float)
+    mq = numpy.asarray(paras['mq'], dtype=float)
+    J = numpy.asarray(paras['J'], dtype=float)
+    K = numpy.asarray(paras['K'], dtype=float)
+    tauf = numpy.asarray(paras['tauf'], dtype=float)
+    batch = numpy.broadcast_shapes(numpy.shape(thetaPlant), numpy.shape(epsilonPLLPlant), numpy.shape(wPlant), numpy.shape(epsilonP), numpy.shape(epsilonQ), numpy.shape(PoPlant), numpy.shape(QoPlant), numpy.shape(PsetDelay), numpy.shape(QsetDelay), numpy.shape(theta), numpy.shape(Tef), numpy.shape(Qof), numpy.shape(Vof), numpy.shape(winv), numpy.shape(psif), numpy.shape(iid), numpy.shape(iiq), numpy.shape(vcd), numpy.shape(vcq), numpy.shape(iod), numpy.shape(ioq), numpy.shape(vbD), numpy.shape(vbQ), numpy.shape(wcom), numpy.shape(PsetPlant), numpy.shape(QsetPlant), numpy.shape(wsetPlant), numpy.shape(VsetPlant), numpy.shape(mpPlant), numpy.shape(mqPlant), numpy.shape(KpPLLplant), numpy.shape(KiPLLplant), numpy.shape(KpPlantP), numpy.shape(KiPlantP), numpy.shape(KpPlantQ), numpy.shape(KiPlantQ), numpy.shape(wcpllPlant), numpy.shape(wcPlant), numpy.shape(tDelay), numpy.shape(wset), numpy.shape(Vset), numpy.shape(Rt), numpy.shape(Lt), numpy.shape(Rd), numpy.shape(Cf), numpy.shape(Rc), numpy.shape(Lc), numpy.shape(mp), numpy.shape(mq), numpy.shape(J), numpy.shape(K), numpy.shape(tauf))
+    _t0 = numpy.cos(thetaPlant)
+    _t1 = numpy.sin(thetaPlant)
+    _t2 = -_t0*vbD - _t1*vbQ
+    _t3 = KpPLLplant*_t2
+    _t4 = mpPlant**(-1.0)
+    _t5 = -wcPlant
+    _t6 = numpy.cos(theta)
+    _t7 = numpy.sin(theta)
+    _t8 = _t6*iod - _t7*ioq
+    _t9 = _t6*ioq + _t7*iod
+    _t10 = -_t9
+    _t11 = _t6*vbD + _t7*vbQ
+    _t12 = -_t6*vbQ + _t7*vbD
+    _t13 = -_t12*wcPlant
+    _t14 = tDelay**(-1.0)
+    _t15 = KpPlantP*_t14
+    _t16 = -_t14
+    _t17 = KpPlantQ*_t14
+    _t18 = tauf**(-1.0)
+    _t19 = -_t18
+    _t20 = Rd*iod
+    _t21 = wset**(-1.0)
+    _t22 = _t18*_t21
+    _t23 = Rd*ioq
+    _t24 = _t18*iod
+    _t25 = _t18*ioq
+    _t26 = Rd*(iid - iod) + vcd
+    _t27 = Rd*(iiq - ioq) + vcq
+    _t28 = _t18/numpy.sqrt(_t26**2 + _t27**2)
+    _t29 = _t26*_t28
+    _t30 = Rd*_t29
+    _t31 = _t27*_t28
+    _t32 = Rd*_t31
+    _t33 = J**(-1.0)
+    _t34 = K**(-1.0)
+    _t35 = Lt**(-1.0)
+    _t36 = _t35*wbase
+    _t37 = wbase*winv
+    _t38 = _t36*(-Rd - Rt)
+    _t39 = -_t36
+    _t40 = Rd*_t36
+    _t41 = -_t37
+    _t42 = wbase/Cf
+    _t43 = -_t42
+    _t44 = wbase/Lc
+    _t45 = Rd*_t44
+    _t46 = _t44*(-Rc - Rd)
+    _t47 = KpPLLplant*wbase
+    _t48 = KpPLLplant*wcpllPlant
+    _t49 = 1/(mqPlant*numpy.sqrt(vbD**2 + vbQ**2))
+    _t50 = _t49*vbD
+    _t51 = _t49*vbQ
+    _t52 = _t8*wcPlant
+    _t53 = -_t44*_t6
+    _t54 = _t44*_t7
+    _t55 = -wbase
+    A = numpy.zeros(batch + (21, 21))
+    B = numpy.zeros(batch + (21, 2))
+    Bw = numpy.zeros(batch + (21, 1))
+    C = numpy.zeros(batch + (2, 21))
+    Cw = numpy.zeros(batch + (1, 21))
+    A[..., 0, 0] = _t3*wbase
+    A[..., 0, 1] = KiPLLplant*wbase
+    A[..., 1, 0] = _t2
+    A[..., 2, 0] = _t3*wcpllPlant
+    A[..., 2, 1] = KiPLLplant*wcpllPlant
+    A[..., 2, 2] = -wcpllPlant
+    A[..., 3, 2] = -_t4
+    A[..., 3, 5] = -1
+    A[..., 4, 6] = -1
+    A[..., 5, 5] = _t5
+    A[..., 5, 9] = wcPlant*(_t10*vbD + _t8*vbQ)
+    A[..., 5, 19] = _t11*wcPlant
+    A[..., 5, 20] = _t13
+    A[..., 6, 6] = _t5
+    A[..., 6, 9] = wcPlant*(_t10*vbQ - _t8*vbD)
+    A[..., 6, 19] = _t13
+    A[..., 6, 20] = -_t11*wcPlant
+    A[..., 7, 2] = -_t15*_t4
+    A[..., 7, 3] = KiPlantP*_t14
+    A[..., 7, 5] = -_t15
+    A[..., 7, 7] = _t16
+    A[..., 8, 4] = KiPlantQ*_t14
+    A[..., 8, 6] = -_t17
+    A[..., 8, 8] = _t16
+    A[..., 9, 13] = wbase
+    A[..., 10, 10] = _t19
+    A[..., 10, 15] = _t20*_t22
+    A[..., 10, 16] = _t22*_t23
+    A[..., 10, 17] = _t21*_t24
+    A[..., 10, 18] = _t21*_t25
+    A[..., 10, 19] = _t22*(-_t20 + _t26)
+    A[..., 10, 20] = _t22*(-_t23 + _t27)
+    A[..., 11, 11] = _t19
+    A[..., 11, 15] = -_t18*_t23
+    A[..., 11, 16] = _t18*_t20
+    A[..., 11, 17] = -_t25
+    A[..., 11, 18] = _t24
+    A[..., 11, 19] = _t18*(_t23 + _t27)
+    A[..., 11, 20] = _t18*(-_t20 - _t26)
+    A[..., 12, 12] = _t19
+    A[..., 12, 15] = _t30
+    A[..., 12, 16] = _t32
+    A[..., 12, 17] = _t29
+    A[..., 12, 18] = _t31
+    A[..., 12, 19] = -_t30
+    A[..., 12, 20] = -_t32
+    A[..., 13, 7] = _t21*_t33
+    A[..., 13, 10] = -_t33
+    A[..., 13, 13] = -_t33/mp
+    A[..., 14, 8] = _t34
+    A[..., 14, 11] = -_t34
+    A[..., 14, 12] = -_t34/mq
+    A[..., 15, 13] = _t36*(Lt*iiq + psif)
+    A[..., 15, 14] = _t35*_t37
+    A[..., 15, 15] = _t38
+    A[..., 15, 16] = _t37
+    A[..., 15, 17] = _t39
+    A[..., 15, 19] = _t40
+    A[..., 16, 13] = -iid*wbase
+    A[..., 16, 15] = _t41
+    A[..., 16, 16] = _t38
+    A[..., 16, 18] = _t39
+    A[..., 16, 20] = _t40
+    A[..., 17, 13] = vcq*wbase
+    A[..., 17, 15] = _t42
+    A[..., 17, 18] = _t37
+    A[..., 17, 19] = _t43
+    A[..., 18, 13] = -vcd*wbase
+    A[..., 18, 16] = _t42
+    A[..., 18, 17] = _t41
+    A[..., 18, 20] = _t43
+    A[..., 19, 9] = _t12*_t44
+    A[..., 19, 13] = ioq*wbase
+    A[..., 19, 15] = _t45
+    A[..., 19, 17] = _t44
+    A[..., 19, 19] = _t46
+    A[..., 19, 20] = _t37
+    A[..., 20, 9] = _t11*_t44
+    A[..., 20, 13] = -iod*wbase
+    A[..., 20, 16] = _t45
+    A[..., 20, 18] = _t44
+    A[..., 20, 19] = _t41
+    A[..., 20, 20] = _t46
+    B[..., 0, 0] = -_t1*_t47
+    B[..., 0, 1] = _t0*_t47
+    B[..., 1, 0] = -_t1
+    B[..., 1, 1] = _t0
+    B[..., 2, 0] = -_t1*_t48
+    B[..., 2, 1] = _t0*_t48
+    B[..., 4, 0] = -_t50
+    B[..., 4, 1] = -_t51
+    B[..., 5, 0] = _t52
+    B[..., 5, 1] = _t9*wcPlant
+    B[..., 6, 0] = _t10*wcPlant
+    B[..., 6, 1] = _t52
+    B[..., 8, 0] = -_t17*_t50
+    B[..., 8, 1] = -_t17*_t51
+    B[..., 19, 0] = _t53
+    B[..., 19, 1] = -_t54
+    B[..., 20, 0] = _t54
+    B[..., 20, 1] = _t53
+    Bw[..., 0, 0] = _t55
+    Bw[..., 9, 0] = _t55
+    C[..., 0, 9] = _t10
+    C[..., 0, 19] = _t6
+    C[..., 0, 20] = -_t7
+    C[..., 1, 9] = _t8
+    C[..., 1, 19] = _t7
+    C[..., 1, 20] = _t6
+    Cw[..., 0, 13] = 1
+    return {'A': A, 'B': B, 'Bw': Bw, 'C': C, 'Cw': Cw}
+
+def rhs_vsmPlant(wbase, paras, steadyStateValuesX, steadyStateValuesU):
+    thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq, = steadyStateValuesX
+    vbD, vbQ, wcom, = steadyStateValuesU
+    PsetPlant = paras['PsetPlant']
+    QsetPlant = paras['QsetPlant']
+    wsetPlant = paras['wsetPlant']
+    VsetPlant = paras['VsetPlant']
+    mpPlant = paras['mpPlant']
+    mqPlant = paras['mqPlant']
+    KpPLLplant = paras['KpPLLplant']
+    KiPLLplant = paras['KiPLLplant']
+    KpPlantP = paras['KpPlantP']
+    KiPlantP = paras['KiPlantP']
+    KpPlantQ = paras['KpPlantQ']
+    KiPlantQ = paras['KiPlantQ']
+    wcpllPlant = paras['wcpllPlant']
+    wcPlant = paras['wcPlant']
+    tDelay = paras['tDelay']
+    wset = paras['wset']
+    Vset = paras['Vset']
+    Rt = paras['Rt']
+    Lt = paras['Lt']
+    Rd = paras['Rd']
+    Cf = paras['Cf']
+    Rc = paras['Rc']
+    Lc = paras['Lc']
+    mp = paras['mp']
+    mq = paras['mq']
+    J = paras['J']
+    K = paras['K']
+    tauf = paras['tauf']
+    _t0 = -vbD*numpy.sin(thetaPlant) + vbQ*numpy.cos(thetaPlant)
+    _t1 = KiPLLplant*epsilonPLLPlant + KpPLLplant*_t0 + wsetPlant
+    _t2 = -PoPlant + PsetPlant + (-wPlant + wsetPlant)/mpPlant
+    _t3 = -QoPlant + QsetPlant + (VsetPlant - numpy.sqrt(vbD**2 + vbQ**2))/mqPlant
+    _t4 = numpy.sin(theta)
+    _t5 = numpy.cos(theta)
+    _t6 = _t4*iod + _t5*ioq
+    _t7 = -_t4*ioq + _t5*iod
+    _t8 = tDelay**(-1.0)
+    _t9 = tauf**(-1.0)
+    _t10 = wset**(-1.0)
+    _t11 = iid - iod
+    _t12 = Rd*_t11 + vcd
+    _t13 = Rd*(iiq - ioq)
+    _t14 = _t13 + vcq
+    _t15 = wbase/Lt
+    _t16 = Cf*winv
+    _t17 = wbase/Cf
+    _t18 = Lc*winv
+    _t19 = wbase/Lc
+    f = [wbase*(_t1 - wcom), _t0, _t1*wcpllPlant - wPlant*wcpllPlant, _t2, _t3, -PoPlant*wcPlant + wcPlant*(_t6*vbQ + _t7*vbD), -QoPlant*wcPlant + wcPlant*(-_t6*vbD + _t7*vbQ), _t8*(KiPlantP*epsilonP + KpPlantP*_t2 - PsetDelay + PsetPlant), _t8*(KiPlantQ*epsilonQ + KpPlantQ*_t3 - QsetDelay + QsetPlant), wbase*(-wcom + winv), _t9*(-Tef + _t10*(_t12*iod + _t14*ioq)), _t9*(-Qof - _t12*ioq + _t14*iod), _t9*(-Vof + numpy.sqrt(_t12**2 + _t14**2)), (PsetDelay*_t10 - Tef + (-winv + wset)/mp)/J, (-Qof + QsetDelay + (-Vof + Vset)/mq)/K, _t15*(Lt*iiq*winv - Rt*iid - _t12 + psif*winv), _t15*(-Lt*iid*winv - Rt*iiq - _t14), _t17*(_t11 + _t16*vcq), _t17*(-_t16*vcd + iiq - ioq), _t19*(-Rc*iod + _t12 + _t18*ioq - _t4*vbQ - _t5*vbD), _t19*(-Rc*ioq + _t13 - _t18*iod + _t4*vbD - _t5*vbQ + vcq)]
+    y = [_t7, _t6]
+    w = [winv]
+    return {'f': f, 'y': y, 'w': w}
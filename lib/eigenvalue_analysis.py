@@ -1,58 +1,41 @@
 import numpy as np
+import scipy.sparse as sps
 from scipy import linalg
+from lib.eigenvalue_results import EigenvalueAnalysisResults
+from lib.eigenvalue_shift_invert import eigenvalue_shift_invert
 
-def eigenvalue_analysis(Asys, ssVariables, dominantParticipationFactorBoundary):
-    eigenvalueAnalysisResults = {}
-    j = 0
-    # Initialization
-    eigenvalueAnalysisResults['modalAnalysis'] = [
-        ["Mode", "Real Part", "Imag Part", "Oscillatory Frequency", "Damping Ratio", "Participation Factor", "Dominant Subpart"]
-    ]
+def eigenvalue_analysis(Asys, ssVariables, dominantParticipationFactorBoundary, eigenvectors=True, shifts=None, modesPerShift=6):
+    # Returns an EigenvalueAnalysisResults, indexable like the former dict.
+    # eigenvectors=False skips the eigenvectors and participation factors: modes
+    # then carry None in place of the participation table and dominant subpart.
+    # With shifts only the modesPerShift modes closest to each shift are found by
+    # sparse shift-invert (see eigenvalue_shift_invert); eigs then holds those
+    # modes only, maxRealValue and minDampingRatio are None and the margins over
+    # the modes found are criticalMaxRealValue and criticalMinDampingRatio
+    if len(ssVariables) != Asys.shape[0]:
+        raise ValueError(f"{len(ssVariables)} state labels for a {Asys.shape[0]}-state system")
     # Modal Analysis
-    eigs, Rvmat = linalg.eig(Asys)
-    Lvmat = np.linalg.inv(Rvmat)
-    Pmat = Rvmat * Lvmat.T
-    maxRealValue = np.max(np.real(eigs))
-    eigenvalueAnalysisResults['eigs'] = eigs
-    eigenvalueAnalysisResults['maxRealValue'] = maxRealValue
-    for i, eigi in enumerate(eigs):
-        realParti = np.real(eigi)
-        imagParti = np.imag(eigi)
-        if imagParti >= 0:
-            j += 1
-            dampedOmega = np.sqrt(realParti**2 + imagParti**2)
-            dampingRatio = -realParti / dampedOmega
-            oscillatoryFrequency = abs(imagParti) / (2 * np.pi)
-            modalAnalysis = [
-                f"Mode {j}",
-                realParti,
-                imagParti,
-                oscillatoryFrequency,
-                dampingRatio,
-                None,  # Placeholder for participation factor data
-                None   # Placeholder for dominant subpart
-            ]
-            # Participation Factor Analysis
-            participationFactorModei = Pmat[:, i]
-            participationFactorData = [
-                ["State Location", "Participation Factor in Complex", "Participation Factor in Magnitude", "Dominant State Name", "Dominant Subpart"]
-            ]
-            # Calculate participation factors
-            for k, pf in enumerate(participationFactorModei):
-                pf_magnitude = abs(pf)
-                if pf_magnitude >= dominantParticipationFactorBoundary:
-                    participationFactorData.append([
-                        k+1,
-                        pf,
-                        pf_magnitude,
-                        ssVariables[k][0],
-                        ssVariables[k][1]
-                    ])
-            modalAnalysis[5] = participationFactorData
-            subPartsInfo = set(row[4] for row in participationFactorData[1:])
-            modalAnalysis[6] = ' & '.join(subPartsInfo)
-            eigenvalueAnalysisResults['modalAnalysis'].append(modalAnalysis)
-    minDampingRatio = min(row[4] for row in eigenvalueAnalysisResults['modalAnalysis'][1:])
-    eigenvalueAnalysisResults['minDampingRatio'] = minDampingRatio
+    if shifts is not None:
+        if not eigenvectors:
+            return EigenvalueAnalysisResults(eigenvalue_shift_invert(Asys, shifts, modesPerShift, eigenvectors=False), partial=True)
+        eigs, Rvmat, Lvmat = eigenvalue_shift_invert(Asys, shifts, modesPerShift)
+        Pmat = Rvmat * Lvmat
+    elif not eigenvectors:
+        return EigenvalueAnalysisResults(linalg.eigvals(Asys))
+    else:
+        # Left eigenvectors from the solver: vl[:, i]^H A = eigs[i] vl[:, i]^H,
+        # scaled so that each left row vector times its right eigenvector is 1
+        eigs, Lvmat, Rvmat = linalg.eig(Asys, left=True)
+        Lvmat = np.conj(Lvmat)
+        Pmat = Rvmat * Lvmat / np.sum(Lvmat * Rvmat, axis=0)
 
-    return eigenvalueAnalysisResults
+    # Participation Factor Analysis: keep the dominant (mode, state) pairs of the
+    # modes with imag >= 0 (one per conjugate pair)
+    participationFactor = Pmat[:, np.imag(eigs) >= 0].T
+    modeIndex, stateIndex = np.nonzero(np.abs(participationFactor) >= dominantParticipationFactorBoundary)
+    participation = sps.csr_matrix(
+        (participationFactor[modeIndex, stateIndex], (modeIndex, stateIndex)), shape=participationFactor.shape
+    )
+    ssVariables = np.asarray(ssVariables, dtype=object).reshape(-1, 2)
+
+    return EigenvalueAnalysisResults(eigs, participation, ssVariables, partial=shifts is not None)
@@ -0,0 +1,23 @@
+import numpy as np
+
+def eigenvalue_analysis_batch(Asys, chunkSize=None):
+    # Eigenvalues of a stack of system matrices, Asys of shape (N, n, n) (any
+    # leading batch shape works), in batched np.linalg.eigvals calls of at most
+    # chunkSize matrices to bound the LAPACK workspace. Returns eigs (N, n) and
+    # maxRealValue and minDampingRatio per matrix, as in eigenvalue_analysis
+    Asys = np.asarray(Asys)
+    batch, n = Asys.shape[:-2], Asys.shape[-1]
+    Asys = Asys.reshape((-1, n, n))
+    chunkSize = chunkSize or max(len(Asys), 1)
+
+    eigs = np.empty((len(Asys), n), dtype=complex)
+    for start in range(0, len(Asys), chunkSize):
+        eigs[start:start + chunkSize] = np.linalg.eigvals(Asys[start:start + chunkSize])
+
+    # Conjugate pairs share their damping ratio, so all eigenvalues can be used
+    dampingRatio = -np.real(eigs) / np.abs(eigs)
+    return {
+        'eigs': eigs.reshape(batch + (n,)),
+        'maxRealValue': np.max(np.real(eigs), axis=-1).reshape(batch),
+        'minDampingRatio': np.min(dampingRatio, axis=-1).reshape(batch),
+    }
@@ -0,0 +1,75 @@
+import numpy as np
+
+MODAL_ANALYSIS_HEADER = ["Mode", "Real Part", "Imag Part", "Oscillatory Frequency", "Damping Ratio", "Participation Factor", "Dominant Subpart"]
+PARTICIPATION_HEADER = ["State Location", "Participation Factor in Complex", "Participation Factor in Magnitude", "Dominant State Name", "Dominant Subpart"]
+
+class EigenvalueAnalysisResults:
+    # Compact result of eigenvalue_analysis: the eigenvalues, per-mode arrays for
+    # the modes (one per conjugate pair, imag >= 0), the dominant participation
+    # factors as a CSR (modes x states) matrix or None, and the (n, 2) [state
+    # name, label] array shared with the assembler. Indexing by the old dict
+    # keys ('eigs', 'maxRealValue', 'minDampingRatio', 'modalAnalysis') gives
+    # the previous values, the modalAnalysis table being built on access.
+    # A partial spectrum (shift-invert) has no system-wide margins: maxRealValue
+    # and minDampingRatio are None and the margins over the modes found are in
+    # criticalMaxRealValue and criticalMinDampingRatio
+    __slots__ = ('eigs', 'modes', 'frequency', 'dampingRatio', 'maxRealValue', 'minDampingRatio',
+                 'criticalMaxRealValue', 'criticalMinDampingRatio', 'participation', 'ssVariables')
+    KEYS = ('modalAnalysis', 'eigs', 'maxRealValue', 'minDampingRatio')
+
+    def __init__(self, eigs, participation=None, ssVariables=None, partial=False):
+        self.eigs = eigs
+        self.modes = np.flatnonzero(np.imag(eigs) >= 0)
+        self.frequency = np.abs(np.imag(eigs[self.modes])) / (2 * np.pi)
+        self.dampingRatio = -np.real(eigs[self.modes]) / np.abs(eigs[self.modes])
+        maxRealValue, minDampingRatio = np.max(np.real(eigs)), np.min(self.dampingRatio)
+        if partial:
+            self.maxRealValue = self.minDampingRatio = None
+            self.criticalMaxRealValue, self.criticalMinDampingRatio = maxRealValue, minDampingRatio
+        else:
+            self.maxRealValue, self.minDampingRatio = maxRealValue, minDampingRatio
+            self.criticalMaxRealValue = self.criticalMinDampingRatio = None
+        self.participation = participation
+        self.ssVariables = ssVariables
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def keys(self):
+        return self.KEYS
+
+    def get(self, key, default=None):
+        return self[key] if key in self.KEYS else default
+
+    @property
+    def modalAnalysis(self):
+        modeEigs = self.eigs[self.modes]
+        rows = zip(np.real(modeEigs), np.imag(modeEigs), self.frequency, self.dampingRatio)
+        if self.participation is None:
+            return [list(MODAL_ANALYSIS_HEADER)] + [[f"Mode {j + 1}", *row, None, None] for j, row in enumerate(rows)]
+
+        # Dominant subparts: labels present in each mode, in order of first appearance
+        participation = self.participation
+        labels, firstIndex, labelIndex = np.unique(self.ssVariables[:, 1].astype(str), return_index=True, return_inverse=True)
+        order = np.argsort(firstIndex)
+        modeIndex = np.repeat(np.arange(participation.shape[0]), np.diff(participation.indptr))
+        present = np.zeros((participation.shape[0], len(labels)), dtype=bool)
+        present[modeIndex, labelIndex[participation.indices]] = True
+
+        modalAnalysis = [list(MODAL_ANALYSIS_HEADER)]
+        for j, (row, mask) in enumerate(zip(rows, present[:, order])):
+            span = slice(participation.indptr[j], participation.indptr[j + 1])
+            states, pf = participation.indices[span], participation.data[span]
+            participationFactorData = [list(PARTICIPATION_HEADER)] + [
+                list(entry) for entry in zip(states + 1, pf, np.abs(pf), self.ssVariables[states, 0], self.ssVariables[states, 1])
+            ]
+            modalAnalysis.append([f"Mode {j + 1}", *row, participationFactorData, ' & '.join(labels[order][mask])])
+        return modalAnalysis
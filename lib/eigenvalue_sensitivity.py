@@ -0,0 +1,56 @@
+import numpy as np
+from scipy import linalg
+from lib.pf_solve import pf_solve
+
+def eigenvalue_sensitivity(asysFunc, parasList, relativeStep=1e-6):
+    # Sensitivity of every eigenvalue to every scalar model parameter from one
+    # eigendecomposition, d(eig_i)/dp = w_i^T (dA/dp) v_i / (w_i^T v_i), e.g.
+    #   asysFunc = lambda *paras, **kw: ssmodel_droop_droop(wbase, *paras, 0.01, stabilityOnly=True, **kw)[0]
+    #   eigenvalue_sensitivity(asysFunc, [parasIBR1, parasIBR2, parasLoad])
+    # asysFunc must forward pfSolution to the wrapper. The power flow is solved
+    # once; its dependence on p comes from implicit differentiation with the
+    # analytic PF Jacobian, dx/dp = -J^-1 dF/dp, so the perturbed linearizations
+    # run at x* - J^-1 F(x*, p +- h) without another fsolve. dA/dp is the
+    # central difference of those linearizations (stabilityOnly=True keeps them
+    # to eigenvalues only); parameters that are not finite scalars (e.g.
+    # mq = inf) are skipped. A power flow that does not converge (fsolve-style
+    # pfExitFlag != 1, as in pf_solve_batch) raises ValueError.
+    # Returns eigs, the parameters as [dict index, key] rows and the (P, n)
+    # complex sensitivity table, row p for parameters[p], column i for eigs[i]
+    pf = {}
+
+    def solve(pfFunc, pfJac, x0, args):
+        x, info, ier, msg = pf_solve(pfFunc, pfJac, x0, args)
+        if ier != 1:
+            raise ValueError(f"Power flow did not converge (pfExitFlag {ier}): {' '.join(msg.split())}")
+        pf.update(func=pfFunc, x=x, lu=linalg.lu_factor(pfJac(x, *args)))
+        return x, ier
+
+    def tangent(pfFunc, pfJac, x0, args):
+        return pf['x'] - linalg.lu_solve(pf['lu'], pfFunc(pf['x'], *args)), 1
+
+    A = asysFunc(*parasList, pfSolution=solve)
+    eigs, Lvmat, Rvmat = linalg.eig(A, left=True)
+    Lvmat = np.conj(Lvmat)
+    Lvmat = Lvmat / np.sum(Lvmat * Rvmat, axis=0)
+
+    parameters = [
+        [i, key]
+        for i, paras in enumerate(parasList)
+        for key, value in paras.items()
+        if np.ndim(value) == 0 and np.isreal(value) and np.isfinite(value)
+    ]
+    dA = np.empty((len(parameters),) + A.shape)
+    for p, (i, key) in enumerate(parameters):
+        value = parasList[i][key]
+        step = relativeStep * max(abs(value), 1.0)
+        perturbed = list(parasList)
+        perturbed[i] = dict(parasList[i])
+        perturbed[i][key] = value + step
+        Aplus = asysFunc(*perturbed, pfSolution=tangent)
+        perturbed[i][key] = value - step
+        Aminus = asysFunc(*perturbed, pfSolution=tangent)
+        dA[p] = (Aplus - Aminus) / (2 * step)
+
+    sensitivity = np.einsum('ki,pkl,li->pi', Lvmat, dA, Rvmat)
+    return {'eigs': eigs, 'parameters': parameters, 'sensitivity': sensitivity}
@@ -0,0 +1,65 @@
+import numpy as np
+import scipy.sparse as sps
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.linalg import eigs, splu
+
+def eigenvalue_shift_invert(Asys, shifts, modesPerShift=6, eigenvectors=True):
+    # The modesPerShift eigenvalues of Asys (dense or scipy.sparse) closest to
+    # each shift, by ARPACK shift-invert, e.g. shifts = 2j * np.pi * [0.1, 1, 10]
+    # for modes near 0.1, 1 and 10 Hz. Closeness is distance in the complex
+    # plane: a shift at 0 finds the eigenvalues nearest the origin, not those
+    # nearest the imaginary axis, so a stability margin needs shifts spread
+    # along the imaginary axis over the band of interest and is still only as
+    # good as that coverage. Eigenvalues found from several shifts are kept once.
+    # Returns eigs and, with eigenvectors=True, the right eigenvectors Rvmat and
+    # left row eigenvectors Lvmat (column i is the row vector of mode i) scaled
+    # so that Lvmat[:, i] @ Rvmat[:, i] = 1
+    A = sps.csc_matrix(Asys, dtype=complex)
+    n = A.shape[0]
+    k = min(modesPerShift, n - 2)
+    if k < 1:
+        raise ValueError(f"Shift-invert needs at least 3 states, got {n}")
+
+    eigsList, RvList, LvList = [], [], []
+    for sigma in np.atleast_1d(shifts):
+        if not eigenvectors:
+            eigsList.append(eigs(A, k=k, sigma=sigma, return_eigenvectors=False))
+            continue
+        eigsRight, Rvmat = eigs(A, k=k, sigma=sigma)
+        # Left eigenvectors are the right eigenvectors of A^T, paired by eigenvalue
+        eigsLeft, Lvmat = eigs(A.T, k=k, sigma=sigma)
+        pairing = linear_sum_assignment(np.abs(eigsRight[:, None] - eigsLeft[None, :]))[1]
+        Lvmat = Lvmat[:, pairing]
+        # ARPACK may converge to slightly different sets for A and A^T; modes
+        # without a matching left eigenvalue get theirs by inverse iteration
+        for i in np.flatnonzero(np.abs(eigsRight - eigsLeft[pairing]) > 1e-6 * (1 + np.abs(eigsRight))):
+            Lvmat[:, i] = eigenvalue_shift_invert_left(A, eigsRight[i])
+        eigsList.append(eigsRight)
+        RvList.append(Rvmat)
+        LvList.append(Lvmat / np.sum(Lvmat * Rvmat, axis=0))
+
+    allEigs = np.concatenate(eigsList)
+    # Complex arithmetic leaves round-off imaginary parts on real eigenvalues
+    allEigs = np.where(np.abs(allEigs.imag) <= 1e-10 * np.abs(allEigs), allEigs.real, allEigs)
+    # Drop repeats found from overlapping shifts
+    distance = np.abs(allEigs[:, None] - allEigs[None, :])
+    duplicate = np.triu(distance <= 1e-8 * (1 + np.abs(allEigs))[:, None], k=1).any(axis=0)
+    keep = ~duplicate
+    if not eigenvectors:
+        return allEigs[keep]
+    return allEigs[keep], np.concatenate(RvList, axis=1)[:, keep], np.concatenate(LvList, axis=1)[:, keep]
+
+
+def eigenvalue_shift_invert_left(A, eig):
+    # Left eigenvector of A (sparse) for a known eigenvalue: the right
+    # eigenvector of A^T by two steps of inverse iteration just off eig
+    n = A.shape[0]
+    lu = splu(sps.csc_matrix(A.T - (eig + 1e-8 * (1 + abs(eig))) * sps.identity(n, dtype=complex, format='csc')))
+    vector = np.ones(n, dtype=complex)
+    for _ in range(2):
+        vector = lu.solve(vector)
+        vector /= np.linalg.norm(vector)
+    residual = np.linalg.norm(A.T @ vector - eig * vector)
+    if residual > 1e-6 * (1 + abs(eig)) * max(1.0, abs(A).max()):
+        raise ValueError(f"No left eigenvector found for the eigenvalue {eig} (residual {residual:.3g})")
+    return vector
@@ -0,0 +1,30 @@
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+def eigenvalue_track(eigs, eigenvectors=None, chunkSize=1024):
+    # Root loci over a sweep: eigs is (N, n) from consecutive sweep points (e.g.
+    # eigenvalue_analysis_batch(...)['eigs']) in solver order, eigenvectors the
+    # optional (N, n, n) right eigenvectors (column i belongs to eigs[:, i]).
+    # Consecutive points are matched by minimum total cost, the relative
+    # eigenvalue distance plus, with eigenvectors, 1 - |cosine similarity|.
+    # Returns the tracked (N, n) eigenvalues, column j following one physical
+    # mode, and the (N, n) indices into the solver order that produced them
+    eigs = np.asarray(eigs)
+    N, n = eigs.shape
+    match = np.empty((max(N - 1, 0), n), dtype=int)
+    for start in range(0, N - 1, chunkSize):
+        stop = min(start + chunkSize, N - 1)
+        before, after = eigs[start:stop, :, None], eigs[start + 1:stop + 1, None, :]
+        cost = np.abs(before - after) / (1 + np.abs(before) + np.abs(after))
+        if eigenvectors is not None:
+            V = eigenvectors[start:stop + 1] / np.linalg.norm(eigenvectors[start:stop + 1], axis=-2, keepdims=True)
+            cost = cost + 1 - np.abs(np.conj(np.swapaxes(V[:-1], -2, -1)) @ V[1:])
+        # Pairs are independent, only their composition below is sequential
+        for k, c in enumerate(cost):
+            match[start + k] = linear_sum_assignment(c)[1]
+
+    order = np.empty((N, n), dtype=int)
+    order[0] = np.arange(n)
+    for k in range(N - 1):
+        order[k + 1] = match[k][order[k]]
+    return np.take_along_axis(eigs, order, axis=1), order
@@ -0,0 +1,11 @@
+from lib.pf_network import pf_network_index, pf_network_voltage, pf_network_ybus
+
+def pf_calc_network(x, network, index=None):
+    # Frequency, bus voltage phasors and bus injection currents (Y V) at the
+    # solution; generator g sees V[meterBus] and injects I[bus]
+    index = pf_network_index(network) if index is None else index
+    w, V = pf_network_voltage(x, index)
+    Y, dYdw = pf_network_ybus(network, w)
+    I = Y @ V
+
+    return w, V, I
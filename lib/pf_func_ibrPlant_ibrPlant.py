@@ -27,15 +27,15 @@ def pf_func_ibrPlant_ibrPlant(x, parasGen1, parasGen2, parasLine1, parasLine2, p
     Rx = parasLoad['Rx']
 
     imagUnit = 1j
-    w = x[0]
+    w = x[..., 0]
     theta0 = 0
-    theta1 = x[1]
-    theta2 = x[2]
-    theta3 = x[3]
-    Vabs0 = x[4]
-    Vabs1 = x[5]
-    Vabs2 = x[6]
-    Vabs3 = x[7]
+    theta1 = x[..., 1]
+    theta2 = x[..., 2]
+    theta3 = x[..., 3]
+    Vabs0 = x[..., 4]
+    Vabs1 = x[..., 5]
+    Vabs2 = x[..., 6]
+    Vabs3 = x[..., 7]
 
     Zc1 = Rc1 + imagUnit * w * Lc1
     Zline1 = Rline1 + imagUnit * w * Lline1
@@ -64,14 +64,14 @@ def pf_func_ibrPlant_ibrPlant(x, parasGen1, parasGen2, parasLine1, parasLine2, p
 
     Iload = V3 / Zload + V3 / Rx
 
-    f = np.zeros(8, )
-    f[0] = wset1 - mp1 * (Po1 - Pset1) - w
-    f[1] = Vset1 - mq1 * (Qo1 - Qset1) - Vabs1
-    f[2] = wset2 - mp2 * (Po2 - Pset2) - w
-    f[3] = Vset2 - mq2 * (Qo2 - Qset2) - Vabs2
-    f[4] = np.real(Iline1 + Iline2 - Iload)
-    f[5] = np.imag(Iline1 + Iline2 - Iload)
-    f[6] = np.real(Vo1 - V0)
-    f[7] = np.imag(Vo1 - V0)
+    f = np.zeros(np.shape(x))
+    f[..., 0] = wset1 - mp1 * (Po1 - Pset1) - w
+    f[..., 1] = Vset1 - mq1 * (Qo1 - Qset1) - Vabs1
+    f[..., 2] = wset2 - mp2 * (Po2 - Pset2) - w
+    f[..., 3] = Vset2 - mq2 * (Qo2 - Qset2) - Vabs2
+    f[..., 4] = np.real(Iline1 + Iline2 - Iload)
+    f[..., 5] = np.imag(Iline1 + Iline2 - Iload)
+    f[..., 6] = np.real(Vo1 - V0)
+    f[..., 7] = np.imag(Vo1 - V0)
 
     return f
@@ -13,9 +13,9 @@ def pf_func_ibrPlant_infinite(x, parasIBR):
     imagUnit = 1j
     w = 1
     theta1 = 0
-    theta2 = x[0]
+    theta2 = x[..., 0]
     Vabs1 = 1
-    Vabs2 = x[1]
+    Vabs2 = x[..., 1]
 
     Zc = Rc + imagUnit * w * Lc
 
@@ -28,8 +28,8 @@ def pf_func_ibrPlant_infinite(x, parasIBR):
     P1 = np.real(S1)
     Q1 = np.imag(S1)
 
-    f = np.zeros(2)
-    f[0] = (wsetPlant - w) / mpPlant + PsetPlant - P1
-    f[1] = (VsetPlant - Vabs1) / mqPlant + QsetPlant - Q1
+    f = np.zeros(np.shape(x))
+    f[..., 0] = (wsetPlant - w) / mpPlant + PsetPlant - P1
+    f[..., 1] = (VsetPlant - Vabs1) / mqPlant + QsetPlant - Q1
 
     return f
\ No newline at end of file
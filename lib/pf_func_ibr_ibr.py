@@ -25,13 +25,13 @@ def pf_func_ibr_ibr(x, parasGen1, parasGen2, parasLoad):
     Rx = parasLoad['Rx']
 
     imagUnit = 1j
-    w = x[0]
+    w = x[..., 0]
     theta1 = 0
-    theta2 = x[1]
-    theta3 = x[2]
-    Vabs1 = x[3]
-    Vabs2 = x[4]
-    Vabs3 = x[5]
+    theta2 = x[..., 1]
+    theta3 = x[..., 2]
+    Vabs1 = x[..., 3]
+    Vabs2 = x[..., 4]
+    Vabs3 = x[..., 5]
 
     Zline1 = Rc1 + imagUnit * w * Lc1
     Zline2 = Rc2 + imagUnit * w * Lc2
@@ -55,12 +55,12 @@ def pf_func_ibr_ibr(x, parasGen1, parasGen2, parasLoad):
 
     Iload = V3 / Zload + V3 / Rx
 
-    f = np.zeros(6, )
-    f[0] = wset1 - mp1 * (Po1 - Pset1) - w
-    f[1] = Vset1 - mq1 * (Qo1 - Qset1) - Vabs1
-    f[2] = wset2 - mp2 * (Po2 - Pset2) - w
-    f[3] = Vset2 - mq2 * (Qo2 - Qset2) - Vabs2
-    f[4] = np.real(Io1 + Io2 - Iload)
-    f[5] = np.imag(Io1 + Io2 - Iload)
+    f = np.zeros(np.shape(x))
+    f[..., 0] = wset1 - mp1 * (Po1 - Pset1) - w
+    f[..., 1] = Vset1 - mq1 * (Qo1 - Qset1) - Vabs1
+    f[..., 2] = wset2 - mp2 * (Po2 - Pset2) - w
+    f[..., 3] = Vset2 - mq2 * (Qo2 - Qset2) - Vabs2
+    f[..., 4] = np.real(Io1 + Io2 - Iload)
+    f[..., 5] = np.imag(Io1 + Io2 - Iload)
 
     return f
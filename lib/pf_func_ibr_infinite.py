@@ -13,9 +13,9 @@ def pf_func_ibr_infinite(x, parasIBR):
     imagUnit = 1j
     w = 1
     theta1 = 0
-    theta2 = x[0]
+    theta2 = x[..., 0]
     Vabs1 = 1
-    Vabs2 = x[1]
+    Vabs2 = x[..., 1]
 
     Zc = Rc + imagUnit * w * Lc
 
@@ -28,8 +28,8 @@ def pf_func_ibr_infinite(x, parasIBR):
     P2 = np.real(S2)
     Q2 = np.imag(S2)
 
-    f = np.zeros(2, )
-    f[0] = (wset - w) / mp + Pset - P2
-    f[1] = (Vset - Vabs2) / mq + Qset - Q2
+    f = np.zeros(np.shape(x))
+    f[..., 0] = (wset - w) / mp + Pset - P2
+    f[..., 1] = (Vset - Vabs2) / mq + Qset - Q2
 
     return f
\ No newline at end of file
@@ -24,13 +24,13 @@ def pf_func_ibr_sg(x, parasGen1, parasGen2, parasLine1, parasLine2, parasLoad):
     Lload = parasLoad['Lload']
     Rx = parasLoad['Rx']
 
-    w = x[0]
+    w = x[..., 0]
     theta1 = 0
-    theta2 = x[1]
-    theta3 = x[2]
-    Vabs1 = x[3]
-    Vabs2 = x[4]
-    Vabs3 = x[5]
+    theta2 = x[..., 1]
+    theta3 = x[..., 2]
+    Vabs1 = x[..., 3]
+    Vabs2 = x[..., 4]
+    Vabs3 = x[..., 5]
 
     Zline1 = Rline1 + 1j * w * Lline1
     Zline2 = Rline2 + 1j * w * Lline2
@@ -52,18 +52,13 @@ def pf_func_ibr_sg(x, parasGen1, parasGen2, parasLine1, parasLine2, parasLoad):
 
     Iload = V3 / Zload + V3 / Rx
 
-    f = np.zeros(6)
-    f[0] = wset1 - mp1 * (Po1 - Pset1) - w
-    if np.isinf(mq1):
-        f[1] = Vset1 - Vabs1
-    else:
-        f[1] = Vset1 - mq1 * (Qo1 - Qset1) - Vabs1
-    f[2] = wset2 - mp2 * (Po2 - Pset2) - w
-    if np.isinf(mq2):
-        f[3] = Vset2 - Vabs2
-    else:
-        f[3] = Vset2 - mq2 * (Qo2 - Qset2) - Vabs2
-    f[4] = (Io1 + IlineSG - Iload).real
-    f[5] = (Io1 + IlineSG - Iload).imag
+    f = np.zeros(np.shape(x))
+    f[..., 0] = wset1 - mp1 * (Po1 - Pset1) - w
+    # An infinite mq fixes the voltage magnitude (no Q-V droop)
+    f[..., 1] = Vset1 - np.where(np.isinf(mq1), 0, mq1) * (Qo1 - Qset1) - Vabs1
+    f[..., 2] = wset2 - mp2 * (Po2 - Pset2) - w
+    f[..., 3] = Vset2 - np.where(np.isinf(mq2), 0, mq2) * (Qo2 - Qset2) - Vabs2
+    f[..., 4] = (Io1 + IlineSG - Iload).real
+    f[..., 5] = (Io1 + IlineSG - Iload).imag
 
     return f
\ No newline at end of file
@@ -0,0 +1,24 @@
+import numpy as np
+from lib.pf_network import pf_network_index, pf_network_voltage, pf_network_ybus
+
+def pf_func_network(x, network, index=None):
+    # Power-flow residuals of an arbitrary droop-controlled network (see
+    # lib/pf_network.py): P-f and Q-V droop per generator, then KCL at every
+    # other bus
+    index = pf_network_index(network) if index is None else index
+    w, V = pf_network_voltage(x, index)
+    Y, dYdw = pf_network_ybus(network, w)
+    I = Y @ V
+
+    genBus, meterBus = index['genBus'], index['meterBus']
+    So = V[meterBus] * np.conj(I[genBus])
+    mq = np.where(np.isinf(index['mq']), 0, index['mq'])
+
+    f = np.concatenate([
+        index['wset'] - index['mp'] * (So.real - index['Pset']) - w,
+        index['Vset'] - mq * (So.imag - index['Qset']) - np.abs(V[meterBus]),
+        I[index['kclBus']].real,
+        I[index['kclBus']].imag,
+    ])
+
+    return f
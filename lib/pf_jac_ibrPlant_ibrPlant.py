@@ -0,0 +1,78 @@
+import numpy as np
+
+def pf_jac_ibrPlant_ibrPlant(x, parasGen1, parasGen2, parasLine1, parasLine2, parasLoad):
+    # Analytic Jacobian of pf_func_ibrPlant_ibrPlant with respect to
+    # x = [w, theta1, theta2, theta3, Vabs0, Vabs1, Vabs2, Vabs3].
+    # x may be stacked as (..., k) with matching parameter arrays, giving J of shape (..., k, k)
+    mp1 = parasGen1['mpPlant']
+    mq1 = parasGen1['mqPlant']
+    Rc1 = parasGen1['Rc']
+
+    mp2 = parasGen2['mpPlant']
+    mq2 = parasGen2['mqPlant']
+    Lc1 = parasGen1['Lc']
+
+    Rline1 = parasLine1['Rline']
+    Lline1 = parasLine1['Lline']
+    Rline2 = parasLine2['Rline']
+    Lline2 = parasLine2['Lline']
+
+    Rload = parasLoad['Rload']
+    Lload = parasLoad['Lload']
+    Rx = parasLoad['Rx']
+
+    imagUnit = 1j
+    w = x[..., 0]
+    theta0 = 0
+    theta1 = x[..., 1]
+    theta2 = x[..., 2]
+    theta3 = x[..., 3]
+    Vabs0 = x[..., 4]
+    Vabs1 = x[..., 5]
+    Vabs2 = x[..., 6]
+    Vabs3 = x[..., 7]
+
+    Zc1 = Rc1 + imagUnit * w * Lc1
+    Zline1 = Rline1 + imagUnit * w * Lline1
+    Zline2 = Rline2 + imagUnit * w * Lline2
+    Zload = Rload + imagUnit * w * Lload
+
+    V1 = Vabs1 * np.exp(imagUnit * theta1)
+    V2 = Vabs2 * np.exp(imagUnit * theta2)
+    V3 = Vabs3 * np.exp(imagUnit * theta3)
+
+    Iline1 = (V1 - V3) / Zline1
+    Io1 = Iline1 + V1 / Rx
+
+    Iline2 = (V2 - V3) / Zline2
+    Io2 = Iline2 + V2 / Rx
+
+    # Derivatives of the phasors along each entry of x
+    e = np.eye(8).reshape((8, 8) + (1,) * (np.ndim(x) - 1))
+    dV0 = e[4] * np.exp(imagUnit * theta0)
+    dV1 = e[1] * imagUnit * V1 + e[5] * np.exp(imagUnit * theta1)
+    dV2 = e[2] * imagUnit * V2 + e[6] * np.exp(imagUnit * theta2)
+    dV3 = e[3] * imagUnit * V3 + e[7] * np.exp(imagUnit * theta3)
+
+    dIline1 = (dV1 - dV3) / Zline1 - Iline1 * e[0] * imagUnit * Lline1 / Zline1
+    dIo1 = dIline1 + dV1 / Rx
+    dSo1 = dV1 * np.conj(Io1) + V1 * np.conj(dIo1)
+    dVo1 = dV1 + dIo1 * Zc1 + Io1 * e[0] * imagUnit * Lc1
+
+    dIline2 = (dV2 - dV3) / Zline2 - Iline2 * e[0] * imagUnit * Lline2 / Zline2
+    dIo2 = dIline2 + dV2 / Rx
+    dSo2 = dV2 * np.conj(Io2) + V2 * np.conj(dIo2)
+
+    dIload = dV3 / Zload - V3 * e[0] * imagUnit * Lload / Zload**2 + dV3 / Rx
+
+    J = np.zeros((8, 8) + np.shape(x)[:-1])
+    J[0] = -mp1 * np.real(dSo1) - e[0]
+    J[1] = -mq1 * np.imag(dSo1) - e[5]
+    J[2] = -mp2 * np.real(dSo2) - e[0]
+    J[3] = -mq2 * np.imag(dSo2) - e[6]
+    J[4] = np.real(dIline1 + dIline2 - dIload)
+    J[5] = np.imag(dIline1 + dIline2 - dIload)
+    J[6] = np.real(dVo1 - dV0)
+    J[7] = np.imag(dVo1 - dV0)
+
+    return np.moveaxis(J, (0, 1), (-2, -1))
@@ -0,0 +1,31 @@
+import numpy as np
+
+def pf_jac_ibrPlant_infinite(x, parasIBR):
+    # Analytic Jacobian of pf_func_ibrPlant_infinite with respect to x = [theta2, Vabs2].
+    # x may be stacked as (..., k) with matching parameter arrays, giving J of shape (..., k, k)
+    Rc = parasIBR['Rc']
+    Lc = parasIBR['Lc']
+
+    imagUnit = 1j
+    w = 1
+    theta1 = 0
+    theta2 = x[..., 0]
+    Vabs1 = 1
+    Vabs2 = x[..., 1]
+
+    Zc = Rc + imagUnit * w * Lc
+
+    V1 = Vabs1 * np.exp(imagUnit * theta1)
+    V2 = Vabs2 * np.exp(imagUnit * theta2)
+
+    # Derivatives of the phasors along each entry of x
+    e = np.eye(2).reshape((2, 2) + (1,) * (np.ndim(x) - 1))
+    dV2 = e[0] * imagUnit * V2 + e[1] * np.exp(imagUnit * theta2)
+    dI = dV2 / Zc
+    dS1 = V1 * np.conj(dI)
+
+    J = np.zeros((2, 2) + np.shape(x)[:-1])
+    J[0] = -np.real(dS1)
+    J[1] = -np.imag(dS1)
+
+    return np.moveaxis(J, (0, 1), (-2, -1))
@@ -0,0 +1,63 @@
+import numpy as np
+
+def pf_jac_ibr_ibr(x, parasGen1, parasGen2, parasLoad):
+    # Analytic Jacobian of pf_func_ibr_ibr with respect to
+    # x = [w, theta2, theta3, Vabs1, Vabs2, Vabs3].
+    # x may be stacked as (..., k) with matching parameter arrays, giving J of shape (..., k, k)
+    mp1 = parasGen1['mp']
+    mq1 = parasGen1['mq']
+
+    mp2 = parasGen2['mp']
+    mq2 = parasGen2['mq']
+
+    Rc1 = parasGen1['Rc']
+    Lc1 = parasGen1['Lc']
+    Rc2 = parasGen2['Rc']
+    Lc2 = parasGen2['Lc']
+
+    Rload = parasLoad['Rload']
+    Lload = parasLoad['Lload']
+    Rx = parasLoad['Rx']
+
+    imagUnit = 1j
+    w = x[..., 0]
+    theta1 = 0
+    theta2 = x[..., 1]
+    theta3 = x[..., 2]
+    Vabs1 = x[..., 3]
+    Vabs2 = x[..., 4]
+    Vabs3 = x[..., 5]
+
+    Zline1 = Rc1 + imagUnit * w * Lc1
+    Zline2 = Rc2 + imagUnit * w * Lc2
+    Zload = Rload + imagUnit * w * Lload
+
+    V1 = Vabs1 * np.exp(imagUnit * theta1)
+    V2 = Vabs2 * np.exp(imagUnit * theta2)
+    V3 = Vabs3 * np.exp(imagUnit * theta3)
+
+    Io1 = (V1 - V3) / Zline1
+    Io2 = (V2 - V3) / Zline2
+
+    # Derivatives of the phasors along each entry of x
+    e = np.eye(6).reshape((6, 6) + (1,) * (np.ndim(x) - 1))
+    dV1 = e[3] * np.exp(imagUnit * theta1)
+    dV2 = e[1] * imagUnit * V2 + e[4] * np.exp(imagUnit * theta2)
+    dV3 = e[2] * imagUnit * V3 + e[5] * np.exp(imagUnit * theta3)
+
+    dIo1 = (dV1 - dV3) / Zline1 - Io1 * e[0] * imagUnit * Lc1 / Zline1
+    dIo2 = (dV2 - dV3) / Zline2 - Io2 * e[0] * imagUnit * Lc2 / Zline2
+    dIload = dV3 / Zload - V3 * e[0] * imagUnit * Lload / Zload**2 + dV3 / Rx
+
+    dSo1 = dV1 * np.conj(Io1) + V1 * np.conj(dIo1)
+    dSo2 = dV2 * np.conj(Io2) + V2 * np.conj(dIo2)
+
+    J = np.zeros((6, 6) + np.shape(x)[:-1])
+    J[0] = -mp1 * np.real(dSo1) - e[0]
+    J[1] = -mq1 * np.imag(dSo1) - e[3]
+    J[2] = -mp2 * np.real(dSo2) - e[0]
+    J[3] = -mq2 * np.imag(dSo2) - e[4]
+    J[4] = np.real(dIo1 + dIo2 - dIload)
+    J[5] = np.imag(dIo1 + dIo2 - dIload)
+
+    return np.moveaxis(J, (0, 1), (-2, -1))
@@ -0,0 +1,34 @@
+import numpy as np
+
+def pf_jac_ibr_infinite(x, parasIBR):
+    # Analytic Jacobian of pf_func_ibr_infinite with respect to x = [theta2, Vabs2].
+    # x may be stacked as (..., k) with matching parameter arrays, giving J of shape (..., k, k)
+    mq = parasIBR['mq']
+    Rc = parasIBR['Rc']
+    Lc = parasIBR['Lc']
+
+    imagUnit = 1j
+    w = 1
+    theta1 = 0
+    theta2 = x[..., 0]
+    Vabs1 = 1
+    Vabs2 = x[..., 1]
+
+    Zc = Rc + imagUnit * w * Lc
+
+    V1 = Vabs1 * np.exp(imagUnit * theta1)
+    V2 = Vabs2 * np.exp(imagUnit * theta2)
+
+    I = (V2 - V1) / Zc
+
+    # Derivatives of the phasors along each entry of x
+    e = np.eye(2).reshape((2, 2) + (1,) * (np.ndim(x) - 1))
+    dV2 = e[0] * imagUnit * V2 + e[1] * np.exp(imagUnit * theta2)
+    dI = dV2 / Zc
+    dS2 = dV2 * np.conj(I) + V2 * np.conj(dI)
+
+    J = np.zeros((2, 2) + np.shape(x)[:-1])
+    J[0] = -np.real(dS2)
+    J[1] = -e[1] / mq - np.imag(dS2)
+
+    return np.moveaxis(J, (0, 1), (-2, -1))
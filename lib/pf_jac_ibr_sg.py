@@ -0,0 +1,64 @@
+import numpy as np
+
+def pf_jac_ibr_sg(x, parasGen1, parasGen2, parasLine1, parasLine2, parasLoad):
+    # Analytic Jacobian of pf_func_ibr_sg with respect to
+    # x = [w, theta2, theta3, Vabs1, Vabs2, Vabs3].
+    # x may be stacked as (..., k) with matching parameter arrays, giving J of shape (..., k, k)
+    mp1 = parasGen1['mp']
+    mq1 = parasGen1['mq']
+
+    mp2 = parasGen2['mp']
+    mq2 = parasGen2['mq']
+
+    Rline1 = parasLine1['Rline']
+    Lline1 = parasLine1['Lline']
+    Rline2 = parasLine2['Rline']
+    Lline2 = parasLine2['Lline']
+
+    Rload = parasLoad['Rload']
+    Lload = parasLoad['Lload']
+    Rx = parasLoad['Rx']
+
+    w = x[..., 0]
+    theta1 = 0
+    theta2 = x[..., 1]
+    theta3 = x[..., 2]
+    Vabs1 = x[..., 3]
+    Vabs2 = x[..., 4]
+    Vabs3 = x[..., 5]
+
+    Zline1 = Rline1 + 1j * w * Lline1
+    Zline2 = Rline2 + 1j * w * Lline2
+    Zload = Rload + 1j * w * Lload
+
+    V1 = Vabs1 * np.exp(1j * theta1)
+    V2 = Vabs2 * np.exp(1j * theta2)
+    V3 = Vabs3 * np.exp(1j * theta3)
+
+    Io1 = (V1 - V3) / Zline1
+    IlineSG = (V2 - V3) / Zline2
+    Io2 = IlineSG + V2 / Rx
+
+    # Derivatives of the phasors along each entry of x
+    e = np.eye(6).reshape((6, 6) + (1,) * (np.ndim(x) - 1))
+    dV1 = e[3] * np.exp(1j * theta1)
+    dV2 = e[1] * 1j * V2 + e[4] * np.exp(1j * theta2)
+    dV3 = e[2] * 1j * V3 + e[5] * np.exp(1j * theta3)
+
+    dIo1 = (dV1 - dV3) / Zline1 - Io1 * e[0] * 1j * Lline1 / Zline1
+    dIlineSG = (dV2 - dV3) / Zline2 - IlineSG * e[0] * 1j * Lline2 / Zline2
+    dIo2 = dIlineSG + dV2 / Rx
+    dIload = dV3 / Zload - V3 * e[0] * 1j * Lload / Zload**2 + dV3 / Rx
+
+    dSo1 = dV1 * np.conj(Io1) + V1 * np.conj(dIo1)
+    dSo2 = dV2 * np.conj(Io2) + V2 * np.conj(dIo2)
+
+    J = np.zeros((6, 6) + np.shape(x)[:-1])
+    J[0] = -mp1 * dSo1.real - e[0]
+    J[1] = -np.where(np.isinf(mq1), 0, mq1) * dSo1.imag - e[3]
+    J[2] = -mp2 * dSo2.real - e[0]
+    J[3] = -np.where(np.isinf(mq2), 0, mq2) * dSo2.imag - e[4]
+    J[4] = (dIo1 + dIlineSG - dIload).real
+    J[5] = (dIo1 + dIlineSG - dIload).imag
+
+    return np.moveaxis(J, (0, 1), (-2, -1))
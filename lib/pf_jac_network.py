@@ -0,0 +1,46 @@
+import numpy as np
+import scipy.sparse as sps
+from lib.pf_network import pf_network_index, pf_network_voltage, pf_network_ybus
+
+def pf_jac_network(x, network, index=None):
+    # Sparse analytic Jacobian of pf_func_network (CSC, rows in the same order)
+    index = pf_network_index(network) if index is None else index
+    w, V = pf_network_voltage(x, index)
+    Y, dYdw = pf_network_ybus(network, w)
+    I = Y @ V
+
+    genBus, meterBus, kclBus = index['genBus'], index['meterBus'], index['kclBus']
+    nGen, nBus = len(genBus), index['nBus']
+    mq = np.where(np.isinf(index['mq']), 0, index['mq'])
+
+    # Derivatives along Re V and Im V of every bus, then along w
+    meter = sps.csr_matrix((np.ones(nGen), (np.arange(nGen), meterBus)), shape=(nGen, nBus))
+    Ygen = Y[genBus]
+    dSde = sps.diags(np.conj(I[genBus])) @ meter + sps.diags(V[meterBus]) @ Ygen.conj()
+    dSdf = 1j * sps.diags(np.conj(I[genBus])) @ meter - 1j * sps.diags(V[meterBus]) @ Ygen.conj()
+    dSdw = V[meterBus] * np.conj((dYdw @ V)[genBus])
+    Vabs = np.abs(V[meterBus])
+    dVabsde = sps.diags(V[meterBus].real / Vabs) @ meter
+    dVabsdf = sps.diags(V[meterBus].imag / Vabs) @ meter
+    dIde = Y[kclBus]
+    dIdf = 1j * Y[kclBus]
+    dIdw = (dYdw @ V)[kclBus]
+
+    dfde = sps.vstack([
+        -sps.diags(index['mp']) @ dSde.real,
+        -sps.diags(mq) @ dSde.imag - dVabsde,
+        dIde.real,
+        dIde.imag,
+    ]).tocsc()[:, index['eBus']]
+    dfdf = sps.vstack([
+        -sps.diags(index['mp']) @ dSdf.real,
+        -sps.diags(mq) @ dSdf.imag - dVabsdf,
+        dIdf.real,
+        dIdf.imag,
+    ]).tocsc()[:, index['fBus']]
+    blocks = [dfde, dfdf]
+    if index['hasW']:
+        dfdw = np.concatenate([-index['mp'] * dSdw.real - 1, -mq * dSdw.imag, dIdw.real, dIdw.imag])
+        blocks.insert(0, sps.csc_matrix(dfdw[:, None]))
+
+    return sps.hstack(blocks).tocsc()
@@ -0,0 +1,80 @@
+import numpy as np
+import scipy.sparse as sps
+
+# A network is described by a dict, e.g. the ibr_ibr topology:
+#   network = {
+#       'buses': 3,
+#       'generators': [{'bus': 0, 'paras': parasIBR1}, {'bus': 1, 'paras': parasIBR2}],
+#       'lines': [{'from': 0, 'to': 2, 'paras': {'Rline': Rc1, 'Lline': Lc1}}, ...],
+#       'loads': [{'bus': 2, 'paras': parasLoad}],
+#       'shunts': [{'bus': 2, 'R': Rx}],
+#   }
+# Generators take droop parameters Pset/Qset/wset/Vset/mp/mq (or the *Plant
+# variants) and regulate the power they inject at 'bus' as seen from
+# 'meterBus' (default 'bus'), so a plant whose droop acts at its PCC is
+# {'bus': internal bus, 'meterBus': PCC bus}. mq = inf fixes the voltage
+# magnitude. With 'infiniteBus' set that bus is held at 1∠0 and w = 1;
+# otherwise w is solved for and 'refBus' (default the first generator's bus)
+# carries the zero angle.
+
+def pf_network_gen_paras(paras):
+    suffix = 'Plant' if 'PsetPlant' in paras else ''
+    return [paras[k + suffix] for k in ('Pset', 'Qset', 'wset', 'Vset', 'mp', 'mq')]
+
+def pf_network_index(network):
+    # Unknowns are x = [w (islanded only), Re V at eBus, Im V at fBus]
+    nBus = network['buses']
+    generators = network.get('generators', [])
+    infiniteBus = network.get('infiniteBus')
+    refBus = infiniteBus if infiniteBus is not None else network.get('refBus', generators[0]['bus'])
+    genBus = np.array([g['bus'] for g in generators], dtype=int)
+    meterBus = np.array([g.get('meterBus', g['bus']) for g in generators], dtype=int)
+    droop = np.array([pf_network_gen_paras(g['paras']) for g in generators], dtype=float).reshape(-1, 6)
+    index = {
+        'nBus': nBus,
+        'hasW': infiniteBus is None,
+        'infiniteBus': infiniteBus,
+        'genBus': genBus,
+        'meterBus': meterBus,
+        'kclBus': np.array([k for k in range(nBus) if k not in set(genBus) and k != infiniteBus], dtype=int),
+        'eBus': np.array([k for k in range(nBus) if k != infiniteBus], dtype=int),
+        'fBus': np.array([k for k in range(nBus) if k != refBus], dtype=int),
+    }
+    index.update(zip(('Pset', 'Qset', 'wset', 'Vset', 'mp', 'mq'), droop.T))
+    nUnknown = int(index['hasW']) + len(index['eBus']) + len(index['fBus'])
+    if nUnknown != 2 * len(genBus) + 2 * len(index['kclBus']):
+        raise ValueError('Network power flow is not square: check generator, reference and infinite buses')
+    return index
+
+def pf_network_voltage(x, index):
+    x = np.asarray(x, dtype=float)
+    w = x[0] if index['hasW'] else 1.0
+    V = np.zeros(index['nBus'], dtype=complex)
+    if index['infiniteBus'] is not None:
+        V[index['infiniteBus']] = 1.0
+    offset = int(index['hasW'])
+    nE = len(index['eBus'])
+    V[index['eBus']] += x[offset:offset + nE]
+    V[index['fBus']] += 1j * x[offset + nE:]
+    return w, V
+
+def pf_network_ybus(network, w):
+    # Sparse bus admittance matrix Y(w) and its derivative dY/dw
+    nBus = network['buses']
+    lines = network.get('lines', [])
+    loads = network.get('loads', [])
+    shunts = network.get('shunts', [])
+    # Series R + jwL branches; a shunt is a branch to ground (to = -1)
+    fromBus = np.array([l['from'] for l in lines] + [l['bus'] for l in loads] + [s['bus'] for s in shunts], dtype=int)
+    toBus = np.array([l['to'] for l in lines] + [-1] * (len(loads) + len(shunts)), dtype=int)
+    R = np.array([l['paras']['Rline'] for l in lines] + [l['paras']['Rload'] for l in loads] + [s['R'] for s in shunts], dtype=float)
+    L = np.array([l['paras']['Lline'] for l in lines] + [l['paras']['Lload'] for l in loads] + [0.0] * len(shunts), dtype=float)
+    y = 1 / (R + 1j * w * L)
+    dy = -1j * L * y**2
+
+    series = toBus >= 0
+    rows = np.concatenate([fromBus, toBus[series], fromBus[series], toBus[series]])
+    cols = np.concatenate([fromBus, toBus[series], toBus[series], fromBus[series]])
+    Y = sps.csr_matrix((np.concatenate([y, y[series], -y[series], -y[series]]), (rows, cols)), shape=(nBus, nBus))
+    dYdw = sps.csr_matrix((np.concatenate([dy, dy[series], -dy[series], -dy[series]]), (rows, cols)), shape=(nBus, nBus))
+    return Y, dYdw
@@ -0,0 +1,32 @@
+from scipy.optimize import fsolve
+from lib.pf_warm_start import pf_warm_start_mode, pf_warm_start_seed, pf_warm_start_record
+
+def pf_solve(pfFunc, pfJac, x0, args, warmStart=None, xtol=1e-6, maxfev=500, pfSolution=None):
+    # fsolve on pfFunc(x, *args) with its analytic Jacobian. warmStart seeds the
+    # solve from earlier converged solutions instead of x0: 'previous' or
+    # 'nearest' (see pf_warm_start_mode); defaults to $SSA_PF_WARMSTART, else off.
+    # A warm start that fails to converge is retried from x0.
+    # pfSolution(pfFunc, pfJac, x0, args) -> (x, exitFlag) replaces the solve,
+    # e.g. to hold the power flow on its tangent in eigenvalue_sensitivity
+    if pfSolution is not None:
+        x, ier = pfSolution(pfFunc, pfJac, x0, args)
+        return x, {}, ier, 'pfSolution'
+    warmStart = pf_warm_start_mode(warmStart)
+    solve = lambda xInit: fsolve(
+        lambda x: pfFunc(x, *args),
+        xInit,
+        fprime=lambda x: pfJac(x, *args),
+        xtol=xtol,
+        maxfev=maxfev,
+        full_output=True
+    )
+    result = None
+    if warmStart:
+        seed = pf_warm_start_seed(pfFunc, args, warmStart)
+        if seed is not None:
+            result = solve(seed)
+    if result is None or result[2] != 1:
+        result = solve(x0)
+    if warmStart and result[2] == 1:
+        pf_warm_start_record(pfFunc, args, result[0])
+    return result
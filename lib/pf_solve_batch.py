@@ -0,0 +1,54 @@
+import numpy as np
+
+def pf_solve_batch(pfFunc, pfJac, x0, args, xtol=1e-6, maxiter=100):
+    # Newton-Raphson on N power-flow problems at once, e.g.
+    #   pf_solve_batch(pf_func_ibr_ibr, pf_jac_ibr_ibr, x0, (parasIBR1, parasIBR2, parasLoad))
+    # where any parameter may be an (N,) array and x0 is (k,) or (N, k).
+    # Returns x of shape (N, k) and one fsolve-style pfExitFlag per sample:
+    # 1 converged, 2 iteration limit reached, 4 singular Jacobian or non-finite
+    # iterate (not making progress)
+    x0 = np.asarray(x0, dtype=float)
+    k = x0.shape[-1]
+    batch = np.broadcast_shapes(x0.shape[:-1], *(np.shape(v) for paras in args for v in paras.values()))
+    x = np.array(np.broadcast_to(x0, batch + (k,)))
+    pfExitFlag = np.full(batch, 2)
+    active = np.ones(batch, dtype=bool)
+
+    f = pfFunc(x, *args)
+    for _ in range(maxiter):
+        J = pfJac(x, *args)
+        finite = np.isfinite(J).all(axis=(-2, -1)) & np.isfinite(f).all(axis=-1)
+        J[~finite] = np.eye(k)
+        singular = ~finite | (np.linalg.cond(J) > 1e14)
+        pfExitFlag[active & singular] = 4
+        active &= ~singular
+        if not active.any():
+            break
+
+        # Samples that are done keep their iterate: identity system, zero step
+        J[~active] = np.eye(k)
+        dx = -np.linalg.solve(J, np.where(active[..., None], f, 0)[..., None])[..., 0]
+
+        # Backtracking: halve the step wherever the residual norm did not decrease
+        normF = np.linalg.norm(f, axis=-1)
+        step = np.ones(batch)
+        for _ in range(10):
+            xTrial = x + step[..., None] * dx
+            fTrial = pfFunc(xTrial, *args)
+            worse = active & ~(np.linalg.norm(fTrial, axis=-1) <= normF)
+            if not worse.any():
+                break
+            step[worse] /= 2
+        else:
+            xTrial = x + step[..., None] * dx
+            fTrial = pfFunc(xTrial, *args)
+
+        x = np.where(active[..., None], xTrial, x)
+        f = np.where(active[..., None], fTrial, f)
+        converged = active & (np.linalg.norm(step[..., None] * dx, axis=-1) <= xtol * (xtol + np.linalg.norm(x, axis=-1)))
+        pfExitFlag[converged] = 1
+        active &= ~converged
+        if not active.any():
+            break
+
+    return x, pfExitFlag
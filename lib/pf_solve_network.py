@@ -0,0 +1,39 @@
+import numpy as np
+import scipy.sparse.linalg as spla
+from lib.pf_network import pf_network_index
+from lib.pf_func_network import pf_func_network
+from lib.pf_jac_network import pf_jac_network
+
+def pf_solve_network(network, x0=None, xtol=1e-6, maxiter=100):
+    # Damped Newton-Raphson with sparse LU on pf_func_network. x0 defaults to a
+    # flat start (w = 1, V = 1∠0). Returns x and an fsolve-style pfExitFlag:
+    # 1 converged, 2 iteration limit reached, 4 singular Jacobian or non-finite
+    # iterate
+    index = pf_network_index(network)
+    if x0 is None:
+        x0 = np.concatenate([[1.0] * index['hasW'], np.ones(len(index['eBus'])), np.zeros(len(index['fBus']))])
+    x = np.array(x0, dtype=float)
+    f = pf_func_network(x, network, index)
+    for _ in range(maxiter):
+        J = pf_jac_network(x, network, index)
+        if not (np.isfinite(f).all() and np.isfinite(J.data).all()):
+            return x, 4
+        try:
+            dx = -spla.splu(J).solve(f)
+        except RuntimeError:  # exactly singular
+            return x, 4
+
+        # Backtracking: halve the step while the residual norm does not decrease
+        normF = np.linalg.norm(f)
+        step = 1.0
+        for _ in range(10):
+            xTrial = x + step * dx
+            fTrial = pf_func_network(xTrial, network, index)
+            if np.linalg.norm(fTrial) <= normF:
+                break
+            step /= 2
+        x, f = xTrial, fTrial
+        if np.linalg.norm(step * dx) <= xtol * (xtol + np.linalg.norm(x)):
+            return x, 1
+
+    return x, 2
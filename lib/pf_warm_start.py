@@ -0,0 +1,55 @@
+import collections
+import os
+import numpy as np
+
+# Converged power-flow solutions per residual function and parameter layout,
+# most recent last
+PF_SOLUTIONS = collections.defaultdict(lambda: collections.deque(maxlen=1024))
+
+def pf_warm_start_mode(warmStart=None):
+    # 'previous', 'nearest' or None (off) from a pf_solve warmStart argument:
+    # True means 'nearest', False off, and None defers to $SSA_PF_WARMSTART,
+    # where '', 0, off and false mean off and 1, on and true mean 'nearest'
+    if warmStart is None:
+        warmStart = os.environ.get('SSA_PF_WARMSTART', '').strip().lower()
+        warmStart = {'': False, '0': False, 'off': False, 'false': False, '1': True, 'on': True, 'true': True}.get(warmStart, warmStart)
+    if warmStart is True:
+        return 'nearest'
+    if warmStart is False:
+        return None
+    if warmStart not in ('previous', 'nearest'):
+        raise ValueError(f"Unknown warm start mode {warmStart!r}, expected 'previous' or 'nearest'")
+    return warmStart
+
+def pf_warm_start_key(pfFunc, args):
+    names, values = [], []
+    for i, paras in enumerate(args):
+        for name, value in sorted(paras.items()):
+            if isinstance(value, (int, float, np.number)):
+                names.append(f'{i}.{name}')
+                values.append(float(value))
+    return (pfFunc.__name__, tuple(names)), np.array(values)
+
+def pf_warm_start_seed(pfFunc, args, mode='nearest'):
+    # mode 'previous' returns the last solution for this power-flow problem,
+    # 'nearest' the one solved at the closest parameter set (relative distance
+    # per parameter, so differently scaled parameters weigh alike)
+    if mode not in ('previous', 'nearest'):
+        raise ValueError(f"Unknown warm start mode {mode!r}, expected 'previous' or 'nearest'")
+    key, values = pf_warm_start_key(pfFunc, args)
+    solutions = PF_SOLUTIONS.get(key)
+    if not solutions:
+        return None
+    if mode == 'previous':
+        return solutions[-1][1]
+    stored = np.array([s[0] for s in solutions])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        distance = np.where(stored == values, 0, np.abs(stored - values) / (np.abs(stored) + np.abs(values)))
+    return solutions[int(np.argmin(np.sum(distance**2, axis=1)))][1]
+
+def pf_warm_start_record(pfFunc, args, x):
+    key, values = pf_warm_start_key(pfFunc, args)
+    PF_SOLUTIONS[key].append((values, np.array(x, dtype=float)))
+
+def pf_warm_start_clear():
+    PF_SOLUTIONS.clear()
@@ -0,0 +1,161 @@
+import numpy as np
+import scipy.sparse as sps
+import threading
+
+LAYOUTS = threading.local()
+
+def ssmodel_state_names(ssVariables):
+    # Component models label states as plain names, [name, ''] pairs or arrays of pairs
+    return [sv if isinstance(sv, str) else sv[0] for sv in ssVariables]
+
+def ssmodel_assemble(components, Rx=None, sparse=False, out=None):
+    # Couples component state-space models through the virtual-resistor network:
+    # every bus voltage is Rx times the sum of the currents entering it, and all
+    # components see the reference generator's frequency wcom = Cw x.
+    # components is a list of dicts with the component 'stateMatrix', a 'label'
+    # for the participation tables and its connection, decided by the model:
+    #   generators (ssmodel_droop, ssmodel_vsmPlant, ssmodel_sg, ...): 'bus'
+    #   loads (ssmodel_load): 'bus'
+    #   lines (ssmodel_line): 'from' and 'to'
+    # Buses are any hashable names; None is an infinite bus (fixed voltage).
+    # The generator marked 'reference': True has its angle state 'theta' removed.
+    # Returns Asys and the (n, 2) array of [state name, label]; with sparse=True
+    # Asys is a scipy.sparse CSR matrix built without any dense n x n temporaries.
+    # The block layout and work buffers are cached per topology, so a sweep that
+    # passes the previous Asys as out= assembles without allocating
+    layout = ssmodel_assemble_layout(components)
+    if sparse:
+        Asys = ssmodel_assemble_sparse(components, Rx, layout['offsets'])
+        return Asys[layout['keep']][:, layout['keep']], layout['ssVariables']
+
+    Asys = layout['buffer']
+    Asys.fill(0)
+    slices = layout['slices']
+    for c, rows in zip(components, slices):
+        Asys[rows, rows] = c['stateMatrix']['A']
+
+    # Input key of component i driven by the current of component j at the same bus
+    for i, key, j, sign in layout['couplings']:
+        B = components[i]['stateMatrix'][key]
+        if sign:
+            Asys[slices[i], slices[j]] += (sign * Rx) * B
+        else:
+            Asys[slices[i], slices[j]] += Rx * B @ components[j]['stateMatrix']['C']
+
+    for i, j in layout['frequencyCouplings']:
+        Cw = components[j]['stateMatrix']['Cw']
+        Asys[slices[i], slices[j]] += components[i]['stateMatrix']['Bw'] @ np.reshape(Cw, (1, -1))
+
+    # Reference elimination by index selection into preallocated buffers
+    keep = layout['keep']
+    if out is None:
+        out = np.empty((len(keep), len(keep)))
+    np.take(Asys, keep, axis=0, out=layout['rows'])
+    np.take(layout['rows'], keep, axis=1, out=out)
+    return out, layout['ssVariables']
+
+def ssmodel_assemble_layout(components):
+    # Everything that depends only on the topology, cached per thread so that
+    # concurrent sweeps never share a work buffer
+    signature = tuple(
+        (c['label'], c['stateMatrix']['A'].shape[0], tuple(ssmodel_state_names(c['stateMatrix']['ssVariables'])),
+         'B1' in c['stateMatrix'], 'C' in c['stateMatrix'],
+         c.get('bus'), c.get('from'), c.get('to'), bool(c.get('reference')))
+        for c in components
+    )
+    layouts = LAYOUTS.__dict__.setdefault('layouts', {})
+    if signature in layouts:
+        return layouts[signature]
+
+    sizes = [c['stateMatrix']['A'].shape[0] for c in components]
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    n = offsets[-1]
+
+    # Currents entering each bus: (component, sign), sign 0 for a generator's C x
+    currents = {}
+    inputs = []
+    for i, c in enumerate(components):
+        stateMatrix = c['stateMatrix']
+        if 'B1' in stateMatrix:
+            connections = [('B1', c['from'], -1), ('B2', c['to'], 1)]
+        elif 'C' in stateMatrix:
+            connections = [('B', c['bus'], 0)]
+        else:
+            connections = [('B', c['bus'], -1)]
+        for key, bus, sign in connections:
+            if bus is not None:
+                currents.setdefault(bus, []).append((i, sign))
+                inputs.append((i, key, bus))
+
+    ssVariables, keep = ssmodel_assemble_labels(components, offsets)
+    layout = {
+        'offsets': offsets,
+        'slices': [slice(start, end) for start, end in zip(offsets[:-1], offsets[1:])],
+        'couplings': [(i, key, j, sign) for i, key, bus in inputs for j, sign in currents[bus]],
+        'frequencyCouplings': [(i, j) for i in range(len(components)) for j, c in enumerate(components) if 'Cw' in c['stateMatrix']],
+        'ssVariables': ssVariables[keep],
+        'keep': keep,
+        'buffer': np.zeros((n, n)),
+        'rows': np.zeros((len(keep), n)),
+    }
+    layouts[signature] = layout
+    return layout
+
+def ssmodel_assemble_labels(components, offsets):
+    ssVariables = np.array([
+        [name, c['label']]
+        for c in components
+        for name in ssmodel_state_names(c['stateMatrix']['ssVariables'])
+    ], dtype=object).reshape(-1, 2)
+
+    # The reference angle is identically zero in its own frame
+    keep = np.ones(offsets[-1], dtype=bool)
+    for c, start in zip(components, offsets[:-1]):
+        if c.get('reference'):
+            keep[start + ssmodel_state_names(c['stateMatrix']['ssVariables']).index('theta')] = False
+
+    return ssVariables, np.flatnonzero(keep)
+
+def ssmodel_assemble_sparse(components, Rx, offsets):
+    # Asys = blockdiag(A) + Bbus @ Vbus + Bw @ Cwcom, where Vbus (2 per bus x n)
+    # maps states to bus voltages and Bbus (n x 2 per bus) routes them to the
+    # component inputs; every factor is sparse
+    n = offsets[-1]
+    buses = {}
+    for c in components:
+        for key in ('bus', 'from', 'to'):
+            if c.get(key) is not None:
+                buses.setdefault(c[key], 2 * len(buses))
+    nBus = 2 * len(buses)
+
+    Vbus, Bbus, Bw, Cwcom = [], [], [], []
+
+    def block(blocks, matrix, row, col):
+        matrix = sps.coo_matrix(matrix)
+        blocks.append((matrix.data, matrix.row + row, matrix.col + col))
+
+    for c, start in zip(components, offsets[:-1]):
+        stateMatrix = c['stateMatrix']
+        if 'B1' in stateMatrix:
+            connections = [(-np.eye(2), stateMatrix['B1'], c['from']), (np.eye(2), stateMatrix['B2'], c['to'])]
+        elif 'C' in stateMatrix:
+            connections = [(stateMatrix['C'], stateMatrix['B'], c['bus'])]
+            block(Cwcom, np.reshape(stateMatrix['Cw'], (1, -1)), 0, start)
+        else:
+            connections = [(-np.eye(2), stateMatrix['B'], c['bus'])]
+        for current, B, bus in connections:
+            if bus is not None:
+                block(Vbus, Rx * np.asarray(current), buses[bus], start)
+                block(Bbus, B, start, buses[bus])
+        block(Bw, stateMatrix['Bw'], start, 0)
+
+    def assemble(blocks, shape):
+        if not blocks:
+            return sps.csr_matrix(shape)
+        data, rows, cols = (np.concatenate(parts) for parts in zip(*blocks))
+        return sps.csr_matrix((data, (rows, cols)), shape=shape)
+
+    Asys = sps.block_diag([sps.csr_matrix(c['stateMatrix']['A']) for c in components], format='csr')
+    Asys = Asys + assemble(Bbus, (n, nBus)) @ assemble(Vbus, (nBus, n)) + assemble(Bw, (n, 1)) @ assemble(Cwcom, (1, n))
+
+    return Asys.tocsr()
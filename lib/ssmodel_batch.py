@@ -0,0 +1,14 @@
+import numpy as np
+from lib.ssmodel_codegen import ssmodel_symbolic
+from lib.ssmodel_compile import ssmodel_compile
+
+def ssmodel_batch(name, wbase, paras, steadyStateValuesX, steadyStateValuesU, isRef=1, engine=None):
+    # Linearize component `name` ('droop', 'vsmPlant', 'line', ...) at N operating
+    # points in one vectorized call. steadyStateValuesX/U are stacked as (N, n) and
+    # each parameter may be a scalar or an (N,) array; every returned matrix gains
+    # a leading N axis, e.g. A is (N, n, n)
+    stateMatrix = ssmodel_compile(ssmodel_symbolic(name), engine, batch=True)(wbase, paras, steadyStateValuesX, steadyStateValuesU)
+    if 'Cw' in stateMatrix and not isRef:
+        A = stateMatrix['A']
+        stateMatrix['Cw'] = np.zeros(A.shape[:-2] + (1, A.shape[-1]))
+    return stateMatrix
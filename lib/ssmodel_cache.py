@@ -0,0 +1,71 @@
+import hashlib
+import os
+import sys
+import tempfile
+import types
+from contextlib import contextmanager
+from importlib import metadata
+
+try:
+    import fcntl
+except ImportError:  # Windows: atomic os.replace alone keeps readers safe
+    fcntl = None
+
+def ssmodel_cache_dir():
+    cacheDir = os.environ.get('SSA_CACHE_DIR')
+    if not cacheDir:
+        cacheRoot = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        cacheDir = os.path.join(cacheRoot, 'SmallSignalAnalysisPython')
+    return cacheDir
+
+def ssmodel_cache_key(sourceHash):
+    # Keyed by the equations (via the source hash) and the sympy version that
+    # produced the generated code
+    try:
+        sympyVersion = metadata.version('sympy')
+    except metadata.PackageNotFoundError:
+        sympyVersion = 'unknown'
+    return hashlib.sha256(f'{sourceHash}\n{sympyVersion}'.encode()).hexdigest()[:32]
+
+@contextmanager
+def ssmodel_cache_lock(path):
+    # Serialises generation across processes so only one of them pays for it
+    with open(path, 'a') as lockFile:
+        if fcntl is not None:
+            fcntl.flock(lockFile, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lockFile, fcntl.LOCK_UN)
+
+def ssmodel_cache_load(name, sourceHash, generateSource):
+    cacheDir = ssmodel_cache_dir()
+    path = os.path.join(cacheDir, f'jac_{name}_{ssmodel_cache_key(sourceHash)}.py')
+    source = None
+    if os.path.exists(path):
+        with open(path) as file:
+            source = file.read()
+    else:
+        try:
+            os.makedirs(cacheDir, exist_ok=True)
+            with ssmodel_cache_lock(path + '.lock'):
+                if os.path.exists(path):
+                    with open(path) as file:
+                        source = file.read()
+                else:
+                    source = generateSource()
+                    # Write to a temporary file and rename so concurrent readers
+                    # only ever see a complete module
+                    fd, tmpPath = tempfile.mkstemp(dir=cacheDir, suffix='.tmp')
+                    with os.fdopen(fd, 'w') as file:
+                        file.write(source)
+                    os.replace(tmpPath, path)
+        except OSError:
+            if source is None:
+                source = generateSource()
+    module = types.ModuleType(f'lib._generated.jac_{name}')
+    module.__file__ = path
+    exec(compile(source, path, 'exec'), module.__dict__)
+    sys.modules[module.__name__] = module
+    return module
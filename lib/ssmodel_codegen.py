@@ -0,0 +1,148 @@
+import hashlib
+import importlib
+import inspect
+import os
+import sys
+from lib.ssmodel_cache import ssmodel_cache_load
+
+GENERATOR_VERSION = 3
+GENERATED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_generated')
+SSMODELS = ['droop', 'droopPlant', 'droopSimplified', 'gfl', 'gflPlant', 'line', 'load', 'sg', 'vsm', 'vsmPlant']
+
+def ssmodel_name(ssmodelSymbolic):
+    return ssmodelSymbolic.__name__[len('ssmodel_'):-len('_symbolic')]
+
+def ssmodel_source_hash(ssmodelSymbolic):
+    # Only the equations in ssmodel_<name>_symbolic() and the generator format
+    # decide whether a generated module is current, so no sympy is needed here
+    source = inspect.getsource(ssmodelSymbolic)
+    return hashlib.sha256(f'{GENERATOR_VERSION}\n{source}'.encode()).hexdigest()
+
+def ssmodel_codegen(ssmodelSymbolic):
+    import sympy as sp
+    from sympy.printing.numpy import NumPyPrinter
+
+    name = ssmodel_name(ssmodelSymbolic)
+    model = ssmodelSymbolic()
+    printer = NumPyPrinter({'fully_qualified_modules': True})
+    matrices = {k: sp.Matrix(m) for k, m in model['matrices'].items()}
+    signature = '(wbase, paras, steadyStateValuesX, steadyStateValuesU):'
+    unpackParas = [f"    {p} = paras['{p}']" for p in model['paras']]
+
+    lines = [
+        f'# Generated by lib/ssmodel_codegen.py from ssmodel_{name}_symbolic() in lib/ssmodel_{name}.py.',
+        '# Do not edit: regenerate with `python -m lib.ssmodel_codegen`.',
+        'import numpy',
+        '',
+        f"SOURCE_HASH = '{ssmodel_source_hash(ssmodelSymbolic)}'",
+        f"PARAS = {tuple(str(p) for p in model['paras'])!r}",
+        f"SHAPES = {{{', '.join(f'{k!r}: {m.shape}' for k, m in matrices.items())}}}",
+    ]
+    # Common-subexpression elimination over the nonzero entries of all matrices
+    entries = []
+    for key, matrix in matrices.items():
+        for (i, j), expr in sorted(matrix.todok().items()):
+            entries.append((key, i, j, expr))
+    replacements, reduced = sp.cse([e[3] for e in entries], symbols=sp.numbered_symbols('_t'))
+    temporaries = [f'    {s} = {printer.doprint(e)}' for s, e in replacements]
+    returnMatrices = '    return {' + ', '.join(f"'{k}': {k}" for k in matrices) + '}'
+
+    # Single operating point
+    lines += [
+        '',
+        f'def jac_{name}' + signature,
+        f"    {', '.join(str(s) for s in model['x'])}, = numpy.asarray(steadyStateValuesX, dtype=float).flatten()",
+        f"    {', '.join(str(s) for s in model['u'])}, = numpy.asarray(steadyStateValuesU, dtype=float).flatten()",
+    ] + unpackParas + temporaries
+    lines += [f'    {key} = numpy.zeros({matrix.shape})' for key, matrix in matrices.items()]
+    lines += [f'    {key}[{i}, {j}] = {printer.doprint(expr)}' for (key, i, j, _), expr in zip(entries, reduced)]
+    lines.append(returnMatrices)
+
+    # Stacked operating points: steady-state values of shape (..., n), parameters
+    # scalars or arrays broadcasting against the leading dimensions
+    lines += [
+        '',
+        f'def jac_{name}_batch' + signature,
+        f"    {', '.join(str(s) for s in model['x'])}, = numpy.moveaxis(numpy.asarray(steadyStateValuesX, dtype=float), -1, 0)",
+        f"    {', '.join(str(s) for s in model['u'])}, = numpy.moveaxis(numpy.asarray(steadyStateValuesU, dtype=float), -1, 0)",
+    ] + [f"    {p} = numpy.asarray(paras['{p}'], dtype=float)" for p in model['paras']]
+    inputs = [str(s) for s in list(model['x']) + list(model['u']) + list(model['paras'])]
+    lines.append(f"    batch = numpy.broadcast_shapes({', '.join(f'numpy.shape({v})' for v in inputs)})")
+    lines += temporaries
+    lines += [f'    {key} = numpy.zeros(batch + {matrix.shape})' for key, matrix in matrices.items()]
+    lines += [f'    {key}[..., {i}, {j}] = {printer.doprint(expr)}' for (key, i, j, _), expr in zip(entries, reduced)]
+    lines.append(returnMatrices)
+
+    # Nonlinear right-hand side and outputs, evaluated elementwise so they accept
+    # complex values and stacked columns of steady-state values
+    outputs = {k: list(model[k]) for k in ('f', 'y', 'w') if k in model}
+    lines += [
+        '',
+        f'def rhs_{name}' + signature,
+        f"    {', '.join(str(s) for s in model['x'])}, = steadyStateValuesX",
+        f"    {', '.join(str(s) for s in model['u'])}, = steadyStateValuesU",
+    ] + unpackParas
+    replacements, reduced = sp.cse(sum(outputs.values(), []), symbols=sp.numbered_symbols('_t'))
+    lines += [f'    {s} = {printer.doprint(e)}' for s, e in replacements]
+    for key, exprs in outputs.items():
+        lines.append(f"    {key} = [{', '.join(printer.doprint(e) for e in reduced[:len(exprs)])}]")
+        reduced = reduced[len(exprs):]
+    lines.append('    return {' + ', '.join(f"'{k}': {k}" for k in outputs) + '}')
+
+    return '\n'.join(lines) + '\n'
+
+def ssmodel_codegen_write(ssmodelSymbolic):
+    # Write atomically so concurrent importers never see a partial module
+    name = ssmodel_name(ssmodelSymbolic)
+    source = ssmodel_codegen(ssmodelSymbolic)
+    path = os.path.join(GENERATED_DIR, f'jac_{name}.py')
+    os.makedirs(GENERATED_DIR, exist_ok=True)
+    tmpPath = f'{path}.{os.getpid()}.tmp'
+    with open(tmpPath, 'w') as file:
+        file.write(source)
+    os.replace(tmpPath, path)
+    return source
+
+def ssmodel_codegen_load(ssmodelSymbolic):
+    # Import the generated module shipped in lib/_generated; if the equations
+    # changed since it was generated, fall back to the on-disk cache
+    name = ssmodel_name(ssmodelSymbolic)
+    sourceHash = ssmodel_source_hash(ssmodelSymbolic)
+    try:
+        module = importlib.import_module(f'lib._generated.jac_{name}')
+        if module.SOURCE_HASH == sourceHash:
+            return module
+    except ImportError:
+        pass
+    return ssmodel_cache_load(name, sourceHash, lambda: ssmodel_codegen(ssmodelSymbolic))
+
+def ssmodel_symbolic(name):
+    module = importlib.import_module(f'lib.ssmodel_{name}')
+    return getattr(module, f'ssmodel_{name}_symbolic')
+
+def main(argv=None):
+    # python -m lib.ssmodel_codegen [--check] [name ...]
+    argv = sys.argv[1:] if argv is None else argv
+    check = '--check' in argv
+    names = [a for a in argv if not a.startswith('--')] or SSMODELS
+    stale = []
+    for name in names:
+        ssmodelSymbolic = ssmodel_symbolic(name)
+        path = os.path.join(GENERATED_DIR, f'jac_{name}.py')
+        current = False
+        if os.path.exists(path):
+            with open(path) as file:
+                current = f"SOURCE_HASH = '{ssmodel_source_hash(ssmodelSymbolic)}'" in file.read()
+        if current:
+            continue
+        stale.append(name)
+        if not check:
+            ssmodel_codegen_write(ssmodelSymbolic)
+            print(f'generated {os.path.relpath(path)}')
+    if check and stale:
+        print('stale generated modules: ' + ', '.join(stale))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
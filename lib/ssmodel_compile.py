@@ -0,0 +1,24 @@
+import os
+from functools import lru_cache
+from lib.ssmodel_codegen import ssmodel_codegen_load, ssmodel_name
+from lib.ssmodel_autodiff import ssmodel_autodiff
+
+ENGINES = ('codegen', 'autodiff')
+
+def ssmodel_compile(ssmodelSymbolic, engine=None, batch=False):
+    # engine selects how the state matrices are linearized: 'codegen' evaluates the
+    # symbolic Jacobians generated ahead of time into lib/_generated, 'autodiff'
+    # differentiates the generated right-hand side numerically by complex step.
+    # Defaults to $SSA_LINEARIZATION, else 'codegen'. batch=True returns the
+    # evaluator over stacked operating points
+    engine = engine or os.environ.get('SSA_LINEARIZATION') or 'codegen'
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown linearization engine '{engine}', expected one of {ENGINES}")
+    return _ssmodel_compile(ssmodelSymbolic, engine, batch)
+
+@lru_cache(maxsize=None)
+def _ssmodel_compile(ssmodelSymbolic, engine, batch):
+    module = ssmodel_codegen_load(ssmodelSymbolic)
+    if engine == 'autodiff':
+        return ssmodel_autodiff(module, batch)
+    return getattr(module, f"jac_{ssmodel_name(ssmodelSymbolic)}{'_batch' if batch else ''}")
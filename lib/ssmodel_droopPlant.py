@@ -1,7 +1,11 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_droopPlant_symbolic():
+    import sympy as sp
 
-def ssmodel_droopPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, isRef):
     (thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ,
      PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Po, Qo,
      phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq) = sp.symbols(
@@ -9,37 +13,17 @@ def ssmodel_droopPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU,
     )
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
 
-    # Parameter extraction
-    PsetPlant   = parasIBR['PsetPlant']
-    QsetPlant   = parasIBR['QsetPlant']
-    wsetPlant   = parasIBR['wsetPlant']
-    VsetPlant   = parasIBR['VsetPlant']
-    mpPlant     = parasIBR['mpPlant']
-    mqPlant     = parasIBR['mqPlant']
-    KpPLLplant  = parasIBR['KpPLLplant']
-    KiPLLplant  = parasIBR['KiPLLplant']
-    KpPlantP    = parasIBR['KpPlantP']
-    KiPlantP    = parasIBR['KiPlantP']
-    KpPlantQ    = parasIBR['KpPlantQ']
-    KiPlantQ    = parasIBR['KiPlantQ']
-    wcpllPlant  = parasIBR['wcpllPlant']
-    wcPlant     = parasIBR['wcPlant']
-    tDelay      = parasIBR['tDelay']
-    wset        = parasIBR['wset']
-    Vset        = parasIBR['Vset']
-    Rt          = parasIBR['Rt']
-    Lt          = parasIBR['Lt']
-    Rd          = parasIBR['Rd']
-    Cf          = parasIBR['Cf']
-    Rc          = parasIBR['Rc']
-    Lc          = parasIBR['Lc']
-    mp          = parasIBR['mp']
-    mq          = parasIBR['mq']
-    KpV         = parasIBR['KpV']
-    KiV         = parasIBR['KiV']
-    KpC         = parasIBR['KpC']
-    KiC         = parasIBR['KiC']
-    wc          = parasIBR['wc']
+    wbase = sp.Symbol('wbase')
+
+    # Parameters
+    paras = sp.symbols(
+        'PsetPlant QsetPlant wsetPlant VsetPlant mpPlant mqPlant KpPLLplant KiPLLplant '
+        'KpPlantP KiPlantP KpPlantQ KiPlantQ wcpllPlant wcPlant tDelay '
+        'wset Vset Rt Lt Rd Cf Rc Lc mp mq KpV KiV KpC KiC wc'
+    )
+    (PsetPlant, QsetPlant, wsetPlant, VsetPlant, mpPlant, mqPlant, KpPLLplant, KiPLLplant,
+     KpPlantP, KiPlantP, KpPlantQ, KiPlantQ, wcpllPlant, wcPlant, tDelay,
+     wset, Vset, Rt, Lt, Rd, Cf, Rc, Lc, mp, mq, KpV, KiV, KpC, KiC, wc) = paras
 
     # Algebraic equations
     vbqPlant = -vbD * sp.sin(thetaPlant) + vbQ * sp.cos(thetaPlant)
@@ -101,27 +85,19 @@ def ssmodel_droopPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU,
     Csym = sp.Matrix([ioD, ioQ]).jacobian(x)
     CwSym = sp.Matrix([winv]).jacobian(x)
 
-    # Substitute the steady-state values into the symbolic expressions
-    subs_dict = dict(zip(list(x) + list(u),
-                           np.concatenate((steadyStateValuesX.flatten(),
-                                           steadyStateValuesU.flatten()))))
-    A = Asym.subs(subs_dict).evalf()
-    B = Bsym.subs(subs_dict).evalf()
-    Bw = BwSym.subs(subs_dict).evalf()
-    C = Csym.subs(subs_dict).evalf()
-    Cw = CwSym.subs(subs_dict).evalf()
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([ioD, ioQ]), 'w': sp.Matrix([winv]),
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym, 'C': Csym, 'Cw': CwSym}
+    }
+
+def ssmodel_droopPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, isRef, engine=None):
+    stateMatrix = ssmodel_compile(ssmodel_droopPlant_symbolic, engine)(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU)
 
     if isRef == 0:
-        Cw = sp.zeros(1, len(x))
+        stateMatrix['Cw'] = np.zeros((1, stateMatrix['A'].shape[0]))
 
-    stateMatrix = {
-        'A': np.array(A).astype(float),
-        'B': np.array(B).astype(float),
-        'Bw': np.array(Bw).astype(float),
-        'C': np.array(C).astype(float),
-        'Cw': np.array(Cw).astype(float),
-        'ssVariables': ['thetaPlant', 'epsilonPLLPlant', 'wPlant', 'epsilonP', 'epsilonQ',
-                         'PoPlant', 'QoPlant', 'PsetDelay', 'QsetDelay', 'theta', 'Po', 'Qo',
-                         'phid', 'phiq', 'gammad', 'gammaq', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
-    }
+    stateMatrix['ssVariables'] = ['thetaPlant', 'epsilonPLLPlant', 'wPlant', 'epsilonP', 'epsilonQ',
+                                  'PoPlant', 'QoPlant', 'PsetDelay', 'QsetDelay', 'theta', 'Po', 'Qo',
+                                  'phid', 'phiq', 'gammad', 'gammaq', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
     return stateMatrix
\ No newline at end of file
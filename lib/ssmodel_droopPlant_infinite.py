@@ -1,30 +1,24 @@
 import numpy as np
-from scipy.optimize import fsolve
 from lib.pf_func_ibrPlant_infinite import pf_func_ibrPlant_infinite
+from lib.pf_jac_ibrPlant_infinite import pf_jac_ibrPlant_infinite
+from lib.pf_solve import pf_solve
 from lib.pf_calc_infinite import pf_calc_infinite
 from lib.steadystatevalue_droopPlant import steadystatevalue_droopPlant
 from lib.ssmodel_droopPlant import ssmodel_droopPlant
+from lib.ssmodel_assemble import ssmodel_assemble
 from lib.eigenvalue_analysis import eigenvalue_analysis
 
-def ssmodel_droopPlant_infinite(wbase, parasIBR, dominantParticipationFactorBoundary):
+def ssmodel_droopPlant_infinite(wbase, parasIBR, dominantParticipationFactorBoundary, warmStart=None, stabilityOnly=False, pfSolution=None):
     # Power flow calculation (using fsolve with LM-like options)
     x0 = np.array([0, 1])
-    x, info, ier, msg = fsolve(
-        lambda x: pf_func_ibrPlant_infinite(x, parasIBR),
-        x0,
-        xtol=1e-6,
-        maxfev=500,
-        full_output=True
-    )
+    x, info, ier, msg = pf_solve(pf_func_ibrPlant_infinite, pf_jac_ibrPlant_infinite, x0, (parasIBR,), warmStart, xtol=1e-6, maxfev=500, pfSolution=pfSolution)
     pfExitFlag = ier
     w, V1, V2, I = pf_calc_infinite(x, parasIBR)
     steadyStateValuesX, steadyStateValuesU = steadystatevalue_droopPlant(w, V1, I, parasIBR)
     stateMatrix = ssmodel_droopPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, 0)
-    Asys = stateMatrix['A']
-    ssVariables = stateMatrix['ssVariables']
-    # Label each state variable for modal analysis
-    ssVariables = [[var, 'IBR'] for var in ssVariables]
-
-    eigenvalueAnalysisResults = eigenvalue_analysis(Asys, ssVariables, dominantParticipationFactorBoundary)
+    Asys, ssVariables = ssmodel_assemble([
+        {'label': 'IBR', 'stateMatrix': stateMatrix, 'bus': None},
+    ])
+    eigenvalueAnalysisResults = eigenvalue_analysis(Asys, ssVariables, dominantParticipationFactorBoundary, eigenvectors=not stabilityOnly)
 
     return Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag
\ No newline at end of file
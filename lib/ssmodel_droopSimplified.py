@@ -1,18 +1,16 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_droopSimplified_symbolic():
+    import sympy as sp
 
-def ssmodel_droopSimplified(wbase, paras_inverter, steady_state_values_x, steady_state_values_u, is_ref):
     theta, Po, Qo, iod, ioq = sp.symbols('theta Po Qo iod ioq')
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
-    Pset = paras_inverter['Pset']
-    Qset = paras_inverter['Qset']
-    wset = paras_inverter['wset']
-    Vset = paras_inverter['Vset']
-    Rc = paras_inverter['Rc']
-    Lc = paras_inverter['Lc']
-    mp = paras_inverter['mp']
-    mq = paras_inverter['mq']
-    wc = paras_inverter['wc']
+    wbase = sp.Symbol('wbase')
+    paras = sp.symbols('Pset Qset wset Vset Rc Lc mp mq wc')
+    Pset, Qset, wset, Vset, Rc, Lc, mp, mq, wc = paras
 
     # Algebraic equations
     winv = wset - mp*(Po - Pset)
@@ -34,7 +32,6 @@ def ssmodel_droopSimplified(wbase, paras_inverter, steady_state_values_x, steady
     ioQ = iod*sp.sin(theta) + ioq*sp.cos(theta)
 
     # State-Space Matrices
-    state_variables = ['theta', 'Po', 'Qo', 'iod', 'ioq']
     x = sp.Matrix([theta, Po, Qo, iod, ioq])
     u = sp.Matrix([vbD, vbQ, wcom])
 
@@ -44,30 +41,22 @@ def ssmodel_droopSimplified(wbase, paras_inverter, steady_state_values_x, steady
     Csym = sp.Matrix([ioD, ioQ]).jacobian(x)
     CwSym = winv.diff(x)
 
-    # Ensure steadyStateValuesX and steadyStateValuesU are 1D arrays
-    steady_state_values_x = np.array(steady_state_values_x).flatten()
-    steady_state_values_u = np.array(steady_state_values_u).flatten()
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([ioD, ioQ]), 'w': sp.Matrix([winv]),
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym, 'C': Csym, 'Cw': CwSym}
+    }
 
-    # Substitute steady-state values
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate((steady_state_values_x, steady_state_values_u))))
-    A = Asym.subs(subs_dict).evalf()
-    B = Bsym.subs(subs_dict).evalf()
-    Bw = BwSym.subs(subs_dict).evalf()
-    C = Csym.subs(subs_dict).evalf()
-    Cw = CwSym.subs(subs_dict).evalf()
+def ssmodel_droopSimplified(wbase, paras_inverter, steady_state_values_x, steady_state_values_u, is_ref, engine=None):
+    state_variables = ['theta', 'Po', 'Qo', 'iod', 'ioq']
+
+    state_matrix = ssmodel_compile(ssmodel_droopSimplified_symbolic, engine)(
+        wbase, paras_inverter, steady_state_values_x, steady_state_values_u)
 
     if not is_ref:
-        Cw = sp.zeros(1, len(state_variables))
+        state_matrix['Cw'] = np.zeros((1, len(state_variables)))
 
     # Output
-    state_matrix = {
-        'A': np.array(A).astype(float),
-        'B': np.array(B).astype(float),
-        'Bw': np.array(Bw).astype(float),
-        'C': np.array(C).astype(float),
-        'Cw': np.array(Cw).astype(float),
-        'ssVariables': state_variables
-    }
+    state_matrix['ssVariables'] = state_variables
 
     return state_matrix
-
@@ -1,31 +1,18 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_gfl_symbolic():
+    import sympy as sp
 
-def ssmodel_gfl(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, isRef):
     theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq = sp.symbols(
         'theta epsilonPLL wf Po Qo phid phiq gammad gammaq iid iiq vcd vcq iod ioq')
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
+    wbase = sp.Symbol('wbase')
     # Parameters
-    Pset = parasInverter['Pset']
-    Qset = parasInverter['Qset']
-    wset = parasInverter['wset']
-    Vset = parasInverter['Vset']
-    Rt = parasInverter['Rt']
-    Lt = parasInverter['Lt']
-    Rd = parasInverter['Rd']
-    Cf = parasInverter['Cf']
-    Rc = parasInverter['Rc']
-    Lc = parasInverter['Lc']
-    mp = parasInverter['mp']
-    mq = parasInverter['mq']
-    KpL = parasInverter['KpL']
-    KiL = parasInverter['KiL']
-    KpS = parasInverter['KpS']
-    KiS = parasInverter['KiS']
-    KpC = parasInverter['KpC']
-    KiC = parasInverter['KiC']
-    wcpll = parasInverter['wcpll']
-    wc = parasInverter['wc']
+    paras = sp.symbols('Pset Qset wset Vset Rt Lt Rd Cf Rc Lc mp mq KpL KiL KpS KiS KpC KiC wcpll wc')
+    Pset, Qset, wset, Vset, Rt, Lt, Rd, Cf, Rc, Lc, mp, mq, KpL, KiL, KpS, KiS, KpC, KiC, wcpll, wc = paras
     # Algebraic equations
     vod = vcd + Rd * (iid - iod)
     voq = vcq + Rd * (iiq - ioq)
@@ -59,7 +46,6 @@ def ssmodel_gfl(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, is
     IoD = iod * sp.cos(theta) - ioq * sp.sin(theta)
     IoQ = iod * sp.sin(theta) + ioq * sp.cos(theta)
     # State-Space Matrices
-    stateVariables = ['theta', 'epsilonPLL', 'wf', 'Po', 'Qo', 'phid', 'phiq', 'gammad', 'gammaq', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
     x = sp.Matrix([theta, epsilonPLL, wf, Po, Qo, phid, phiq, gammad, gammaq, iid, iiq, vcd, vcq, iod, ioq])
     u = sp.Matrix([vbD, vbQ, wcom])
     Asym = f.jacobian(x)
@@ -67,21 +53,18 @@ def ssmodel_gfl(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, is
     BwSym = f.jacobian(sp.Matrix([wcom]))
     Csym = sp.Matrix([IoD, IoQ]).jacobian(x)
     CwSym = winv.diff(x)
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate((steadyStateValuesX, steadyStateValuesU))))
-    A = np.array(Asym.subs(subs_dict).evalf(), dtype=float)
-    B = np.array(Bsym.subs(subs_dict).evalf(), dtype=float)
-    Bw = np.array(BwSym.subs(subs_dict).evalf(), dtype=float)
-    C = np.array(Csym.subs(subs_dict).evalf(), dtype=float)
-    Cw = np.array(CwSym.subs(subs_dict).evalf(), dtype=float)
-    if isRef == 0:
-        Cw = np.zeros((1, len(stateVariables)))
-    stateMatrix = {
-        'A': A,
-        'B': B,
-        'Bw': Bw,
-        'C': C,
-        'Cw': Cw,
-        'ssVariables': stateVariables
+
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([IoD, IoQ]), 'w': sp.Matrix([winv]),
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym, 'C': Csym, 'Cw': CwSym}
     }
 
+def ssmodel_gfl(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, isRef, engine=None):
+    stateVariables = ['theta', 'epsilonPLL', 'wf', 'Po', 'Qo', 'phid', 'phiq', 'gammad', 'gammaq', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
+    stateMatrix = ssmodel_compile(ssmodel_gfl_symbolic, engine)(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU)
+    if isRef == 0:
+        stateMatrix['Cw'] = np.zeros((1, len(stateVariables)))
+    stateMatrix['ssVariables'] = stateVariables
+
     return stateMatrix
\ No newline at end of file
@@ -1,7 +1,11 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_gflPlant_symbolic():
+    import sympy as sp
 
-def ssmodel_gflPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, isRef):
     thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ, \
     PoPlant, QoPlant, PsetDelay, QsetDelay, \
     theta, epsilonPLL, wf, Po, Qo, \
@@ -10,40 +14,15 @@ def ssmodel_gflPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, is
         'thetaPlant epsilonPLLPlant wPlant epsilonP epsilonQ PoPlant QoPlant PsetDelay QsetDelay '
         'theta epsilonPLL wf Po Qo phid phiq gammad gammaq iid iiq vcd vcq iod ioq')
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
+    wbase = sp.Symbol('wbase')
     # Parameters
-    PsetPlant  = parasIBR['PsetPlant']
-    QsetPlant  = parasIBR['QsetPlant']
-    wsetPlant  = parasIBR['wsetPlant']
-    VsetPlant  = parasIBR['VsetPlant']
-    mpPlant    = parasIBR['mpPlant']
-    mqPlant    = parasIBR['mqPlant']
-    KpPLLplant = parasIBR['KpPLLplant']
-    KiPLLplant = parasIBR['KiPLLplant']
-    KpPlantP   = parasIBR['KpPlantP']
-    KiPlantP   = parasIBR['KiPlantP']
-    KpPlantQ   = parasIBR['KpPlantQ']
-    KiPlantQ   = parasIBR['KiPlantQ']
-    wcpllPlant = parasIBR['wcpllPlant']
-    wcPlant    = parasIBR['wcPlant']
-    tDelay     = parasIBR['tDelay']
-    wset       = parasIBR['wset']
-    Vset       = parasIBR['Vset']
-    Rt         = parasIBR['Rt']
-    Lt         = parasIBR['Lt']
-    Rd         = parasIBR['Rd']
-    Cf         = parasIBR['Cf']
-    Rc         = parasIBR['Rc']
-    Lc         = parasIBR['Lc']
-    mp         = parasIBR['mp']
-    mq         = parasIBR['mq']
-    KpL        = parasIBR['KpL']
-    KiL        = parasIBR['KiL']
-    KpS        = parasIBR['KpS']
-    KiS        = parasIBR['KiS']
-    KpC        = parasIBR['KpC']
-    KiC        = parasIBR['KiC']
-    wcpll      = parasIBR['wcpll']
-    wc         = parasIBR['wc']
+    paras = sp.symbols(
+        'PsetPlant QsetPlant wsetPlant VsetPlant mpPlant mqPlant KpPLLplant KiPLLplant '
+        'KpPlantP KiPlantP KpPlantQ KiPlantQ wcpllPlant wcPlant tDelay '
+        'wset Vset Rt Lt Rd Cf Rc Lc mp mq KpL KiL KpS KiS KpC KiC wcpll wc')
+    (PsetPlant, QsetPlant, wsetPlant, VsetPlant, mpPlant, mqPlant, KpPLLplant, KiPLLplant,
+     KpPlantP, KiPlantP, KpPlantQ, KiPlantQ, wcpllPlant, wcPlant, tDelay,
+     wset, Vset, Rt, Lt, Rd, Cf, Rc, Lc, mp, mq, KpL, KiL, KpS, KiS, KpC, KiC, wcpll, wc) = paras
     # Algebraic equations
     vbqPlant   = -vbD * sp.sin(thetaPlant) + vbQ * sp.cos(thetaPlant)
     wpllPlant  = KpPLLplant * vbqPlant + KiPLLplant * epsilonPLLPlant + wsetPlant
@@ -94,12 +73,6 @@ def ssmodel_gflPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, is
         wbase * (vod - vbd - Rc * iod + winv * Lc * ioq) / Lc,       # Equation 23
         wbase * (voq - vbq - Rc * ioq - winv * Lc * iod) / Lc        # Equation 24
     ])
-    stateVariables = [
-        'thetaPlant', 'epsilonPLLPlant', 'wPlant', 'epsilonP', 'epsilonQ',
-        'PoPlant', 'QoPlant', 'PsetDelay', 'QsetDelay', 'theta', 'epsilonPLL',
-        'wf', 'Po', 'Qo', 'phid', 'phiq', 'gammad', 'gammaq', 'iid', 'iiq',
-        'vcd', 'vcq', 'iod', 'ioq'
-    ]
     x = sp.Matrix([
         thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ,
         PoPlant, QoPlant, PsetDelay, QsetDelay, theta, epsilonPLL, wf,
@@ -111,21 +84,23 @@ def ssmodel_gflPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, is
     BwSym = f.jacobian(sp.Matrix([wcom]))
     Csym = sp.Matrix([ioD, ioQ]).jacobian(x)
     CwSym = sp.Matrix([winv]).jacobian(x)
-    substitutions = {**dict(zip(x, steadyStateValuesX)), **dict(zip(u, steadyStateValuesU))}
-    A = np.array(Asym.subs(substitutions)).astype(float)
-    B = np.array(Bsym.subs(substitutions)).astype(float)
-    Bw = np.array(BwSym.subs(substitutions)).astype(float)
-    C = np.array(Csym.subs(substitutions)).astype(float)
-    Cw = np.array(CwSym.subs(substitutions)).astype(float)
-    if isRef == 0:
-        Cw = np.zeros((1, len(stateVariables)))
-    stateMatrix = {
-        'A': A,
-        'B': B,
-        'Bw': Bw,
-        'C': C,
-        'Cw': Cw,
-        'ssVariables': stateVariables
+
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([ioD, ioQ]), 'w': sp.Matrix([winv]),
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym, 'C': Csym, 'Cw': CwSym}
     }
 
+def ssmodel_gflPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, isRef, engine=None):
+    stateVariables = [
+        'thetaPlant', 'epsilonPLLPlant', 'wPlant', 'epsilonP', 'epsilonQ',
+        'PoPlant', 'QoPlant', 'PsetDelay', 'QsetDelay', 'theta', 'epsilonPLL',
+        'wf', 'Po', 'Qo', 'phid', 'phiq', 'gammad', 'gammaq', 'iid', 'iiq',
+        'vcd', 'vcq', 'iod', 'ioq'
+    ]
+    stateMatrix = ssmodel_compile(ssmodel_gflPlant_symbolic, engine)(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU)
+    if isRef == 0:
+        stateMatrix['Cw'] = np.zeros((1, len(stateVariables)))
+    stateMatrix['ssVariables'] = stateVariables
+
     return stateMatrix
\ No newline at end of file
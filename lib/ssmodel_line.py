@@ -1,19 +1,22 @@
-import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_line_symbolic():
+    import sympy as sp
 
-def ssmodel_line(wbase, parasLine, steadyStateValuesX, steadyStateValuesU):
     ilineD, ilineQ = sp.symbols('ilineD ilineQ')
     vbD1, vbQ1, vbD2, vbQ2, wcom = sp.symbols('vbD1 vbQ1 vbD2 vbQ2 wcom')
+    wbase = sp.Symbol('wbase')
     # Parameters
-    Rline = parasLine['Rline']
-    Lline = parasLine['Lline']
+    paras = sp.symbols('Rline Lline')
+    Rline, Lline = paras
     # Algebraic equations
     f = sp.Matrix([
         wbase * (vbD1 - vbD2 - Rline * ilineD + wcom * Lline * ilineQ) / Lline,
         wbase * (vbQ1 - vbQ2 - Rline * ilineQ - wcom * Lline * ilineD) / Lline
     ])
     # State-Space Matrices
-    stateVariables = ['$i_{lineD}$', '$i_{lineQ}$']
     x = sp.Matrix([ilineD, ilineQ])
     u = sp.Matrix([vbD1, vbQ1, vbD2, vbQ2, wcom])
     # Calculate Jacobians
@@ -21,21 +24,16 @@ def ssmodel_line(wbase, parasLine, steadyStateValuesX, steadyStateValuesU):
     B1sym = f.jacobian(sp.Matrix([vbD1, vbQ1]))
     B2sym = f.jacobian(sp.Matrix([vbD2, vbQ2]))
     BwSym = f.jacobian(sp.Matrix([wcom]))
-    # Ensure steadyStateValuesX and steadyStateValuesU are 1D arrays
-    steadyStateValuesX = np.array(steadyStateValuesX).flatten()
-    steadyStateValuesU = np.array(steadyStateValuesU).flatten()
-    # Substitute steady-state values
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate((steadyStateValuesX, steadyStateValuesU))))
-    A = Asym.subs(subs_dict).evalf()
-    B1 = B1sym.subs(subs_dict).evalf()
-    B2 = B2sym.subs(subs_dict).evalf()
-    Bw = BwSym.subs(subs_dict).evalf()
-    stateMatrix = {
-        'A': np.array(A).astype(float),
-        'B1': np.array(B1).astype(float),
-        'B2': np.array(B2).astype(float),
-        'Bw': np.array(Bw).astype(float),
-        'ssVariables': stateVariables
+
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f,
+        'matrices': {'A': Asym, 'B1': B1sym, 'B2': B2sym, 'Bw': BwSym}
     }
 
+def ssmodel_line(wbase, parasLine, steadyStateValuesX, steadyStateValuesU, engine=None):
+    stateVariables = ['$i_{lineD}$', '$i_{lineQ}$']
+    stateMatrix = ssmodel_compile(ssmodel_line_symbolic, engine)(wbase, parasLine, steadyStateValuesX, steadyStateValuesU)
+    stateMatrix['ssVariables'] = stateVariables
+
     return stateMatrix
@@ -1,36 +1,39 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_load_symbolic():
+    import sympy as sp
 
-def ssmodel_load(wbase, parasLoad, steadyStateValuesX, steadyStateValuesU):
     iloadD, iloadQ = sp.symbols('iloadD iloadQ')
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
+    wbase = sp.Symbol('wbase')
     # Parameters
-    Rload = parasLoad['Rload']
-    Lload = parasLoad['Lload']
+    paras = sp.symbols('Rload Lload')
+    Rload, Lload = paras
     # Ordinary differential equations
     f = sp.Matrix([
         wbase*(vbD - Rload*iloadD + wcom*Lload*iloadQ)/Lload,
         wbase*(vbQ - Rload*iloadQ - wcom*Lload*iloadD)/Lload
     ])
-    # Define state variables as a 2-column structure for consistency.
-    stateVariables = [['$i_{loadD}$', ''], ['$i_{loadQ}$', '']]
     x = sp.Matrix([iloadD, iloadQ])
     u = sp.Matrix([vbD, vbQ, wcom])
     # Calculate Jacobians
     Asym = f.jacobian(x)
     Bsym = f.jacobian(sp.Matrix([vbD, vbQ]))
     BwSym = f.jacobian(sp.Matrix([wcom]))
-    steadyStateValuesX = np.array(steadyStateValuesX).flatten()
-    steadyStateValuesU = np.array(steadyStateValuesU).flatten()
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate((steadyStateValuesX, steadyStateValuesU))))
-    A = Asym.subs(subs_dict).evalf()
-    B = Bsym.subs(subs_dict).evalf()
-    Bw = BwSym.subs(subs_dict).evalf()
-    stateMatrix = {
-        'A': np.array(A).astype(float),
-        'B': np.array(B).astype(float),
-        'Bw': np.array(Bw).astype(float),
-        'ssVariables': np.array(stateVariables)
+
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f,
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym}
     }
 
-    return stateMatrix
\ No newline at end of file
+def ssmodel_load(wbase, parasLoad, steadyStateValuesX, steadyStateValuesU, engine=None):
+    # Define state variables as a 2-column structure for consistency.
+    stateVariables = [['$i_{loadD}$', ''], ['$i_{loadQ}$', '']]
+    stateMatrix = ssmodel_compile(ssmodel_load_symbolic, engine)(wbase, parasLoad, steadyStateValuesX, steadyStateValuesU)
+    stateMatrix['ssVariables'] = np.array(stateVariables)
+
+    return stateMatrix
@@ -1,41 +1,21 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_sg_symbolic():
+    import sympy as sp
 
-def ssmodel_sg(wbase, parasSG, steadyStateValuesX, steadyStateValuesU, isRef):
     # Define symbolic variables
     theta, wr, psid, psiq, Eq1, Ed1, psi1d, psi2q, P1, Pg, Pf, P2, vx, Efd = sp.symbols(
         'theta wr psid psiq Eq1 Ed1 psi1d psi2q P1 Pg Pf P2 vx Efd'
     )
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
-    wset = parasSG['wset']
-    Pset = parasSG['Pset']
-    Vset = parasSG['Vset']
-    Rs = parasSG['Rs']
-    Ld = parasSG['Ld']
-    Ld1 = parasSG['Ld1']
-    Ld2 = parasSG['Ld2']
-    Lq = parasSG['Lq']
-    Lq1 = parasSG['Lq1']
-    Lq2 = parasSG['Lq2']
-    Ll = parasSG['Ll']
-    Tdo1 = parasSG['Tdo1']
-    Tqo1 = parasSG['Tqo1']
-    Tdo2 = parasSG['Tdo2']
-    Tqo2 = parasSG['Tqo2']
-    H = parasSG['H']
-    D = parasSG['D']
-    Kg = parasSG['Kg']
-    T1 = parasSG['T1']
-    T2 = parasSG['T2']
-    T3 = parasSG['T3']
-    T4 = parasSG['T4']
-    T5 = parasSG['T5']
-    K1 = parasSG['K1']
-    K2 = parasSG['K2']
-    Ta = parasSG['Ta']
-    Tb = parasSG['Tb']
-    Ke = parasSG['Ke']
-    Te = parasSG['Te']
+    wbase = sp.Symbol('wbase')
+    paras = sp.symbols('wset Pset Vset Rs Ld Ld1 Ld2 Lq Lq1 Lq2 Ll Tdo1 Tqo1 Tdo2 Tqo2 '
+                       'H D Kg T1 T2 T3 T4 T5 K1 K2 Ta Tb Ke Te')
+    (wset, Pset, Vset, Rs, Ld, Ld1, Ld2, Lq, Lq1, Lq2, Ll, Tdo1, Tqo1, Tdo2, Tqo2,
+     H, D, Kg, T1, T2, T3, T4, T5, K1, K2, Ta, Tb, Ke, Te) = paras
     # Algebraic equations
     vbd = vbD * sp.cos(theta) + vbQ * sp.sin(theta)
     vbq = -vbD * sp.sin(theta) + vbQ * sp.cos(theta)
@@ -75,15 +55,17 @@ def ssmodel_sg(wbase, parasSG, steadyStateValuesX, steadyStateValuesU, isRef):
     BwSym = f.jacobian(sp.Matrix([wcom]))
     Csym = sp.Matrix([ioD, ioQ]).jacobian(x)
     CwSym = wr.diff(x)
-    # Substitute steady-state values
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate([steadyStateValuesX, steadyStateValuesU])))
-    A = np.array(Asym.subs(subs_dict).evalf()).astype(np.float64)
-    B = np.array(Bsym.subs(subs_dict).evalf()).astype(np.float64)
-    Bw = np.array(BwSym.subs(subs_dict).evalf()).astype(np.float64)
-    C = np.array(Csym.subs(subs_dict).evalf()).astype(np.float64)
-    Cw = np.array(CwSym.subs(subs_dict).evalf()).astype(np.float64)
+
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([ioD, ioQ]), 'w': sp.Matrix([wr]),
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym, 'C': Csym, 'Cw': CwSym}
+    }
+
+def ssmodel_sg(wbase, parasSG, steadyStateValuesX, steadyStateValuesU, isRef, engine=None):
+    stateMatrix = ssmodel_compile(ssmodel_sg_symbolic, engine)(wbase, parasSG, steadyStateValuesX, steadyStateValuesU)
     if not isRef:
-        Cw = np.zeros((1, len(x)))
+        stateMatrix['Cw'] = np.zeros((1, stateMatrix['A'].shape[0]))
     # State variable labels
     stateVariables = [
         ['theta', ''], ['wr', ''], ['psid', ''], ['psiq', ''],
@@ -91,11 +73,5 @@ def ssmodel_sg(wbase, parasSG, steadyStateValuesX, steadyStateValuesU, isRef):
         ['P1', ''], ['Pg', ''], ['Pf', ''], ['P2', ''],
         ['vx', ''], ['Efd', '']
     ]
-    return {
-        'A': A,
-        'B': B,
-        'Bw': Bw,
-        'C': C,
-        'Cw': Cw,
-        'ssVariables': stateVariables
-    }
\ No newline at end of file
+    stateMatrix['ssVariables'] = stateVariables
+    return stateMatrix
@@ -1,26 +1,18 @@
 import numpy as np
-import sympy as sp
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_vsm_symbolic():
+    import sympy as sp
 
-def ssmodel_vsm(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, isRef):
     theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq = sp.symbols('theta Tef Qof Vof winv psif iid iiq vcd vcq iod ioq')
     vbD, vbQ, wcom = sp.symbols('vbD vbQ wcom')
+    wbase = sp.Symbol('wbase')
 
     # Parameters
-    Pset = parasInverter['Pset']
-    Qset = parasInverter['Qset']
-    wset = parasInverter['wset']
-    Vset = parasInverter['Vset']
-    Rt = parasInverter['Rt']
-    Lt = parasInverter['Lt']
-    Rd = parasInverter['Rd']
-    Cf = parasInverter['Cf']
-    Rc = parasInverter['Rc']
-    Lc = parasInverter['Lc']
-    mp = parasInverter['mp']
-    mq = parasInverter['mq']
-    J = parasInverter['J']
-    K = parasInverter['K']
-    tauf = parasInverter['tauf']
+    paras = sp.symbols('Pset Qset wset Vset Rt Lt Rd Cf Rc Lc mp mq J K tauf')
+    Pset, Qset, wset, Vset, Rt, Lt, Rd, Cf, Rc, Lc, mp, mq, J, K, tauf = paras
 
     # Algebraic equations
     vod = vcd + Rd * (iid - iod)
@@ -47,7 +39,7 @@ def ssmodel_vsm(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, is
     ])
     ioD = iod * sp.cos(theta) - ioq * sp.sin(theta)
     ioQ = iod * sp.sin(theta) + ioq * sp.cos(theta)
-    stateVariables = ['theta', 'Tef', 'Qof', 'Vof', 'winv', 'psif', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
+    # State-Space Matrices
     x = sp.Matrix([theta, Tef, Qof, Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq])
     u = sp.Matrix([vbD, vbQ, wcom])
     Asym = f.jacobian(x)
@@ -55,24 +47,19 @@ def ssmodel_vsm(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, is
     BwSym = f.jacobian(sp.Matrix([wcom]))
     Csym = sp.Matrix([ioD, ioQ]).jacobian(x)
     CwSym = winv.diff(x)
-    steadyStateValuesX = np.array(steadyStateValuesX).flatten()
-    steadyStateValuesU = np.array(steadyStateValuesU).flatten()
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate((steadyStateValuesX, steadyStateValuesU))))
-    A = Asym.subs(subs_dict).evalf()
-    B = Bsym.subs(subs_dict).evalf()
-    Bw = BwSym.subs(subs_dict).evalf()
-    C = Csym.subs(subs_dict).evalf()
-    Cw = CwSym.subs(subs_dict).evalf()
 
-    if isRef == 0:
-        Cw = sp.zeros(1, len(stateVariables))
-    stateMatrix = {
-        'A': np.array(A).astype(float),
-        'B': np.array(B).astype(float),
-        'Bw': np.array(Bw).astype(float),
-        'C': np.array(C).astype(float),
-        'Cw': np.array(Cw).astype(float),
-        'ssVariables': stateVariables
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([ioD, ioQ]), 'w': sp.Matrix([winv]),
+        'matrices': {'A': Asym, 'B': Bsym, 'Bw': BwSym, 'C': Csym, 'Cw': CwSym}
     }
 
+def ssmodel_vsm(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU, isRef, engine=None):
+    stateVariables = ['theta', 'Tef', 'Qof', 'Vof', 'winv', 'psif', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
+    stateMatrix = ssmodel_compile(ssmodel_vsm_symbolic, engine)(wbase, parasInverter, steadyStateValuesX, steadyStateValuesU)
+
+    if isRef == 0:
+        stateMatrix['Cw'] = np.zeros((1, len(stateVariables)))
+    stateMatrix['ssVariables'] = stateVariables
+
     return stateMatrix
@@ -1,7 +1,11 @@
-import sympy as sp
 import numpy as np
+from functools import lru_cache
+from lib.ssmodel_compile import ssmodel_compile
+
+@lru_cache(maxsize=None)
+def ssmodel_vsmPlant_symbolic():
+    import sympy as sp
 
-def ssmodel_vsmPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, isRef):
     (thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ,
      PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Tef, Qof, Vof,
      winv, psif, iid, iiq, vcd, vcq, iod, ioq) = sp.symbols(
@@ -9,36 +13,16 @@ def ssmodel_vsmPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, is
         'PsetDelay QsetDelay theta Tef Qof Vof winv psif iid iiq vcd vcq iod ioq',
         real=True)
     (vbD, vbQ, wcom) = sp.symbols('vbD vbQ wcom', real=True)
+    wbase = sp.Symbol('wbase')
 
     # Parameters
-    PsetPlant = parasIBR['PsetPlant']
-    QsetPlant = parasIBR['QsetPlant']
-    wsetPlant = parasIBR['wsetPlant']
-    VsetPlant = parasIBR['VsetPlant']
-    mpPlant = parasIBR['mpPlant']
-    mqPlant = parasIBR['mqPlant']
-    KpPLLplant = parasIBR['KpPLLplant']
-    KiPLLplant = parasIBR['KiPLLplant']
-    KpPlantP = parasIBR['KpPlantP']
-    KiPlantP = parasIBR['KiPlantP']
-    KpPlantQ = parasIBR['KpPlantQ']
-    KiPlantQ = parasIBR['KiPlantQ']
-    wcpllPlant = parasIBR['wcpllPlant']
-    wcPlant = parasIBR['wcPlant']
-    tDelay = parasIBR['tDelay']
-    wset = parasIBR['wset']
-    Vset = parasIBR['Vset']
-    Rt = parasIBR['Rt']
-    Lt = parasIBR['Lt']
-    Rd = parasIBR['Rd']
-    Cf = parasIBR['Cf']
-    Rc = parasIBR['Rc']
-    Lc = parasIBR['Lc']
-    mp = parasIBR['mp']
-    mq = parasIBR['mq']
-    J = parasIBR['J']
-    K = parasIBR['K']
-    tauf = parasIBR['tauf']
+    paras = sp.symbols(
+        'PsetPlant QsetPlant wsetPlant VsetPlant mpPlant mqPlant KpPLLplant KiPLLplant '
+        'KpPlantP KiPlantP KpPlantQ KiPlantQ wcpllPlant wcPlant tDelay '
+        'wset Vset Rt Lt Rd Cf Rc Lc mp mq J K tauf')
+    (PsetPlant, QsetPlant, wsetPlant, VsetPlant, mpPlant, mqPlant, KpPLLplant, KiPLLplant,
+     KpPlantP, KiPlantP, KpPlantQ, KiPlantQ, wcpllPlant, wcPlant, tDelay,
+     wset, Vset, Rt, Lt, Rd, Cf, Rc, Lc, mp, mq, J, K, tauf) = paras
     # Algebraic equations
     vbqPlant = -vbD * sp.sin(thetaPlant) + vbQ * sp.cos(thetaPlant)
     wpllPlant = KpPLLplant * vbqPlant + KiPLLplant * epsilonPLLPlant + wsetPlant
@@ -81,9 +65,6 @@ def ssmodel_vsmPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, is
     f = sp.Matrix([f1, f2, f3, f4, f5, f6, f7, f8, f9, f10,
                    f11, f12, f13, f14, f15, f16, f17, f18, f19, f20, f21])
     # Define state and input variables
-    stateVariables = ['thetaPlant', 'epsilonPLLPlant', 'wPlant', 'epsilonP', 'epsilonQ',
-                      'PoPlant', 'QoPlant', 'PsetDelay', 'QsetDelay', 'theta', 'Tef', 'Qof',
-                      'Vof', 'winv', 'psif', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
     x = sp.Matrix([thetaPlant, epsilonPLLPlant, wPlant, epsilonP, epsilonQ,
                    PoPlant, QoPlant, PsetDelay, QsetDelay, theta, Tef, Qof,
                    Vof, winv, psif, iid, iiq, vcd, vcq, iod, ioq])
@@ -93,21 +74,20 @@ def ssmodel_vsmPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, is
     Bw_sym = f.jacobian([wcom])
     C_sym = sp.Matrix([ioD, ioQ]).jacobian(x)
     Cw_sym = sp.Matrix([winv]).jacobian(x)
-    subs_dict = dict(zip(list(x) + list(u), np.concatenate((steadyStateValuesX, steadyStateValuesU))))
-    A = np.array(A_sym.subs(subs_dict)).astype(np.float64)
-    B = np.array(B_sym.subs(subs_dict)).astype(np.float64)
-    Bw = np.array(Bw_sym.subs(subs_dict)).astype(np.float64)
-    C = np.array(C_sym.subs(subs_dict)).astype(np.float64)
-    Cw = np.array(Cw_sym.subs(subs_dict)).astype(np.float64)
-    if isRef == 0:
-        Cw = np.zeros((1, len(x)))
-    stateMatrix = {
-        'A': np.array(A).astype(float),
-        'B': np.array(B).astype(float),
-        'Bw': np.array(Bw).astype(float),
-        'C': np.array(C).astype(float),
-        'Cw': np.array(Cw).astype(float),
-        'ssVariables': stateVariables
+
+    return {
+        'wbase': wbase, 'x': x, 'u': u, 'paras': paras,
+        'f': f, 'y': sp.Matrix([ioD, ioQ]), 'w': sp.Matrix([winv]),
+        'matrices': {'A': A_sym, 'B': B_sym, 'Bw': Bw_sym, 'C': C_sym, 'Cw': Cw_sym}
     }
 
+def ssmodel_vsmPlant(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, isRef, engine=None):
+    stateVariables = ['thetaPlant', 'epsilonPLLPlant', 'wPlant', 'epsilonP', 'epsilonQ',
+                      'PoPlant', 'QoPlant', 'PsetDelay', 'QsetDelay', 'theta', 'Tef', 'Qof',
+                      'Vof', 'winv', 'psif', 'iid', 'iiq', 'vcd', 'vcq', 'iod', 'ioq']
+    stateMatrix = ssmodel_compile(ssmodel_vsmPlant_symbolic, engine)(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU)
+    if isRef == 0:
+        stateMatrix['Cw'] = np.zeros((1, len(stateVariables)))
+    stateMatrix['ssVariables'] = stateVariables
+
     return stateMatrix
@@ -1,34 +1,23 @@
 import numpy as np
-from scipy.optimize import fsolve
 from lib.pf_func_ibr_infinite import pf_func_ibr_infinite
+from lib.pf_jac_ibr_infinite import pf_jac_ibr_infinite
+from lib.pf_solve import pf_solve
 from lib.pf_calc_infinite import pf_calc_infinite
 from lib.steadystatevalue_vsm import steadystatevalue_vsm
 from lib.ssmodel_vsm import ssmodel_vsm
+from lib.ssmodel_assemble import ssmodel_assemble
 from lib.eigenvalue_analysis import eigenvalue_analysis
 
-def ssmodel_vsm_infinite(wbase,parasIBR,dominantParticipationFactorBoundary):
+def ssmodel_vsm_infinite(wbase,parasIBR,dominantParticipationFactorBoundary, warmStart=None, stabilityOnly=False, pfSolution=None):
     x0 = np.array([0, 1])
-    x, info, ier, msg = fsolve(
-        lambda x: pf_func_ibr_infinite(x, parasIBR),
-        x0,
-        xtol=1e-6,
-        maxfev=500,
-        full_output=True
-    )
+    x, info, ier, msg = pf_solve(pf_func_ibr_infinite, pf_jac_ibr_infinite, x0, (parasIBR,), warmStart, xtol=1e-6, maxfev=500, pfSolution=pfSolution)
     pfExitFlag = ier
     w, V1, V2, I = pf_calc_infinite(x, parasIBR)
     steadyStateValuesX, steadyStateValuesU = steadystatevalue_vsm(w, V2, I, parasIBR)
     stateMatrix = ssmodel_vsm(wbase, parasIBR, steadyStateValuesX, steadyStateValuesU, 0)
-    Asys = stateMatrix['A']
-    ssVariables = stateMatrix['ssVariables']
-    if isinstance(ssVariables, list):
-        ssVariables = [list(row) for row in ssVariables]
-        for row in ssVariables:
-            row[1] = 'IBR'
-    elif isinstance(ssVariables, np.ndarray):
-        ssVariables[:, 1] = ['IBR'] * ssVariables.shape[0]
-    else:
-        raise TypeError("Unsupported type for ssVariables")
-    eigenvalueAnalysisResults = eigenvalue_analysis(Asys, ssVariables, dominantParticipationFactorBoundary)
+    Asys, ssVariables = ssmodel_assemble([
+        {'label': 'IBR', 'stateMatrix': stateMatrix, 'bus': None},
+    ])
+    eigenvalueAnalysisResults = eigenvalue_analysis(Asys, ssVariables, dominantParticipationFactorBoundary, eigenvectors=not stabilityOnly)
 
     return Asys, steadyStateValuesX, eigenvalueAnalysisResults, pfExitFlag
\ No newline at end of file
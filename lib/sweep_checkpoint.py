@@ -0,0 +1,43 @@
+import glob
+import hashlib
+import json
+import os
+import pickle
+import time
+import uuid
+
+# A checkpoint is a directory of pickled {key: row} files, one per completed
+# chunk, each written under a temporary name and renamed into place so that a
+# killed sweep never leaves a partial file behind. Names start with the write
+# time so that files load in write order
+
+def sweep_checkpoint_key(case, point, stabilityOnly):
+    # Content hash of one evaluation: the case file, the merged user_params and
+    # whether the modal analysis was requested
+    text = json.dumps([case, point, stabilityOnly], sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def sweep_checkpoint_load(path, retryFailures=False):
+    # Every stored row by key. Failed points (an error or a power flow that did
+    # not converge) are stored like any other so they are not retried on every
+    # restart, unless retryFailures. A key stored more than once keeps its
+    # latest row, except that a successful row is never replaced by a failure
+    rows = {}
+    for file in sorted(glob.glob(os.path.join(path, '*.pkl'))):
+        with open(file, 'rb') as f:
+            for key, row in pickle.load(f).items():
+                if key not in rows or sweep_checkpoint_success(row) or not sweep_checkpoint_success(rows[key]):
+                    rows[key] = row
+    if retryFailures:
+        rows = {key: row for key, row in rows.items() if sweep_checkpoint_success(row)}
+    return rows
+
+def sweep_checkpoint_success(row):
+    return row['error'] is None and row['pfExitFlag'] == 1
+
+def sweep_checkpoint_write(path, keys, rows):
+    os.makedirs(path, exist_ok=True)
+    file = os.path.join(path, f'{time.time_ns():020d}-{uuid.uuid4().hex}.pkl')
+    with open(file + '.tmp', 'wb') as f:
+        pickle.dump(dict(zip(keys, rows)), f)
+    os.replace(file + '.tmp', file)
@@ -0,0 +1,149 @@
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from lib.pf_warm_start import pf_warm_start_mode
+from lib.sweep_run import sweep_case_file, sweep_evaluate, sweep_merge, sweep_results
+
+# A sweep shared by several machines through one SQLite file on a shared
+# filesystem: sweep_queue_create splits it into chunks, any number of
+# sweep_queue_work processes lease chunks, evaluate them like sweep_run and
+# write the rows back, and sweep_queue_results collects them in order. A
+# worker renews its lease every leaseTimeout / 3 seconds while the chunk runs;
+# a lease not renewed within leaseTimeout seconds (a dead worker) is handed to
+# the next worker, so machine clocks should be roughly in sync. The
+# filesystem must honour POSIX locks, as SQLite requires
+
+def sweep_queue_connect(database):
+    connection = sqlite3.connect(database, timeout=60, isolation_level=None)
+    connection.execute('PRAGMA busy_timeout = 60000')
+    return connection
+
+def sweep_queue_create(database, case, overrides, baseParams=None, chunkSize=256, stabilityOnly=True, warmStart=None):
+    # New queue for case over the overrides (as for sweep_run)
+    sweep_case_file(case)
+    pf_warm_start_mode(warmStart)
+    baseParams = baseParams or {}
+    for override in overrides:
+        sweep_merge(baseParams, override, case)
+    connection = sweep_queue_connect(database)
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        connection.execute('CREATE TABLE sweep (case_name TEXT, base_params BLOB, stability_only INTEGER, warm_start TEXT)')
+        connection.execute(
+            "CREATE TABLE chunks (id INTEGER PRIMARY KEY, overrides BLOB, status TEXT DEFAULT 'pending', "
+            'worker TEXT, lease_expiry REAL, attempts INTEGER DEFAULT 0, rows BLOB)'
+        )
+        connection.execute('INSERT INTO sweep VALUES (?, ?, ?, ?)', (case, pickle.dumps(baseParams), int(stabilityOnly), warmStart))
+        connection.executemany('INSERT INTO chunks (id, overrides) VALUES (?, ?)', [
+            (index, pickle.dumps(overrides[start:start + chunkSize]))
+            for index, start in enumerate(range(0, len(overrides), chunkSize))
+        ])
+        connection.execute('COMMIT')
+    except BaseException:
+        connection.execute('ROLLBACK')
+        raise
+    finally:
+        connection.close()
+
+def sweep_queue_claim(connection, worker, leaseTimeout, maxAttempts):
+    # Atomically lease the next pending or expired chunk; chunks leased
+    # maxAttempts times without completing are marked failed
+    now = time.time()
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        connection.execute(
+            "UPDATE chunks SET status = 'failed' WHERE status = 'leased' AND lease_expiry < ? AND attempts >= ?",
+            (now, maxAttempts)
+        )
+        row = connection.execute(
+            "SELECT id, overrides FROM chunks WHERE status = 'pending' OR (status = 'leased' AND lease_expiry < ?) "
+            "ORDER BY id LIMIT 1", (now,)
+        ).fetchone()
+        if row is not None:
+            connection.execute(
+                "UPDATE chunks SET status = 'leased', worker = ?, lease_expiry = ?, attempts = attempts + 1 WHERE id = ?",
+                (worker, now + leaseTimeout, row[0])
+            )
+        connection.execute('COMMIT')
+    except BaseException:
+        connection.execute('ROLLBACK')
+        raise
+    return row
+
+def sweep_queue_work(database, leaseTimeout=3600, processes=1, maxAttempts=3, poll=10):
+    # Worker loop: leases chunks and evaluates them with sweep_evaluate on
+    # processes local processes until none are pending; while other workers
+    # hold leases it keeps polling so that their chunks are taken over if they
+    # die. Returns the number of chunks this worker completed
+    worker = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+    connection = sweep_queue_connect(database)
+    case, baseParams, stabilityOnly, warmStart = connection.execute('SELECT * FROM sweep').fetchone()
+    baseParams = pickle.loads(baseParams)
+    completed = 0
+    executor = ProcessPoolExecutor(processes) if processes > 1 else None
+    try:
+        while True:
+            claimed = sweep_queue_claim(connection, worker, leaseTimeout, maxAttempts)
+            if claimed is None:
+                if connection.execute("SELECT COUNT(*) FROM chunks WHERE status = 'leased'").fetchone()[0] == 0:
+                    return completed
+                time.sleep(poll)
+                continue
+            points = [sweep_merge(baseParams, override, case) for override in pickle.loads(claimed[1])]
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=sweep_queue_heartbeat, args=(database, claimed[0], worker, leaseTimeout, stop),
+                                         daemon=True)
+            heartbeat.start()
+            try:
+                rows = sweep_evaluate(case, points, processes, stabilityOnly=bool(stabilityOnly), warmStart=warmStart,
+                                      executor=executor)
+            finally:
+                stop.set()
+                heartbeat.join()
+            # A chunk taken over after an expired lease may be finished twice;
+            # the first result is kept
+            completed += connection.execute(
+                "UPDATE chunks SET status = 'done', worker = ?, rows = ? WHERE id = ? AND status != 'done'",
+                (worker, pickle.dumps(rows), claimed[0])
+            ).rowcount
+    finally:
+        connection.close()
+        if executor is not None:
+            executor.shutdown()
+
+def sweep_queue_heartbeat(database, chunk, worker, leaseTimeout, stop):
+    # Renews the lease of worker on chunk until stop is set, on a connection of
+    # its own; a lease already taken over by another worker is left alone
+    connection = sweep_queue_connect(database)
+    try:
+        while not stop.wait(leaseTimeout / 3):
+            connection.execute(
+                "UPDATE chunks SET lease_expiry = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+                (time.time() + leaseTimeout, chunk, worker)
+            )
+    finally:
+        connection.close()
+
+def sweep_queue_status(database):
+    # Number of chunks per status
+    connection = sweep_queue_connect(database)
+    status = dict(connection.execute('SELECT status, COUNT(*) FROM chunks GROUP BY status').fetchall())
+    connection.close()
+    return status
+
+def sweep_queue_results(database):
+    # sweep_run columns over the completed chunks, in sweep order; points of
+    # unfinished chunks are left out
+    connection = sweep_queue_connect(database)
+    stabilityOnly = connection.execute('SELECT stability_only FROM sweep').fetchone()[0]
+    overrides, rows = [], []
+    for chunkOverrides, chunkRows in connection.execute("SELECT overrides, rows FROM chunks WHERE status = 'done' ORDER BY id"):
+        overrides += pickle.loads(chunkOverrides)
+        rows += pickle.loads(chunkRows)
+    connection.close()
+    return sweep_results(overrides, rows, bool(stabilityOnly))
@@ -0,0 +1,74 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from lib.sweep_run import sweep_grid, sweep_run
+
+def sweep_refine(case, bounds, baseParams=None, initial=5, levels=4, dampingThreshold=None, processes=None, warmStart=None, checkpoint=None):
+    # Locates the stability boundary of case over 2-4 parameters by quadtree /
+    # octree refinement. bounds is {'parasIBR1.mp': (low, high), ...} (names as
+    # in sweep_grid); an initial^d grid of cell corners is evaluated, then for
+    # levels rounds every cell whose corners disagree is split in 2^d and only
+    # its new corners are evaluated. A point is stable if its power flow
+    # converged, maxRealValue < 0 and, with dampingThreshold, minDampingRatio
+    # >= dampingThreshold. checkpoint is passed on to sweep_run.
+    # Returns the sweep_run columns of every evaluated point plus 'stable' and
+    # 'level', and the (m, d) centres of the finest cells that straddle the
+    # boundary
+    if not 2 <= len(bounds) <= 4:
+        raise ValueError(f"sweep_refine needs 2 to 4 parameters in bounds, got {len(bounds)}")
+    if initial < 2:
+        raise ValueError(f"initial must be at least 2 (one cell per parameter), got {initial}")
+    names = list(bounds)
+    low = np.array([bounds[name][0] for name in names], dtype=float)
+    high = np.array([bounds[name][1] for name in names], dtype=float)
+    d = len(names)
+    # Corners live on an integer lattice at the finest resolution
+    step = 2 ** levels
+    finest = (initial - 1) * step
+    corners = list(itertools.product(*[range(2)] * d))
+    cells = [tuple(step * np.array(origin)) for origin in itertools.product(*[range(initial - 1)] * d)]
+    size = step
+
+    stable = {}
+    parts = []
+    processes = processes or os.cpu_count()
+    executor = ProcessPoolExecutor(processes) if processes > 1 else None
+    try:
+        for level in range(levels + 1):
+            points = sorted({
+                tuple(origin[k] + size * corner[k] for k in range(d))
+                for origin in cells for corner in corners
+            } - stable.keys())
+            if points:
+                values = low + (high - low) * np.array(points, dtype=float) / finest
+                overrides = [sweep_grid({name: [value] for name, value in zip(names, row)})[0] for row in values]
+                results = sweep_run(case, overrides, baseParams, processes=processes, warmStart=warmStart, executor=executor,
+                                    checkpoint=checkpoint)
+                isStable = (results['pfExitFlag'] == 1) & (results['maxRealValue'] < 0)
+                if dampingThreshold is not None:
+                    isStable &= results['minDampingRatio'] >= dampingThreshold
+                results['stable'] = isStable
+                results['level'] = np.full(len(points), level)
+                stable.update(zip(points, isStable))
+                parts.append(results)
+
+            # Keep the cells whose corners disagree, split them for the next level
+            cells = [
+                origin for origin in cells
+                if len({stable[tuple(origin[k] + size * corner[k] for k in range(d))] for corner in corners}) > 1
+            ]
+            if level == levels or not cells:
+                break
+            size //= 2
+            cells = [tuple(origin[k] + size * corner[k] for k in range(d)) for origin in cells for corner in corners]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    n = max(part['eigs'].shape[1] for part in parts)
+    for part in parts:
+        part['eigs'] = np.pad(part['eigs'], ((0, 0), (0, n - part['eigs'].shape[1])), constant_values=np.nan)
+    results = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    boundary = low + (high - low) * (np.array(cells, dtype=float).reshape(-1, d) + size / 2) / finest
+    return results, boundary
@@ -0,0 +1,190 @@
+import ast
+import contextlib
+import functools
+import glob
+import importlib
+import itertools
+import math
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from lib.pf_warm_start import pf_warm_start_mode
+from lib.sweep_checkpoint import sweep_checkpoint_key, sweep_checkpoint_load, sweep_checkpoint_write
+
+def sweep_case_file(case, directory='Main', infix='main_'):
+    # The caseNN<infix><name>.py file in directory for 'case09',
+    # 'droopPlant_droopPlant' or 'main_droopPlant_droopPlant'
+    name = case[len('main_'):] if case.startswith('main_') else case
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = [
+        path for path in sorted(glob.glob(os.path.join(root, directory, f'case*{infix}*.py')))
+        if os.path.basename(path).startswith(name + infix) or os.path.basename(path).endswith(infix + name + '.py')
+    ]
+    if len(paths) != 1:
+        raise ValueError(f"Unknown case '{case}'")
+    return paths[0]
+
+def sweep_case(case):
+    # The Main main_* function of a case, see sweep_case_file
+    moduleName = os.path.basename(sweep_case_file(case))[:-3]
+    module = importlib.import_module('Main.' + moduleName)
+    return getattr(module, 'main_' + moduleName.split('main_', 1)[1])
+
+@functools.lru_cache(maxsize=None)
+def sweep_case_params(case):
+    # The user_params a case reads, from the parameter dict literals of its
+    # Main function: {group: keys} for the nested cases, which test
+    # 'parasX' in user_params, else {None: keys} for the flat ones
+    with open(sweep_case_file(case)) as f:
+        tree = ast.parse(f.read())
+    main = next(node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name.startswith('main_'))
+    dicts = {
+        node.targets[0].id: frozenset(key.value for key in node.value.keys if isinstance(key, ast.Constant))
+        for node in ast.walk(main)
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+        and node.targets[0].id.startswith('paras') and isinstance(node.value, ast.Dict)
+    }
+    groups = {
+        node.left.value for node in ast.walk(main)
+        if isinstance(node, ast.Compare) and isinstance(node.left, ast.Constant) and isinstance(node.ops[0], ast.In)
+    }
+    if groups:
+        return {group: dicts[group] for group in groups}
+    return {None: frozenset().union(*dicts.values())}
+
+def sweep_merge(baseParams, override, case=None):
+    # user_params are nested ({'parasIBR1': {'mp': 0.1}}) or, for the infinite
+    # bus cases, flat ({'mp': 0.1}); nested groups are merged key by key. With
+    # case, a key the case does not read (see sweep_case_params) is a ValueError
+    merged = {
+        key: {**baseParams[key], **override[key]}
+        if isinstance(baseParams.get(key), dict) and isinstance(override.get(key), dict)
+        else override.get(key, baseParams.get(key))
+        for key in {**baseParams, **override}
+    }
+    if case is not None:
+        params = sweep_case_params(case)
+        unknown = []
+        for name in sweep_columns(merged):
+            group, key = name.split('.', 1) if '.' in name else (None, name)
+            if key not in params.get(group, ()):
+                unknown.append(name)
+        if unknown:
+            raise ValueError(f"Unknown parameters {unknown} for case '{case}'")
+    return merged
+
+def sweep_columns(override):
+    # Columns of an override: 'group.key' for nested user_params, else key
+    columns = {}
+    for group, values in override.items():
+        if isinstance(values, dict):
+            columns.update((f'{group}.{key}', value) for key, value in values.items())
+        else:
+            columns[group] = values
+    return columns
+
+def sweep_grid(grid):
+    # Cartesian product of {'parasIBR1.mp': values, 'parasLoad.Rload': values, ...}
+    # (or {'mp': values, ...} for the flat user_params of the infinite bus cases)
+    # as a list of user_params overrides for sweep_run
+    names = list(grid)
+    overrides = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        user_params = {}
+        for name, value in zip(names, values):
+            if '.' in name:
+                group, key = name.split('.', 1)
+                user_params.setdefault(group, {})[key] = value
+            else:
+                user_params[name] = value
+        overrides.append(user_params)
+    return overrides
+
+def sweep_run(case, overrides, baseParams=None, processes=None, chunkSize=None, stabilityOnly=True, warmStart=None, executor=None,
+              checkpoint=None, retryFailures=False):
+    # Evaluates case (see sweep_case) once per override, a user_params dict such
+    # as {'parasIBR1': {'mp': 0.1}} applied on top of baseParams, across a pool
+    # of processes (default os.cpu_count(); 1 runs in this process; an existing
+    # executor is reused instead) in chunks of consecutive points, each chunk
+    # solved in order so that warmStart ('previous' or 'nearest', see pf_solve)
+    # reuses its power flows.
+    # Returns columns of equal length: one per swept 'group.key', maxRealValue,
+    # minDampingRatio, pfExitFlag, eigs (N, n), error (None or the traceback of
+    # a failed point, whose values are NaN and pfExitFlag -1) and, unless
+    # stabilityOnly, eigenvalueAnalysisResults (see eigenvalue_results, whose
+    # modalAnalysis expands one point into the table the visualizations show).
+    # With checkpoint (a directory, see sweep_checkpoint) every completed chunk
+    # is saved as it finishes and points already stored there, failures
+    # included unless retryFailures, are not evaluated again, so a killed sweep
+    # resumes where it stopped when rerun with the same arguments
+    baseParams = baseParams or {}
+    points = [sweep_merge(baseParams, override, case) for override in overrides]
+    rows = sweep_evaluate(case, points, processes, chunkSize, stabilityOnly, warmStart, executor, checkpoint, retryFailures)
+    return sweep_results(overrides, rows, stabilityOnly)
+
+def sweep_evaluate(case, points, processes=None, chunkSize=None, stabilityOnly=True, warmStart=None, executor=None,
+                   checkpoint=None, retryFailures=False):
+    # One row per fully merged user_params point, as evaluated for sweep_run
+    pf_warm_start_mode(warmStart)
+    caseName = os.path.basename(sweep_case_file(case))[:-3]
+    keys = [sweep_checkpoint_key(caseName, point, stabilityOnly) for point in points] if checkpoint else None
+    stored = sweep_checkpoint_load(checkpoint, retryFailures) if checkpoint else {}
+    pending = [i for i in range(len(points)) if not checkpoint or keys[i] not in stored]
+
+    processes = processes or os.cpu_count()
+    chunkSize = chunkSize or max(1, math.ceil(len(pending) / (4 * processes)))
+    indices = [pending[start:start + chunkSize] for start in range(0, len(pending), chunkSize)]
+    chunks = [(case, [points[i] for i in chunk], stabilityOnly, warmStart) for chunk in indices]
+    evaluated = {}
+    with contextlib.ExitStack() as stack:
+        if executor is None and processes > 1 and len(chunks) > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(processes))
+        for chunk, chunkRows in zip(indices, (executor.map if executor is not None else map)(_sweep_chunk, chunks)):
+            if checkpoint:
+                sweep_checkpoint_write(checkpoint, [keys[i] for i in chunk], chunkRows)
+            evaluated.update(zip(chunk, chunkRows))
+    rows = [evaluated[i] if i in evaluated else stored[keys[i]] for i in range(len(points))]
+    return rows
+
+def sweep_results(overrides, rows, stabilityOnly):
+    # Columnar results of sweep_run from the overrides and their evaluated rows
+    columns = [sweep_columns(override) for override in overrides]
+    results = {}
+    for name in sorted({name for column in columns for name in column}):
+        values = [column.get(name, np.nan) for column in columns]
+        try:
+            results[name] = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            results[name] = np.array(values, dtype=object)
+    n = max((len(row['eigs']) for row in rows), default=0)
+    results['maxRealValue'] = np.array([row['maxRealValue'] for row in rows], dtype=float)
+    results['minDampingRatio'] = np.array([row['minDampingRatio'] for row in rows], dtype=float)
+    results['pfExitFlag'] = np.array([row['pfExitFlag'] for row in rows], dtype=int)
+    results['eigs'] = np.full((len(rows), n), np.nan, dtype=complex)
+    for i, row in enumerate(rows):
+        results['eigs'][i, :len(row['eigs'])] = row['eigs']
+    results['error'] = np.array([row['error'] for row in rows], dtype=object)
+    if not stabilityOnly:
+        results['eigenvalueAnalysisResults'] = np.array([None] * len(rows), dtype=object)
+        results['eigenvalueAnalysisResults'][:] = [row['eigenvalueAnalysisResults'] for row in rows]
+    return results
+
+def _sweep_chunk(chunk):
+    case, points, stabilityOnly, warmStart = chunk
+    main = sweep_case(case)
+    rows = []
+    for user_params in points:
+        try:
+            testResults = main(user_params, stabilityOnly=stabilityOnly, warmStart=warmStart)
+            _, eigs, maxRealValue, minDampingRatio, eigenvalueAnalysisResults, pfExitFlag = testResults[1]
+            rows.append({
+                'eigs': np.asarray(eigs), 'maxRealValue': maxRealValue, 'minDampingRatio': minDampingRatio, 'pfExitFlag': pfExitFlag,
+                'eigenvalueAnalysisResults': None if stabilityOnly else eigenvalueAnalysisResults, 'error': None,
+            })
+        except Exception:
+            rows.append({
+                'eigs': np.zeros(0), 'maxRealValue': np.nan, 'minDampingRatio': np.nan,
+                'pfExitFlag': -1, 'eigenvalueAnalysisResults': None, 'error': traceback.format_exc(),
+            })
+    return rows
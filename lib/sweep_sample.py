@@ -0,0 +1,139 @@
+import ast
+import glob
+import json
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy.stats import qmc
+from lib.sweep_run import sweep_case_file, sweep_merge, sweep_run
+
+def sweep_sample_ranges(case):
+    # variable_ranges and prepare_simulation_parameters (flat names to
+    # user_params; identity where the case takes flat names) of the case's
+    # Visualization file, read from its source so streamlit is never imported
+    path = sweep_case_file(case, 'Visualization', 'vis_')
+    with open(path, encoding='utf-8') as file:
+        tree = ast.parse(file.read(), path)
+    nodes = [
+        node for node in tree.body
+        if (isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == 'variable_ranges' for target in node.targets))
+        or (isinstance(node, ast.FunctionDef) and node.name == 'prepare_simulation_parameters')
+    ]
+    namespace = {'np': np}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), path, 'exec'), namespace)
+    return namespace['variable_ranges'], namespace.get('prepare_simulation_parameters', dict)
+
+def sweep_sample_unit(method, nVariables, seed):
+    # Generator of reproducible unit-cube sample chunks: 'sobol' (scrambled,
+    # one sequence across all chunks), 'lhs' (each chunk its own Latin
+    # hypercube) or 'random'
+    if method == 'sobol':
+        sampler = qmc.Sobol(nVariables, scramble=True, seed=seed)
+    elif method == 'lhs':
+        sampler = qmc.LatinHypercube(nVariables, seed=seed)
+    elif method == 'random':
+        rng = np.random.default_rng(seed)
+        return lambda n: rng.random((n, nVariables))
+    else:
+        raise ValueError(f"Unknown sampling method '{method}', expected 'sobol', 'lhs' or 'random'")
+    return sampler.random
+
+def sweep_sample(case, nSamples, path, method='sobol', seed=0, variables=None, chunkSize=4096, processes=None, warmStart=None, saveEigs=False):
+    # Probabilistic stability sampling of case over the variable_ranges of its
+    # Visualization file (all non-degenerate ranges, or the given variables).
+    # Variables that prepare_simulation_parameters maps to a key the case does
+    # not read are dropped with a warning by default and a ValueError when
+    # named in variables (see sweep_merge).
+    # Samples are drawn in the parent, so a seed gives the same parameter sets
+    # whatever the number of processes (and, except for 'lhs', whose hypercube
+    # is per chunk, whatever the chunkSize), and are evaluated and written chunk by
+    # chunk to path/chunk_NNNNNN.npz (sample index, one column per variable,
+    # maxRealValue, minDampingRatio, pfExitFlag, error and optionally eigs);
+    # read them back with sweep_sample_load. Chunks already in path are kept, so
+    # rerunning with the same arguments resumes an interrupted run; the
+    # arguments that determine the samples are stored in path/manifest.json and
+    # resuming with different ones is a ValueError. Returns the sample count
+    # and the fraction of converged samples with maxRealValue < 0
+    variableRanges, prepare = sweep_sample_ranges(case)
+    if variables is None:
+        variables = [name for name, (low, high) in variableRanges.items() if high > low]
+        unread = []
+        for name in variables:
+            try:
+                sweep_merge({}, prepare({name: variableRanges[name][0]}), case)
+            except ValueError:
+                unread.append(name)
+        if unread:
+            warnings.warn(f"Case '{case}' does not read {unread}; they are not sampled")
+            variables = [name for name in variables if name not in unread]
+    low = np.array([variableRanges[name][0] for name in variables], dtype=float)
+    high = np.array([variableRanges[name][1] for name in variables], dtype=float)
+    sweep_merge({}, prepare(dict(zip(variables, low))), case)
+    draw = sweep_sample_unit(method, len(variables), seed)
+    manifest = {
+        'case': os.path.basename(sweep_case_file(case))[:-3], 'nSamples': nSamples, 'method': method, 'seed': seed,
+        'chunkSize': chunkSize, 'variables': variables, 'low': low.tolist(), 'high': high.tolist(), 'saveEigs': saveEigs,
+    }
+    sweep_sample_manifest(path, manifest)
+
+    nStable = nConverged = 0
+    processes = processes or os.cpu_count()
+    executor = ProcessPoolExecutor(processes) if processes > 1 else None
+    try:
+        for index, start in enumerate(range(0, nSamples, chunkSize)):
+            samples = qmc.scale(draw(min(chunkSize, nSamples - start)), low, high)
+            file = os.path.join(path, f'chunk_{index:06d}.npz')
+            if os.path.exists(file):
+                with np.load(file) as chunk:
+                    converged = chunk['pfExitFlag'] == 1
+                    nConverged += int(np.sum(converged))
+                    nStable += int(np.sum(converged & (chunk['maxRealValue'] < 0)))
+                continue
+            overrides = [prepare(dict(zip(variables, sample))) for sample in samples]
+            results = sweep_run(case, overrides, processes=processes, warmStart=warmStart, executor=executor)
+            chunk = {name: samples[:, j] for j, name in enumerate(variables)}
+            chunk.update({name: results[name] for name in ('maxRealValue', 'minDampingRatio', 'pfExitFlag')})
+            chunk['sample'] = np.arange(start, start + len(samples))
+            chunk['error'] = np.array([error or '' for error in results['error']], dtype=str)
+            if saveEigs:
+                chunk['eigs'] = results['eigs']
+            with open(file + '.tmp', 'wb') as f:
+                np.savez(f, **chunk)
+            os.replace(file + '.tmp', file)
+
+            converged = chunk['pfExitFlag'] == 1
+            nConverged += int(np.sum(converged))
+            nStable += int(np.sum(converged & (chunk['maxRealValue'] < 0)))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return {'nSamples': nSamples, 'stableFraction': nStable / nConverged if nConverged else np.nan}
+
+def sweep_sample_manifest(path, manifest):
+    # Writes manifest to path/manifest.json, or checks it against the one of
+    # the run being resumed there
+    file = os.path.join(path, 'manifest.json')
+    manifest = json.loads(json.dumps(manifest))
+    if os.path.exists(file):
+        with open(file, encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored != manifest:
+            changed = sorted(key for key in {**stored, **manifest} if stored.get(key) != manifest.get(key))
+            raise ValueError(f"'{path}' holds samples drawn with different {changed}; use a new path")
+        return
+    if glob.glob(os.path.join(path, 'chunk_*.npz')):
+        raise ValueError(f"'{path}' holds chunks without a manifest; use a new path")
+    os.makedirs(path, exist_ok=True)
+    with open(file + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(file + '.tmp', file)
+
+def sweep_sample_load(path, columns=None):
+    # Concatenated columns of every chunk written by sweep_sample
+    values = {}
+    for file in sorted(glob.glob(os.path.join(path, 'chunk_*.npz'))):
+        with np.load(file) as chunk:
+            for name in columns or chunk.files:
+                values.setdefault(name, []).append(chunk[name])
+    return {name: np.concatenate(parts) for name, parts in values.items()}